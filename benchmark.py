@@ -0,0 +1,372 @@
+from game.board import Board
+from game.bitboard import BitBoard
+from game.enums import Color
+from players.endgame_solver import EndgameSolver
+from players.evaluation_cache import EvaluationCache
+from players.mcts_player import MCTSPlayer
+from players.minimax_optimized_player import OptimizedMiniMaxPlayer
+from players.probcut import ProbCut
+from players.rollout import RolloutEngine
+from tests.positions import random_positions
+
+import copy
+import multiprocessing
+import os
+import random
+from typing import Dict, List, Tuple, Type
+from time import perf_counter
+
+class Benchmark:
+
+    @staticmethod
+    def random_positions(count: int = 8, moves: Tuple[int, int] = (10, 30), seed: int = 0,
+                         board_type: Type[Board] = BitBoard) -> List[Tuple[Board, Color]]:
+        """
+        Build reproducible midgame positions by playing random moves from the start.
+
+        The positions are the ones the tests use for the same arguments (see `tests.positions`).
+
+        Args:
+            count (int, optional): The number of positions (default is 8).
+            moves (Tuple[int, int], optional): The range of random moves played per position (default is 10 to 30).
+            seed (int, optional): The random seed (default is 0).
+            board_type (Type[Board], optional): The board engine to build (default is BitBoard).
+
+        Returns:
+            List[Tuple[Board, Color]]: The positions and the color to move in each.
+        """
+        return random_positions(count, moves, seed, board_type)
+
+    @staticmethod
+    def compare_search_nodes(configurations: Dict[str, dict], depth: int = 6, positions: List[Tuple[Board, Color]] = None,
+                             show: bool = True) -> Dict[str, Tuple[int, float]]:
+        """
+        Search the same positions to the same depth with several player configurations.
+
+        Args:
+            configurations (Dict[str, dict]): Keyword arguments for `OptimizedMiniMaxPlayer`, by name.
+            depth (int, optional): The search depth (default is 6).
+            positions (List[Tuple[Board, Color]], optional): The positions to search (default is `random_positions()`).
+            show (bool, optional): Whether to print a results table, with the summed transposition table probes, hits
+                and stores of the configurations that use one (default is True).
+
+        Returns:
+            Dict[str, Tuple[int, float]]: The total nodes and seconds for each configuration.
+        """
+        positions = positions if positions is not None else Benchmark.random_positions()
+        results = {}
+        table_stats = {}
+
+        for name, kwargs in configurations.items():
+            nodes = 0
+            start = perf_counter()
+            for board, color in positions:
+                # A fresh player per position so transposition tables start empty
+                player = OptimizedMiniMaxPlayer(color, max_depth=depth, **kwargs)
+                player.play(board)
+                nodes += player.nodes
+                if player.transposition_table is not None:
+                    totals = table_stats.setdefault(name, {'probes': 0, 'hits': 0, 'stores': 0})
+                    for counter, value in player.transposition_table.stats().items():
+                        if counter in totals:
+                            totals[counter] += value
+            results[name] = (nodes, perf_counter() - start)
+
+        if show:
+            Benchmark.print_results(f'Nodes searched at depth {depth} over {len(positions)} positions:', results)
+            for name, totals in table_stats.items():
+                hit_rate = totals['hits'] / totals['probes'] if totals['probes'] else 0.0
+                print(f'\t{name:<24}TT probes {totals["probes"]}, hits {totals["hits"]} ({hit_rate:.1%}), stores {totals["stores"]}')
+
+        return results
+
+    @staticmethod
+    def compare_depth_reached(configurations: Dict[str, dict], time_limit: float = 2.0, positions: List[Tuple[Board, Color]] = None,
+                              show: bool = True) -> Dict[str, Tuple[float, int]]:
+        """
+        Search the same positions for the same time with several player configurations.
+
+        Args:
+            configurations (Dict[str, dict]): Keyword arguments for `OptimizedMiniMaxPlayer`, by name.
+            time_limit (float, optional): Seconds per position (default is 2).
+            positions (List[Tuple[Board, Color]], optional): The positions to search (default is `random_positions()`).
+            show (bool, optional): Whether to print a results table (default is True).
+
+        Returns:
+            Dict[str, Tuple[float, int]]: The average depth completed and the total nodes for each configuration.
+        """
+        positions = positions if positions is not None else Benchmark.random_positions()
+        results = {}
+
+        for name, kwargs in configurations.items():
+            depths, nodes = 0, 0
+            for board, color in positions:
+                player = OptimizedMiniMaxPlayer(color, time_limit=time_limit, **kwargs)
+                player.play(board)
+                depths += player.completed_depth
+                nodes += player.nodes
+            results[name] = (depths / len(positions), nodes)
+
+        if show:
+            title = f'Depth reached in {time_limit} secs over {len(positions)} positions:'
+            print('-'*len(title) + f'\n{title}')
+            baseline = next(iter(results.values()))[0]
+            for name, (depth, nodes) in results.items():
+                print(f'\t{name:<24}{depth:>6.2f} plies ({depth - baseline:+.2f}), {nodes} nodes')
+
+        return results
+
+    @staticmethod
+    def compare_endgame(empties: int = 12, count: int = 4, seed: int = 0, show: bool = True) -> Dict[str, Tuple[int, float]]:
+        """
+        Solve endgame positions exactly and for win/loss/draw only.
+
+        Args:
+            empties (int, optional): The number of empty squares in each position (default is 12).
+            count (int, optional): The number of positions (default is 4).
+            seed (int, optional): The random seed (default is 0).
+            show (bool, optional): Whether to print a results table (default is True).
+
+        Returns:
+            Dict[str, Tuple[int, float]]: The total nodes and seconds for each mode.
+        """
+        moves = Board.SIZE * Board.SIZE - 4 - empties
+        positions = [(board, color) for board, color in Benchmark.random_positions(count * 4, (moves, moves), seed)
+                     if board.get_points_for_color(Color.EMPTY) == empties][:count]
+        results = {}
+
+        for name, win_loss_draw in (('exact', False), ('win/loss/draw', True)):
+            nodes = 0
+            start = perf_counter()
+            for board, color in positions:
+                solver = EndgameSolver(win_loss_draw)
+                solver.solve(board, color)
+                nodes += solver.nodes
+            results[name] = (nodes, perf_counter() - start)
+
+        if show:
+            Benchmark.print_results(f'Endgame nodes with {empties} empties over {len(positions)} positions:', results)
+
+        return results
+
+    @staticmethod
+    def compare_parallel(workers: Tuple[int, ...] = (1, 2, 4, 8, 16), depth: int = 6, positions: List[Tuple[Board, Color]] = None,
+                         show: bool = True, **kwargs) -> Dict[int, float]:
+        """
+        Time the parallel root search of `OptimizedMiniMaxPlayer` with different numbers of workers.
+
+        Args:
+            workers (Tuple[int, ...], optional): The worker counts to time (default is 1 to 16).
+            depth (int, optional): The search depth (default is 6).
+            positions (List[Tuple[Board, Color]], optional): The positions to search (default is `random_positions()`).
+            show (bool, optional): Whether to print the speedup curve (default is True).
+            **kwargs: Further keyword arguments for `OptimizedMiniMaxPlayer`.
+
+        Returns:
+            Dict[int, float]: The total seconds for each worker count.
+
+        Raises:
+            AssertionError: If a worker count picks a different move than the others.
+        """
+        positions = positions if positions is not None else Benchmark.random_positions()
+        results = {}
+        best_moves = None
+
+        for count in workers:
+            players = {color: OptimizedMiniMaxPlayer(color, max_depth=depth, workers=count, **kwargs) for color in Color if color != Color.EMPTY}
+            try:
+                # Start the worker processes before timing
+                for board, color in positions[:1]:
+                    players[color].parallel_search(board, 1)
+
+                moves = []
+                start = perf_counter()
+                for board, color in positions:
+                    moves.append(players[color].parallel_search(board, depth)[0])
+                results[count] = perf_counter() - start
+            finally:
+                for player in players.values():
+                    player.close()
+
+            assert best_moves is None or moves == best_moves, f'{count} workers picked different moves'
+            best_moves = moves
+
+        if show:
+            title = f'Parallel search at depth {depth} over {len(positions)} positions ({multiprocessing.cpu_count()} cores):'
+            print('-'*len(title) + f'\n{title}')
+            baseline = next(iter(results.values()))
+            for count, seconds in results.items():
+                print(f'\t{count:>2} workers{seconds:>10.2f} secs ({baseline / seconds:.2f}x)')
+
+        return results
+
+    @staticmethod
+    def board_playout(board: Board, color: Color) -> int:
+        """
+        Play a random game out on a copy of a board, as `MCTSPlayer` did before the rollout engine.
+
+        Args:
+            board (Board): The position to play out from.
+            color (Color): The color to move.
+
+        Returns:
+            int: The final disc difference, black minus white.
+        """
+        board = copy.deepcopy(board)
+        while not board.is_game_over():
+            legal_moves = board.get_legal_moves(color)
+            if legal_moves:
+                board.place_and_flip_discs(random.choice(legal_moves), color)
+            color = Color.BLACK if color == Color.WHITE else Color.WHITE
+        black, white = board.get_bitboards()
+        return black.bit_count() - white.bit_count()
+
+    @staticmethod
+    def compare_playouts(playouts: int = 200, positions: List[Tuple[Board, Color]] = None, show: bool = True) -> Dict[str, float]:
+        """
+        Measure the random playouts per second of the board-based playout and the rollout engine.
+
+        Args:
+            playouts (int, optional): The playouts per position (default is 200).
+            positions (List[Tuple[Board, Color]], optional): The positions to play out from (default is `random_positions()`
+                on `Board`, which the original playouts used).
+            show (bool, optional): Whether to print the rates (default is True).
+
+        Returns:
+            Dict[str, float]: The playouts per second of each implementation.
+        """
+        positions = positions if positions is not None else Benchmark.random_positions(board_type=Board)
+        engine = RolloutEngine(0)
+        implementations = {
+            'Board copy': Benchmark.board_playout,
+            'RolloutEngine': lambda board, color: engine.play(*board.get_bitboards(), color),
+        }
+        results = {}
+
+        for name, playout in implementations.items():
+            start = perf_counter()
+            for board, color in positions:
+                for _ in range(playouts):
+                    playout(board, color)
+            results[name] = playouts * len(positions) / (perf_counter() - start)
+
+        if show:
+            title = f'Random playouts from {len(positions)} positions:'
+            print('-'*len(title) + f'\n{title}')
+            baseline = next(iter(results.values()))
+            for name, rate in results.items():
+                print(f'\t{name:<24}{rate:>10.0f} playouts/sec ({rate / baseline:.2f}x)')
+
+        return results
+
+    @staticmethod
+    def compare_mcts_parallel(workers: Tuple[int, ...] = (1, 2, 4, 8), iterations: int = 500,
+                              positions: List[Tuple[Board, Color]] = None, show: bool = True) -> Dict[int, float]:
+        """
+        Measure the iterations per second of root-parallel MCTS with different numbers of workers.
+
+        Every worker runs `iterations` iterations per move, so the total work grows with the worker count.
+
+        Args:
+            workers (Tuple[int, ...], optional): The worker counts to time (default is 1 to 8).
+            iterations (int, optional): The iterations per worker and move (default is 500).
+            positions (List[Tuple[Board, Color]], optional): The positions to search (default is `random_positions()`).
+            show (bool, optional): Whether to print the scaling curve (default is True).
+
+        Returns:
+            Dict[int, float]: The iterations per second for each worker count.
+        """
+        positions = positions if positions is not None else Benchmark.random_positions()
+        results = {}
+
+        for count in workers:
+            players = {color: MCTSPlayer(color, iterations, seed=0, reuse_tree=False, workers=count) for color in Color if color != Color.EMPTY}
+            try:
+                # Start the worker processes before timing
+                for board, color in positions[:1]:
+                    players[color].play(board)
+
+                start = perf_counter()
+                for board, color in positions:
+                    players[color].play(board)
+                results[count] = count * iterations * len(positions) / (perf_counter() - start)
+            finally:
+                for player in players.values():
+                    player.close()
+
+        if show:
+            title = f'Root-parallel MCTS, {iterations} iterations per worker over {len(positions)} positions ({multiprocessing.cpu_count()} cores):'
+            print('-'*len(title) + f'\n{title}')
+            baseline = next(iter(results.values()))
+            for count, rate in results.items():
+                print(f'\t{count:>2} workers{rate:>10.0f} iterations/sec ({rate / baseline:.2f}x)')
+
+        return results
+
+    @staticmethod
+    def print_results(title: str, results: Dict[str, Tuple[int, float]]):
+        baseline = next(iter(results.values()))[0]
+        print('-'*len(title) + f'\n{title}')
+        for name, (count, seconds) in results.items():
+            print(f'\t{name:<24}{count:>10} ({count / baseline:.2f}x) in {seconds:.2f} secs')
+
+if __name__ == "__main__":
+    print("=== Othello Search Benchmarks ===\n")
+
+    print("1. Alpha-beta vs principal variation search:")
+    Benchmark.compare_search_nodes({
+        'alpha-beta': {},
+        'alpha-beta + TT': {'transposition_table_mb': 16},
+        'PVS + TT + aspiration': {'transposition_table_mb': 16, 'pvs': True},
+    }, depth=6)
+
+    print("\n2. Static vs killer/history move ordering:")
+    Benchmark.compare_search_nodes({
+        'alpha-beta + TT': {'transposition_table_mb': 16},
+        'alpha-beta + TT + ordering': {'transposition_table_mb': 16, 'dynamic_ordering': True},
+        'PVS + TT': {'transposition_table_mb': 16, 'pvs': True},
+        'PVS + TT + ordering': {'transposition_table_mb': 16, 'pvs': True, 'dynamic_ordering': True},
+    }, depth=6)
+
+    print("\n3. Exact vs win/loss/draw endgame solving:")
+    Benchmark.compare_endgame(empties=12)
+
+    print("\n4. Parallel root search speedup:")
+    Benchmark.compare_parallel(depth=5, pvs=True)
+
+    print("\n5. Shared evaluation cache:")
+    EvaluationCache.shared().clear()
+    Benchmark.compare_search_nodes({
+        'PVS + TT': {'transposition_table_mb': 16, 'pvs': True},
+        'PVS + TT + eval cache': {'transposition_table_mb': 16, 'pvs': True, 'evaluation_cache': True},
+    }, depth=6)
+    print(f'\t{EvaluationCache.shared()}')
+
+    print("\n6. ProbCut forward pruning:")
+    if os.path.exists('probcut.json'):
+        probcut = ProbCut.load('probcut.json')
+    else:
+        probcut = ProbCut.calibrate(show=True)
+        probcut.save('probcut.json')
+    search = {'transposition_table_mb': 16, 'pvs': True, 'dynamic_ordering': True}
+    Benchmark.compare_depth_reached({
+        'PVS + TT + ordering': search,
+        **{f'ProbCut ({threshold} sigma)': {**search, 'probcut': ProbCut([cut for cuts in probcut.cuts.values() for cut in cuts], threshold)}
+           for threshold in (1.5, 1.0, 0.5)},
+    }, time_limit=2.0)
+
+    print("\n7. Late move reductions:")
+    Benchmark.compare_search_nodes({
+        'PVS + TT + ordering': search,
+        'PVS + TT + ordering + LMR': {**search, 'late_move_reductions': True},
+    }, depth=7)
+    Benchmark.compare_depth_reached({
+        'PVS + TT + ordering': search,
+        'PVS + TT + ordering + LMR': {**search, 'late_move_reductions': True},
+    }, time_limit=2.0)
+
+    print("\n8. MCTS playout speed:")
+    Benchmark.compare_playouts()
+
+    print("\n9. Root-parallel MCTS scaling:")
+    Benchmark.compare_mcts_parallel()
@@ -0,0 +1,218 @@
+"""
+Vectorized versions of the `Board` heuristics that score many positions in one call.
+
+Positions are given either as an `(N, 8, 8)` int8 array indexed `[n, y, x]` like `Board.grid`
+(`BLACK` for black discs, `WHITE` for white discs, `EMPTY` for empty squares) or as an `(N, 2)`
+uint64 array of packed (black, white) bitboards as returned by `Board.get_bitboards`.
+"""
+
+from game.board import DIRECTIONS, Board, square_index
+from game.enums import Color
+
+import numpy as np
+from typing import Dict, List, Sequence, Tuple
+
+EMPTY: int = 0
+BLACK: int = 1
+WHITE: int = -1
+
+CORNERS: List[Tuple[int, int]] = [(0, 0), (0, 7), (7, 0), (7, 7)]
+
+# Bit `square_index(x, y)` of a packed bitboard, for every [y, x]
+_BIT_INDICES: np.ndarray = np.array([[square_index(x, y) for x in range(Board.SIZE)] for y in range(Board.SIZE)])
+
+
+def _wall(dx: int, dy: int) -> np.ndarray:
+    # Squares whose neighbour in direction (dx, dy) is off the board
+    wall = np.zeros((Board.SIZE, Board.SIZE), dtype=bool)
+    for y in range(Board.SIZE):
+        for x in range(Board.SIZE):
+            wall[y, x] = not (0 <= x + dx < Board.SIZE and 0 <= y + dy < Board.SIZE)
+    return wall
+
+
+_WALLS: List[np.ndarray] = [_wall(dx, dy) for dx, dy in DIRECTIONS]
+
+
+def pack_bitboards(bitboards: Sequence[Tuple[int, int]]) -> np.ndarray:
+    """
+    Pack (black, white) bitboard pairs into an `(N, 2)` uint64 array.
+    """
+    return np.array(bitboards, dtype=np.uint64).reshape(-1, 2)
+
+
+def pack_boards(boards: Sequence[Board]) -> np.ndarray:
+    """
+    Pack boards into an `(N, 2)` uint64 array of (black, white) bitboards.
+    """
+    return pack_bitboards([board.get_bitboards() for board in boards])
+
+
+def unpack_bitboards(bitboards: np.ndarray) -> np.ndarray:
+    """
+    Convert an `(N, 2)` uint64 array of (black, white) bitboards into an `(N, 8, 8)` int8 array.
+    """
+    bitboards = np.asarray(bitboards, dtype=np.uint64).reshape(-1, 2)
+    bits = np.unpackbits(bitboards.astype('<u8').view(np.uint8).reshape(-1, 2, 8), axis=2, bitorder='little')
+    squares = bits[:, :, _BIT_INDICES]
+    return (squares[:, 0].astype(np.int8) * BLACK) + (squares[:, 1].astype(np.int8) * WHITE)
+
+
+def boards_to_array(boards: Sequence[Board]) -> np.ndarray:
+    """
+    Convert boards into an `(N, 8, 8)` int8 array.
+    """
+    return unpack_bitboards(pack_boards(boards))
+
+
+def _shift(discs: np.ndarray, dx: int, dy: int) -> np.ndarray:
+    # Move every disc one step in direction (dx, dy); discs pushed off the board are dropped
+    shifted = np.zeros_like(discs)
+    dst_y, src_y = slice(max(dy, 0), Board.SIZE + min(dy, 0)), slice(max(-dy, 0), Board.SIZE + min(-dy, 0))
+    dst_x, src_x = slice(max(dx, 0), Board.SIZE + min(dx, 0)), slice(max(-dx, 0), Board.SIZE + min(-dx, 0))
+    shifted[:, dst_y, dst_x] = discs[:, src_y, src_x]
+    return shifted
+
+
+def legal_moves(own: np.ndarray, opp: np.ndarray) -> np.ndarray:
+    """
+    Compute the legal moves of `own` against `opp` for every position.
+
+    Args:
+        own (np.ndarray): `(N, 8, 8)` bool array of the discs of the player to move.
+        opp (np.ndarray): `(N, 8, 8)` bool array of the opponent's discs.
+
+    Returns:
+        np.ndarray: `(N, 8, 8)` bool array of legal moves.
+    """
+    empty = ~(own | opp)
+    moves = np.zeros_like(own)
+
+    for dx, dy in DIRECTIONS:
+        line = _shift(own, dx, dy) & opp
+        for _ in range(Board.SIZE - 3):
+            line |= _shift(line, dx, dy) & opp
+        moves |= _shift(line, dx, dy) & empty
+
+    return moves
+
+
+def stable_discs(own: np.ndarray, opp: np.ndarray) -> np.ndarray:
+    """
+    Compute the discs of `own` that `Board.is_stable_piece` considers stable, for every position.
+    """
+    occupied = own | opp
+    full_lines = []
+
+    for (dx, dy), wall in zip(DIRECTIONS, _WALLS):
+        # A square's ray is full if it is occupied and its neighbour's ray is full (or it is at the wall)
+        full = occupied & wall
+        for _ in range(Board.SIZE - 1):
+            full |= occupied & _shift(full, -dx, -dy)
+        full_lines.append(full)
+
+    # Directions i and i + 4 point opposite ways along the same axis. On each axis, a disc is
+    # anchored by a full line or the wall, or by a stable disc of its own color next to it
+    anchors = [full_lines[i] & full_lines[i + 4] | _WALLS[i] | _WALLS[i + 4] for i in range(4)]
+    stable = np.zeros_like(own)
+    while True:
+        grown = own.copy()
+        for i, (dx, dy) in enumerate(DIRECTIONS[:4]):
+            grown &= anchors[i] | _shift(stable, dx, dy) | _shift(stable, -dx, -dy)
+        if np.array_equal(grown, stable):
+            return stable
+        stable = grown
+
+
+def batch_heuristics(positions: np.ndarray, color: Color, heuristic_names: List[str],
+                     threshold: float = 0.7) -> Dict[str, np.ndarray]:
+    """
+    Evaluate several heuristics for many positions at once.
+
+    Args:
+        positions (np.ndarray): `(N, 8, 8)` int8 positions or `(N, 2)` uint64 packed bitboards.
+        color (Color): The color for which the heuristics are calculated.
+        heuristic_names (List[str]): Names of `Board` heuristics, e.g. 'square_heuristic'.
+        threshold (float, optional): The `points_heuristic` threshold. Defaults to 0.7.
+
+    Returns:
+        Dict[str, np.ndarray]: The `(N,)` int array of values for each heuristic name.
+
+    Raises:
+        ValueError: If a heuristic has no vectorized implementation.
+    """
+    positions = np.asarray(positions)
+    if positions.ndim == 2:
+        positions = unpack_bitboards(positions)
+
+    own_value, opp_value = (BLACK, WHITE) if color == Color.BLACK else (WHITE, BLACK)
+    own = positions == own_value
+    opp = positions == opp_value
+    relative = own.astype(np.int32) - opp.astype(np.int32)
+
+    values = {}
+    for name in heuristic_names:
+        if name == 'square_heuristic':
+            values[name] = _square_heuristic(relative)
+        elif name == 'mobility_heuristic':
+            values[name] = _count(legal_moves(own, opp)) - _count(legal_moves(opp, own))
+        elif name == 'points_heuristic':
+            own_points, opp_points = _count(own), _count(opp)
+            maximize = (own_points + opp_points) > threshold * Board.SIZE * Board.SIZE
+            values[name] = np.where(maximize, own_points - opp_points, opp_points - own_points)
+        elif name == 'stability_heuristic':
+            values[name] = 3 * _count(stable_discs(own, opp))
+        elif name == 'winner_heuristic':
+            game_over = ~legal_moves(own, opp).any(axis=(1, 2)) & ~legal_moves(opp, own).any(axis=(1, 2))
+            values[name] = np.where(game_over, 100 * np.sign(relative.sum(axis=(1, 2))), 0)
+        else:
+            raise ValueError(f'No batch implementation for heuristic {name!r}.')
+
+    return values
+
+
+def batch_evaluate(positions: np.ndarray, color: Color, heuristic_names: List[str]) -> np.ndarray:
+    """
+    Sum several heuristics for many positions at once; the batch counterpart of `Board.evaluate`.
+
+    Args:
+        positions (np.ndarray): `(N, 8, 8)` int8 positions or `(N, 2)` uint64 packed bitboards.
+        color (Color): The color for which the heuristics are calculated.
+        heuristic_names (List[str]): Names of `Board` heuristics, e.g. 'square_heuristic'.
+
+    Returns:
+        np.ndarray: The `(N,)` int array of summed heuristic values.
+    """
+    positions = np.asarray(positions)
+    total = np.zeros(len(positions), dtype=np.int64)
+    for value in batch_heuristics(positions, color, heuristic_names).values():
+        total += value
+    return total
+
+
+def _count(discs: np.ndarray) -> np.ndarray:
+    return discs.sum(axis=(1, 2), dtype=np.int64)
+
+
+def _square_heuristic(relative: np.ndarray) -> np.ndarray:
+    CORNER_VALUE = 12
+    C_SQUARE_VALUE = -7
+    X_SQUARE_VALUE = -3
+
+    value = np.zeros(len(relative), dtype=np.int64)
+    for cx, cy in CORNERS:
+        corner = relative[:, cy, cx]
+        orthogonal = np.zeros(len(relative), dtype=np.int64)
+        diagonal = np.zeros(len(relative), dtype=np.int64)
+
+        for dx, dy in DIRECTIONS:
+            x, y = cx + dx, cy + dy
+            if 0 <= x < Board.SIZE and 0 <= y < Board.SIZE:
+                if dx == 0 or dy == 0:
+                    orthogonal += relative[:, y, x]
+                else:
+                    diagonal += relative[:, y, x]
+
+        value += np.where(corner != 0, CORNER_VALUE * corner, X_SQUARE_VALUE * orthogonal + C_SQUARE_VALUE * diagonal)
+
+    return value
@@ -0,0 +1,409 @@
+from game.board import DIRECTIONS, Board, Grid, ZOBRIST_SIDE, ZOBRIST_SQUARES, iter_squares, square_index
+from game.enums import Color
+from game.point import Point
+from typing import Dict, List, Tuple
+
+# Squares are indexed column-major (x * 8 + y), so walking the bits of a mask from
+# least to most significant visits squares in the same order as `Board.get_legal_moves`.
+FULL: int = 0xFFFFFFFFFFFFFFFF
+NOT_Y0: int = 0xFEFEFEFEFEFEFEFE # Squares that can be reached by stepping y + 1
+NOT_Y7: int = 0x7F7F7F7F7F7F7F7F # Squares that can be reached by stepping y - 1
+
+ZOBRIST_BLACK: List[int] = ZOBRIST_SQUARES[Color.BLACK.value]
+ZOBRIST_WHITE: List[int] = ZOBRIST_SQUARES[Color.WHITE.value]
+# Turning a disc over swaps its key for the other color's key on the same square
+ZOBRIST_FLIP: List[int] = [black ^ white for black, white in zip(ZOBRIST_BLACK, ZOBRIST_WHITE)]
+
+
+def _direction_mask(dy: int) -> int:
+    return NOT_Y0 if dy == 1 else NOT_Y7 if dy == -1 else FULL
+
+
+def _wall_mask(dx: int, dy: int) -> int:
+    # Squares whose neighbour in direction (dx, dy) is off the board
+    mask = 0
+    for x in range(Board.SIZE):
+        for y in range(Board.SIZE):
+            if not (0 <= x + dx < Board.SIZE and 0 <= y + dy < Board.SIZE):
+                mask |= 1 << square_index(x, y)
+    return mask
+
+
+# (shift, mask) pairs: shifting a mask one step in a direction is `(bits << shift) & mask`
+# for positive shifts and `(bits >> -shift) & mask` for negative ones.
+SHIFTS: List[Tuple[int, int]] = [(dx * Board.SIZE + dy, _direction_mask(dy)) for dx, dy in DIRECTIONS]
+WALLS: List[int] = [_wall_mask(dx, dy) for dx, dy in DIRECTIONS]
+
+CORNERS: List[Tuple[int, int, int]] = [] # (corner bit, orthogonal neighbours, diagonal neighbour)
+for cx, cy in [(0, 0), (0, 7), (7, 0), (7, 7)]:
+    orthogonal = diagonal = 0
+    for dx, dy in DIRECTIONS:
+        nx, ny = cx + dx, cy + dy
+        if 0 <= nx < Board.SIZE and 0 <= ny < Board.SIZE:
+            if dx == 0 or dy == 0:
+                orthogonal |= 1 << square_index(nx, ny)
+            else:
+                diagonal |= 1 << square_index(nx, ny)
+    CORNERS.append((1 << square_index(cx, cy), orthogonal, diagonal))
+
+
+def legal_moves_mask(own: int, opp: int) -> int:
+    """
+    Compute every legal move for `own` against `opp` with shift-and-mask flood fills.
+
+    Args:
+        own (int): The discs of the player to move.
+        opp (int): The discs of the opponent.
+
+    Returns:
+        int: A mask with one bit set per legal move.
+    """
+    empty = ~(own | opp) & FULL
+    moves = 0
+
+    for shift, mask in SHIFTS:
+        opp_mask = opp & mask
+        if shift > 0:
+            x = (own << shift) & opp_mask
+            x |= (x << shift) & opp_mask
+            x |= (x << shift) & opp_mask
+            x |= (x << shift) & opp_mask
+            x |= (x << shift) & opp_mask
+            x |= (x << shift) & opp_mask
+            moves |= (x << shift) & mask & empty
+        else:
+            shift = -shift
+            x = (own >> shift) & opp_mask
+            x |= (x >> shift) & opp_mask
+            x |= (x >> shift) & opp_mask
+            x |= (x >> shift) & opp_mask
+            x |= (x >> shift) & opp_mask
+            x |= (x >> shift) & opp_mask
+            moves |= (x >> shift) & mask & empty
+
+    return moves
+
+
+def flips_by_direction(move: int, own: int, opp: int) -> List[int]:
+    """
+    Compute the discs flipped by placing `move`, one mask per direction in `DIRECTIONS` order.
+
+    Args:
+        move (int): A mask with the single bit of the placed disc.
+        own (int): The discs of the player to move.
+        opp (int): The discs of the opponent.
+
+    Returns:
+        List[int]: The flipped discs along each direction (0 where nothing flips).
+    """
+    paths = []
+    for shift, mask in SHIFTS:
+        flipped = 0
+        if shift > 0:
+            x = (move << shift) & mask
+            while x & opp:
+                flipped |= x
+                x = (x << shift) & mask
+        else:
+            x = (move >> -shift) & mask
+            while x & opp:
+                flipped |= x
+                x = (x >> -shift) & mask
+        paths.append(flipped if x & own else 0)
+    return paths
+
+
+def flips_mask(move: int, own: int, opp: int) -> int:
+    """
+    Compute every disc flipped by placing `move`.
+
+    Returns:
+        int: The flipped discs, or 0 if the move is not legal.
+    """
+    flips = 0
+    for shift, mask in SHIFTS:
+        flipped = 0
+        if shift > 0:
+            x = (move << shift) & mask
+            while x & opp:
+                flipped |= x
+                x = (x << shift) & mask
+        else:
+            x = (move >> -shift) & mask
+            while x & opp:
+                flipped |= x
+                x = (x >> -shift) & mask
+        if x & own:
+            flips |= flipped
+    return flips
+
+
+def full_lines(occupied: int) -> List[int]:
+    """
+    For each direction, compute the occupied squares whose ray to the wall contains no empty square.
+
+    Args:
+        occupied (int): The mask of all discs on the board.
+
+    Returns:
+        List[int]: One mask per direction in `DIRECTIONS` order.
+    """
+    lines = []
+    for (shift, _), wall, (dx, dy) in zip(SHIFTS, WALLS, DIRECTIONS):
+        # Step backwards along the ray so each square inherits fullness from its neighbour
+        back_mask = _direction_mask(-dy)
+        full = occupied & wall
+        for _ in range(Board.SIZE - 1):
+            if shift > 0:
+                full |= occupied & (full >> shift) & back_mask
+            else:
+                full |= occupied & (full << -shift) & back_mask
+        lines.append(full & FULL)
+    return lines
+
+
+def stable_mask(own: int, opp: int) -> int:
+    """
+    Compute the discs of `own` that `Board.is_stable_piece` considers stable.
+
+    A disc is stable when, along each of the four axes, the whole line through it is full
+    or one of its two neighbours is the wall or a stable disc of its own color. Stability
+    grows from the walls and corners until no more discs become stable.
+    """
+    lines = full_lines(own | opp)
+    # Directions i and i + 4 in `DIRECTIONS` point opposite ways along the same axis
+    anchors = [lines[i] & lines[i + 4] | WALLS[i] | WALLS[i + 4] for i in range(4)]
+
+    stable = 0
+    while True:
+        grown = own
+        for i in range(4):
+            neighbours = 0
+            for shift, mask in (SHIFTS[i], SHIFTS[i + 4]):
+                # Squares next to a stable disc are one step from it in the opposite direction
+                neighbours |= (stable << shift if shift > 0 else stable >> -shift) & mask
+            grown &= anchors[i] | neighbours
+        if grown == stable:
+            return stable
+        stable = grown
+
+
+class BitBoard(Board):
+    """
+    A Board that stores the position as two 64-bit integers, one per color.
+
+    Move generation, flipping, counting and the heuristics are computed with shift-and-mask
+    operations instead of walking the grid. The public API matches `Board`; `grid` is built
+    on demand and writes to it (`board.grid[y][x] = value`) are routed back to the bitboards.
+    """
+
+    def __init__(self, scale: int = 1):
+        self.black: int = 0
+        self.white: int = 0
+        self.legal_masks_cache: Dict[Color, int] = {}
+        super().__init__(scale)
+
+    @property
+    def grid(self) -> List[List[str]]:
+        black, white = self.black, self.white
+        rows = []
+        for y in range(Board.SIZE):
+            row = []
+            for x in range(Board.SIZE):
+                bit = 1 << square_index(x, y)
+                row.append(Color.BLACK.value if black & bit else Color.WHITE.value if white & bit else Color.EMPTY.value)
+            rows.append(row)
+        return Grid(self, rows)
+
+    @grid.setter
+    def grid(self, rows: List[List[str]]):
+        self.black = self.white = 0
+        self.zobrist_key = ZOBRIST_SIDE if self.side_to_move == Color.WHITE else 0
+        self.undo_stack = []
+        for y, row in enumerate(rows):
+            for x, value in enumerate(row):
+                self.set_square(x, y, value)
+        self.invalidate_cache()
+
+    def set_square(self, x: int, y: int, value: str):
+        square = square_index(x, y)
+        bit = 1 << square
+        if self.black & bit:
+            self.zobrist_key ^= ZOBRIST_BLACK[square]
+        elif self.white & bit:
+            self.zobrist_key ^= ZOBRIST_WHITE[square]
+
+        self.black &= ~bit
+        self.white &= ~bit
+        if value == Color.BLACK.value:
+            self.black |= bit
+            self.zobrist_key ^= ZOBRIST_BLACK[square]
+        elif value == Color.WHITE.value:
+            self.white |= bit
+            self.zobrist_key ^= ZOBRIST_WHITE[square]
+        self.invalidate_cache()
+
+    def _update_key(self, move: int, flips: int, color: Color):
+        # Toggle the placed disc and every flipped disc: O(flipped discs)
+        key = self.zobrist_key
+        square = move.bit_length() - 1
+        key ^= ZOBRIST_BLACK[square] if color == Color.BLACK else ZOBRIST_WHITE[square]
+        for square in iter_squares(flips):
+            key ^= ZOBRIST_FLIP[square]
+        self.zobrist_key = key
+
+    def invalidate_cache(self):
+        super().invalidate_cache()
+        self.legal_masks_cache.clear()
+
+    def get_bitboards(self) -> Tuple[int, int]:
+        return self.black, self.white
+
+    def get_discs(self, color: Color) -> Tuple[int, int]:
+        """
+        Get the bitboards for a color and its opponent.
+
+        Returns:
+            Tuple[int, int]: The (own, opponent) disc masks.
+        """
+        return (self.black, self.white) if color == Color.BLACK else (self.white, self.black)
+
+    def get_legal_moves_mask(self, color: Color) -> int:
+        """
+        Get the legal moves for a color as a bitmask, generating them only on a cache miss.
+        """
+        moves = self.legal_masks_cache.get(color)
+        if moves is None:
+            own, opp = self.get_discs(color)
+            moves = self.legal_masks_cache[color] = legal_moves_mask(own, opp)
+        return moves
+
+    def is_game_over(self) -> bool:
+        return not self.get_legal_moves_mask(Color.BLACK) and not self.get_legal_moves_mask(Color.WHITE)
+
+    def generate_stable_discs(self) -> Tuple[int, int]:
+        return stable_mask(self.black, self.white), stable_mask(self.white, self.black)
+
+    def generate_legal_moves(self, color: Color) -> List[Point]:
+        return [Point.from_square(square) for square in iter_squares(self.get_legal_moves_mask(color))]
+
+    def is_legal_move(self, point: Point, color: Color) -> bool:
+        move = 1 << square_index(point.x, point.y)
+        own, opp = self.get_discs(color)
+        if (own | opp) & move:
+            return False
+        return flips_mask(move, own, opp) != 0
+
+    def place_and_flip_discs(self, point: Point, color: Color, perform_flip: bool = True) -> List[List[Point]]:
+        move = 1 << square_index(point.x, point.y)
+        own, opp = self.get_discs(color)
+        if (own | opp) & move:
+            return []
+
+        paths = flips_by_direction(move, own, opp)
+        flipped_discs = []
+        for (shift, _), flipped in zip(SHIFTS, paths):
+            if flipped:
+                # Order each path outwards from the placed disc, like `Board` does
+                squares = list(iter_squares(flipped))
+                if shift < 0:
+                    squares.reverse()
+                flipped_discs.append([Point.from_square(square) for square in squares])
+
+        if flipped_discs and perform_flip:
+            flips = 0
+            for flipped in paths:
+                flips |= flipped
+            self._apply(move, flips, color)
+
+        return flipped_discs
+
+    def _apply(self, move: int, flips: int, color: Color):
+        if color == Color.BLACK:
+            self.black |= move | flips
+            self.white &= ~flips
+        else:
+            self.white |= move | flips
+            self.black &= ~flips
+        self._update_key(move, flips, color)
+        self.push_undo(move.bit_length() - 1, flips, color)
+        self.side_to_move = Color.WHITE if color == Color.BLACK else Color.BLACK
+        self.invalidate_cache()
+
+    def get_points_for_color(self, color: Color) -> int:
+        if color == Color.BLACK:
+            return self.black.bit_count()
+        if color == Color.WHITE:
+            return self.white.bit_count()
+        if color == Color.EMPTY:
+            return Board.SIZE * Board.SIZE - (self.black | self.white).bit_count()
+        return 0
+
+    def mobility_heuristic(self, color: Color) -> int:
+        opponent_color = Color.BLACK if color == Color.WHITE else Color.WHITE
+        return self.get_legal_moves_mask(color).bit_count() - self.get_legal_moves_mask(opponent_color).bit_count()
+
+    def square_heuristic(self, color: Color) -> int:
+        CORNER_VALUE = 12
+        C_SQUARE_VALUE = -7
+        X_SQUARE_VALUE = -3
+
+        own, opp = self.get_discs(color)
+        heuristic_value = 0
+
+        for corner, orthogonal, diagonal in CORNERS:
+            if own & corner:
+                heuristic_value += CORNER_VALUE
+            elif opp & corner:
+                heuristic_value -= CORNER_VALUE
+            else:
+                heuristic_value += X_SQUARE_VALUE * ((own & orthogonal).bit_count() - (opp & orthogonal).bit_count())
+                heuristic_value += C_SQUARE_VALUE * ((own & diagonal).bit_count() - (opp & diagonal).bit_count())
+
+        return heuristic_value
+
+    def make_move(self, point: Point, color: Color) -> int:
+        """
+        Make a move and return the flipped discs for easy undo.
+
+        Args:
+            point (Point): The move to make.
+            color (Color): The color making the move.
+
+        Returns:
+            int: The flipped discs as a bitmask (0 if the move was not legal).
+        """
+        move = 1 << square_index(point.x, point.y)
+        own, opp = self.get_discs(color)
+        if (own | opp) & move:
+            return 0
+
+        flips = flips_mask(move, own, opp)
+        if flips:
+            self._apply(move, flips, color)
+        return flips
+
+    def revert_move(self, square: int, flips: int, color: Color):
+        move = 1 << square
+        if (self.black | self.white) & move:
+            self._update_key(move, flips, color)
+        self.black &= ~move
+        self.white &= ~move
+
+        if color == Color.BLACK:
+            self.black &= ~flips
+            self.white |= flips
+        else:
+            self.white &= ~flips
+            self.black |= flips
+        self.side_to_move = color
+        self.invalidate_cache()
+
+    def __deepcopy__(self, memo: dict) -> 'BitBoard':
+        board = type(self).__new__(type(self))
+        memo[id(self)] = board
+        board.__dict__.update(self.__dict__)
+        board.legal_moves_cache = dict(self.legal_moves_cache)
+        board.legal_masks_cache = dict(self.legal_masks_cache)
+        board.undo_stack = list(self.undo_stack)
+        return board
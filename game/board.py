@@ -1,12 +1,181 @@
 from game.point import Point
 from game.enums import Color
-from typing import List
+from typing import Callable, Dict, Iterator, List, Tuple, Union
 from math import ceil
+import random
+
+SQUARES: int = 64
+
+
+def square_index(x: int, y: int) -> int:
+    """
+    Get the index (0-63) of a square. Squares are numbered column by column, so ascending
+    indices follow the same order as `Board.get_legal_moves`.
+    """
+    return x * 8 + y
+
+
+# Zobrist keys per cell value and square index, plus one that is mixed in while white is to move.
+# The generator is seeded so keys are identical across runs and processes.
+_zobrist_random = random.Random(0x5EED_07E1)
+ZOBRIST_SQUARES: Dict[str, List[int]] = {
+    Color.EMPTY.value: [0] * SQUARES,
+    Color.BLACK.value: [_zobrist_random.getrandbits(64) for _ in range(SQUARES)],
+    Color.WHITE.value: [_zobrist_random.getrandbits(64) for _ in range(SQUARES)],
+}
+ZOBRIST_SIDE: int = _zobrist_random.getrandbits(64)
+
+def iter_squares(bits: int) -> Iterator[int]:
+    """
+    Yield the square index of every set bit, least significant first.
+    """
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+# The eight (dx, dy) directions; directions i and i + 4 point opposite ways along the same axis
+DIRECTIONS: List[Tuple[int, int]] = [(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)]
+
+
+def _ray(x: int, y: int, dx: int, dy: int) -> Tuple[Tuple[int, int], ...]:
+    ray = []
+    x, y = x + dx, y + dy
+    while 0 <= x < 8 and 0 <= y < 8:
+        ray.append((x, y))
+        x, y = x + dx, y + dy
+    return tuple(ray)
+
+
+# For every square index, its 8 rays in `DIRECTIONS` order: the (x, y) squares from the
+# neighbour outwards to the wall. Rays that start at the wall are empty.
+RAYS: List[Tuple[Tuple[Tuple[int, int], ...], ...]] = [None] * SQUARES
+for _x in range(8):
+    for _y in range(8):
+        RAYS[square_index(_x, _y)] = tuple(_ray(_x, _y, dx, dy) for dx, dy in DIRECTIONS)
+
+# The bit of every square in a bitboard, indexed [y][x] like the grid
+SQUARE_BITS: List[List[int]] = [[1 << square_index(_x, _y) for _x in range(8)] for _y in range(8)]
+
+# For every direction, the lines of square bits that run against it, each starting at a
+# square whose ray in that direction is empty (the wall) and walking away from the wall
+LINES: List[List[Tuple[int, ...]]] = [
+    [tuple(SQUARE_BITS[_y - k * dy][_x - k * dx] for k in range(len(RAYS[square_index(_x, _y)][(d + 4) % 8]) + 1))
+     for _x in range(8) for _y in range(8) if not RAYS[square_index(_x, _y)][d]]
+    for d, (dx, dy) in enumerate(DIRECTIONS)
+]
+
+# For every corner, its (x, y) and the (x, y) of its orthogonal and diagonal neighbours
+CORNER_NEIGHBOURS: List[Tuple[Tuple[int, int], Tuple[Tuple[int, int], ...], Tuple[Tuple[int, int], ...]]] = [
+    ((_x, _y),
+     tuple(ray[0] for (dx, dy), ray in zip(DIRECTIONS, RAYS[square_index(_x, _y)]) if ray and (dx == 0 or dy == 0)),
+     tuple(ray[0] for (dx, dy), ray in zip(DIRECTIONS, RAYS[square_index(_x, _y)]) if ray and dx != 0 and dy != 0))
+    for _x, _y in [(0, 0), (0, 7), (7, 0), (7, 7)]
+]
+
+
+# The 8 symmetries of the board are numbered 0-7: bit 2 swaps x and y, then bit 0 mirrors x
+# and bit 1 mirrors y. Transform 0 is the identity.
+SYMMETRY_COUNT: int = 8
+
+
+def transform_bits(bits: int, transform: int) -> int:
+    """
+    Map a 64-bit square mask through one of the 8 symmetries of the board.
+
+    Each column x is one byte of the mask (see `square_index`), so mirroring x reverses the
+    bytes, mirroring y reverses the bits within every byte and swapping x and y is the
+    delta-swap transpose of an 8x8 bit matrix.
+
+    Args:
+        bits (int): The mask to transform.
+        transform (int): The symmetry, 0 to 7.
+
+    Returns:
+        int: The transformed mask.
+    """
+    if transform & 4:
+        t = 0x0F0F0F0F00000000 & (bits ^ (bits << 28))
+        bits ^= t ^ (t >> 28)
+        t = 0x3333000033330000 & (bits ^ (bits << 14))
+        bits ^= t ^ (t >> 14)
+        t = 0x5500550055005500 & (bits ^ (bits << 7))
+        bits ^= t ^ (t >> 7)
+    if transform & 1:
+        bits = int.from_bytes(bits.to_bytes(8, 'little'), 'big')
+    if transform & 2:
+        bits = (bits >> 1) & 0x5555555555555555 | (bits & 0x5555555555555555) << 1
+        bits = (bits >> 2) & 0x3333333333333333 | (bits & 0x3333333333333333) << 2
+        bits = (bits >> 4) & 0x0F0F0F0F0F0F0F0F | (bits & 0x0F0F0F0F0F0F0F0F) << 4
+    return bits
+
+
+# Where every square index goes under each symmetry, and the symmetry that undoes each one
+SYMMETRIES: List[List[int]] = [[transform_bits(1 << _square, _transform).bit_length() - 1 for _square in range(SQUARES)]
+                               for _transform in range(SYMMETRY_COUNT)]
+INVERSE_SYMMETRY: List[int] = [next(_inverse for _inverse in range(SYMMETRY_COUNT)
+                                    if all(SYMMETRIES[_inverse][_target] == _square for _square, _target in enumerate(_squares)))
+                               for _squares in SYMMETRIES]
+
+
+def transform_point(point: Point, transform: int) -> Point:
+    """
+    Map a square through one of the 8 symmetries of the board.
+
+    A move found in the canonical orientation of a position is mapped back to the
+    board with `transform_point(move, INVERSE_SYMMETRY[transform])`.
+
+    Args:
+        point (Point): The square.
+        transform (int): The symmetry, 0 to 7.
+
+    Returns:
+        Point: The interned Point of the transformed square.
+    """
+    return Point.from_square(SYMMETRIES[transform][square_index(point.x, point.y)])
+
+
+class GridRow(list):
+    """
+    A row of cell values whose item assignments are routed through `Board.set_square`.
+
+    Lets boards that do not store a list-of-lists grid (see `BitBoard`) still support
+    `board.grid[y][x] = value` edits.
+    """
+    __slots__ = ('board', 'y')
+
+    def __init__(self, board: 'Board', y: int, cells: List[str]):
+        super().__init__(cells)
+        self.board = board
+        self.y = y
+
+    def __setitem__(self, x: int, value: str):
+        self.board.set_square(x, self.y, value)
+        list.__setitem__(self, x, value)
+
+
+class Grid(list):
+    """
+    A list of `GridRow`s whose row assignments are routed through `Board.set_square`.
+    """
+    __slots__ = ('board',)
+
+    def __init__(self, board: 'Board', rows: List[List[str]]):
+        super().__init__(GridRow(board, y, row) for y, row in enumerate(rows))
+        self.board = board
+
+    def __setitem__(self, y: int, row: List[str]):
+        grid_row = list.__getitem__(self, y)
+        for x, value in enumerate(row):
+            grid_row[x] = value
+
+
 class Board():
 
     STARTING_POINTS = {
-        Color.BLACK: [Point(3, 3), Point(4, 4)],
-        Color.WHITE: [Point(3, 4), Point(4, 3)]
+        Color.BLACK: [Point.at(3, 3), Point.at(4, 4)],
+        Color.WHITE: [Point.at(3, 4), Point.at(4, 3)]
     }
     
     SIZE: int = 8
@@ -14,12 +183,170 @@ class Board():
     def __init__(self, scale: int = 1):
         self.scale = scale
 
-        self.grid: List[List[str]] = [[Color.EMPTY.value] * Board.SIZE for _ in range(Board.SIZE)]
+        # Legal moves per color for the current position, cleared whenever a square changes
+        self.legal_moves_cache: Dict[Color, List[Point]] = {}
+        # (black, white) masks of stable discs for the current position, cleared alongside the legal moves
+        self.stable_discs_cache: Tuple[int, int] = None
+
+        # One int per applied move, most recent last: `flips << 7 | mover_is_white << 6 | square`
+        self.undo_stack: List[int] = []
+
+        # 64-bit Zobrist key of the discs and side to move, updated on every square change
+        self.zobrist_key: int = 0
+        self._side_to_move: Color = Color.BLACK
+
+        self.grid = [[Color.EMPTY.value] * Board.SIZE for _ in range(Board.SIZE)]
 
         for color, points in Board.STARTING_POINTS.items():
             for point in points:
                 self.grid[point.y][point.x] = color.value
 
+    @property
+    def grid(self) -> List[List[str]]:
+        return self._grid
+
+    @grid.setter
+    def grid(self, rows: List[List[str]]):
+        # Rows are wrapped so that in-place edits (`board.grid[y][x] = value`) still invalidate caches
+        self._grid = Grid(self, rows)
+        self.zobrist_key = self.compute_zobrist_key()
+        self.undo_stack = []
+        self.invalidate_cache()
+
+    @property
+    def side_to_move(self) -> Color:
+        return self._side_to_move
+
+    @side_to_move.setter
+    def side_to_move(self, color: Color):
+        if color != self._side_to_move:
+            self.zobrist_key ^= ZOBRIST_SIDE
+            self._side_to_move = color
+
+    def pass_turn(self):
+        """
+        Hand the turn to the other color without placing a disc.
+        """
+        self.side_to_move = Color.BLACK if self.side_to_move == Color.WHITE else Color.WHITE
+
+    def get_bitboards(self) -> Tuple[int, int]:
+        """
+        Get the position as two 64-bit masks, one bit per square (see `square_index`).
+
+        Returns:
+            Tuple[int, int]: The (black, white) disc masks.
+        """
+        black = white = 0
+        black_value, white_value = Color.BLACK.value, Color.WHITE.value
+        for row, bits in zip(self.grid, SQUARE_BITS):
+            for value, bit in zip(row, bits):
+                if value == black_value:
+                    black |= bit
+                elif value == white_value:
+                    white |= bit
+        return black, white
+
+    def position_key(self, color: Color) -> int:
+        """
+        Get the Zobrist key of the current discs with the given color to move.
+
+        Searches use this instead of `zobrist_key` so that nodes reached through a pass,
+        or roots handed over without `side_to_move` set, are still keyed correctly.
+
+        Args:
+            color (Color): The color to move.
+
+        Returns:
+            int: The 64-bit position key.
+        """
+        return self.zobrist_key if color == self.side_to_move else self.zobrist_key ^ ZOBRIST_SIDE
+
+    def compute_zobrist_key(self) -> int:
+        """
+        Compute the Zobrist key of the current position from scratch.
+
+        `zobrist_key` is kept up to date incrementally; this is the reference it must match.
+
+        Returns:
+            int: The 64-bit key of the discs on the board and the side to move.
+        """
+        key = ZOBRIST_SIDE if self.side_to_move == Color.WHITE else 0
+        for y, row in enumerate(self.grid):
+            for x, value in enumerate(row):
+                key ^= ZOBRIST_SQUARES[value][square_index(x, y)]
+        return key
+
+    def canonical_form(self) -> Tuple[int, int, int]:
+        """
+        Get the canonical representative of the position among its 8 rotations and reflections.
+
+        The representative is the orientation with the smallest (black, white) masks, so every
+        position in a symmetry class has the same one.
+
+        Returns:
+            Tuple[int, int, int]: The canonical (black, white) masks and the symmetry that maps this board onto them.
+        """
+        black, white = self.get_bitboards()
+        best = (black, white, 0)
+        for transform in range(1, SYMMETRY_COUNT):
+            transformed_black = transform_bits(black, transform)
+            if transformed_black > best[0]:
+                continue
+            transformed_white = transform_bits(white, transform)
+            if (transformed_black, transformed_white) < best[:2]:
+                best = (transformed_black, transformed_white, transform)
+        return best
+
+    def canonical_key(self, color: Color) -> Tuple[int, int]:
+        """
+        Get a Zobrist key shared by every position in the symmetry class of the current one.
+
+        Caches keyed by this store one entry per class; map moves found for the canonical
+        position back with `transform_point(move, INVERSE_SYMMETRY[transform])`.
+
+        Args:
+            color (Color): The color to move.
+
+        Returns:
+            Tuple[int, int]: The 64-bit key of the canonical position and the symmetry that maps this board onto it.
+        """
+        black, white, transform = self.canonical_form()
+        if transform == 0:
+            return self.position_key(color), 0
+
+        key = ZOBRIST_SIDE if color == Color.WHITE else 0
+        for value, bits in ((Color.BLACK.value, black), (Color.WHITE.value, white)):
+            keys = ZOBRIST_SQUARES[value]
+            for square in iter_squares(bits):
+                key ^= keys[square]
+        return key, transform
+
+    def set_square(self, x: int, y: int, value: str):
+        """
+        Set the value of a single square.
+
+        Args:
+            x (int): The column of the square.
+            y (int): The row of the square.
+            value (str): The `Color.value` to store.
+        """
+        row = self._grid[y]
+        previous = row[x]
+        if previous == value:
+            return
+
+        square = square_index(x, y)
+        self.zobrist_key ^= ZOBRIST_SQUARES[previous][square] ^ ZOBRIST_SQUARES[value][square]
+        list.__setitem__(row, x, value)
+        self.invalidate_cache()
+
+    def invalidate_cache(self):
+        """
+        Drop everything cached for the current position. Called whenever a square changes.
+        """
+        self.legal_moves_cache.clear()
+        self.stable_discs_cache = None
+
     def is_game_over(self) -> bool:
         """
         Check if the game is over.
@@ -27,9 +354,7 @@ class Board():
         Returns:
             bool: True if the game is over, False otherwise.
         """
-        black_legal_moves = self.get_legal_moves(Color.BLACK)
-        white_legal_moves = self.get_legal_moves(Color.WHITE)
-        return not any(black_legal_moves) and not any(white_legal_moves)
+        return not self.cached_legal_moves(Color.BLACK) and not self.cached_legal_moves(Color.WHITE)
 
     def is_valid_position(self, point: Point) -> bool:
         """
@@ -47,7 +372,8 @@ class Board():
         """
         Check if a piece at the specified point is stable for the given color.
 
-        A piece is considered stable if it is surrounded by walls or pieces of the same color in at least four unique directions.
+        A piece is considered stable if it can never be flipped: along each of the four axes, the line through it is full
+        or one of its neighbours is the wall or a stable piece of the same color.
 
         Args:
             point (Point): The point to check for stability.
@@ -56,38 +382,68 @@ class Board():
         Returns:
             bool: True if the piece is stable, False otherwise.
         """
-        if self.grid[point.y][point.x] != color.value:
-            return False
-
-        # Define the eight unique directions as Points
-        directions: List[Point] = [Point(1, 0), Point(-1, 0), Point(0, 1), Point(0, -1),
-                    Point(1, 1), Point(-1, -1), Point(1, -1), Point(-1, 1)]
+        black, white = self.get_stable_discs()
+        stable = black if color == Color.BLACK else white if color == Color.WHITE else 0
+        return bool(stable >> square_index(point.x, point.y) & 1)
 
-        unique_directions: set = set()
-       
-        for direction in directions:
-            current_point = point.__copy__()
-            is_stable: bool = True # Flag to track if the piece is stable in this direction
-            
-            while self.is_valid_position(current_point):
-                color_value = self.grid[current_point.y][current_point.x]
-
-                if color_value == Color.EMPTY.value:
-                    is_stable = False  # An empty square makes the space not stable
-                    break
+    def get_stable_discs(self) -> Tuple[int, int]:
+        """
+        Get the stable discs of both colors, computing them only once per position.
 
-                current_point.shift(direction.x, direction.y)
+        Returns:
+            Tuple[int, int]: The (black, white) masks of stable discs (see `square_index`).
+        """
+        if self.stable_discs_cache is None:
+            self.stable_discs_cache = self.generate_stable_discs()
+        return self.stable_discs_cache
 
-            if is_stable: # Check if the direction or its mirrored version is already in the set
-                mirrored_direction: Point = Point(-direction.x, -direction.y)
-                if not (direction in unique_directions or mirrored_direction in unique_directions):
-                    unique_directions.add(direction)
+    def generate_stable_discs(self) -> Tuple[int, int]:
+        """
+        Compute the stable discs of both colors, growing stability out from the walls.
 
-        # Check if the piece is at the end of at least four unique directions
-        if len(unique_directions) == 4:
-            return True
+        A disc is stable when, along each of the four axes, the whole line through it is full
+        or one of its two neighbours is the wall or a stable disc of its own color. Fullness is
+        found walking each line from the wall inwards: a square's ray is full until the walk has
+        crossed an empty square. The discs are then swept until no more become stable.
 
-        return False
+        Returns:
+            Tuple[int, int]: The (black, white) masks of stable discs.
+        """
+        black, white = self.get_bitboards()
+        occupied = black | white
+
+        rays = []
+        for direction in range(8):
+            full = 0
+            for line in LINES[direction]:
+                for bit in line:
+                    full |= bit
+                    if not occupied & bit:
+                        break
+            rays.append(full)
+        # Directions i and i + 4 in `DIRECTIONS` point opposite ways along the same axis
+        full_lines = [rays[axis] & rays[axis + 4] for axis in range(4)]
+
+        stable = [0, 0]
+        changed = True
+        while changed:
+            changed = False
+            for i, own in enumerate((black, white)):
+                for square in iter_squares(own & ~stable[i]):
+                    bit = 1 << square
+                    square_rays = RAYS[square]
+                    for axis in range(4):
+                        if full_lines[axis] & bit:
+                            continue
+                        if any(not ray or SQUARE_BITS[ray[0][1]][ray[0][0]] & stable[i]
+                               for ray in (square_rays[axis], square_rays[axis + 4])):
+                            continue
+                        break
+                    else:
+                        stable[i] |= bit
+                        changed = True
+
+        return stable[0], stable[1]
 
     def get_legal_moves(self, color: Color) -> List[Point]:
         """
@@ -99,14 +455,46 @@ class Board():
         Returns:
             List[Point]: List of all legal move positions.
         """
+        return list(self.cached_legal_moves(color))
+
+    def cached_legal_moves(self, color: Color) -> List[Point]:
+        """
+        Get the legal moves for the specified color, generating them only on a cache miss.
+
+        The returned list is shared with the cache and must not be modified; use
+        `get_legal_moves` for a private copy.
+
+        Args:
+            color (Color): The color to get legal moves for.
+
+        Returns:
+            List[Point]: List of all legal move positions.
+        """
+        legal_moves = self.legal_moves_cache.get(color)
+        if legal_moves is None:
+            legal_moves = self.legal_moves_cache[color] = self.generate_legal_moves(color)
+        return legal_moves
+
+    def generate_legal_moves(self, color: Color) -> List[Point]:
+        """
+        Generate all legal moves for the specified color, bypassing the cache.
+
+        Args:
+            color (Color): The color to get legal moves for.
+
+        Returns:
+            List[Point]: List of all legal move positions.
+        """
+        grid = self.grid
+        empty = Color.EMPTY.value
+        value = color.value
         legal_moves = []
-        
+
         for x in range(Board.SIZE):
             for y in range(Board.SIZE):
-                point = Point(x, y)
-                if self.is_legal_move(point, color):
-                    legal_moves.append(point)
-        
+                if grid[y][x] == empty and self._flanks(grid, x, y, value):
+                    legal_moves.append(Point.at(x, y))
+
         return legal_moves
     
     def is_legal_move(self, point: Point, color: Color) -> bool:
@@ -121,31 +509,33 @@ class Board():
             bool: True if the move is legal, False otherwise.
         """
         # Position must be empty
-        if self.grid[point.y][point.x] != Color.EMPTY.value:
+        grid = self.grid
+        if grid[point.y][point.x] != Color.EMPTY.value:
             return False
 
-        # Check if we can flip any discs in any direction
-        directions = [(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)]
-        
-        for dx, dy in directions:
-            x, y = point.x + dx, point.y + dy
+        return self._flanks(grid, point.x, point.y, color.value)
+
+    @staticmethod
+    def _flanks(grid: List[List[str]], x: int, y: int, value: str) -> bool:
+        # Check if a disc of `value` at (x, y) would flip anything in any direction
+        empty = Color.EMPTY.value
+
+        for ray in RAYS[square_index(x, y)]:
             found_opponent = False
-            
-            while self.is_valid_position(Point(x, y)):
-                cell_value = self.grid[y][x]
-                
-                if cell_value == Color.EMPTY.value:
+
+            for rx, ry in ray:
+                cell_value = grid[ry][rx]
+
+                if cell_value == empty:
                     break
-                    
-                if cell_value == color.value:
+
+                if cell_value == value:
                     if found_opponent:
                         return True
                     break
-                    
+
                 found_opponent = True
-                x += dx
-                y += dy
-        
+
         return False
 
     def place_and_flip_discs(self, point: Point, color: Color, perform_flip: bool = True) -> List[Point]:
@@ -163,42 +553,40 @@ class Board():
         Returns:
             List[Point]: A list of points representing the discs flipped as a result of placing the new disc. If no discs are flipped, an empty list is returned.
         """
-        if self.grid[point.y][point.x] != Color.EMPTY.value:
-            return []
-
-        def flip_discs_in_direction(dx: int, dy: int) -> List[Point]:
-            x, y = point.x + dx, point.y + dy
-            flipped_discs = []
-
-            while self.is_valid_position(Point(x, y)):
-                if self.grid[y][x] == Color.EMPTY.value:
-                    return []
-
-                if self.grid[y][x] == color.value:
-                    return flipped_discs
-
-                flipped_discs.append(Point(x, y))
-                x += dx
-                y += dy
+        grid = self.grid
+        empty = Color.EMPTY.value
+        value = color.value
 
+        if grid[point.y][point.x] != empty:
             return []
 
-        # Define directions for all 8 possible neighbors
-        directions: List[Point] = [Point(-1, 0), Point(-1, 1), Point(0, 1), Point(1, 1), Point(1, 0), Point(1, -1), Point(0, -1), Point(-1, -1)]
-
-        # Check directions and assign results to `disc` simultaneously
-        flipped_discs = [disc for direction in directions if (disc := flip_discs_in_direction(direction.x, direction.y))]
+        # Walk each ray over the opponent's discs; the run is flipped if it ends at one of ours
+        flipped_discs = []
+        for ray in RAYS[square_index(point.x, point.y)]:
+            for length, (x, y) in enumerate(ray):
+                cell_value = grid[y][x]
+                if cell_value == empty:
+                    break
+                if cell_value == value:
+                    if length:
+                        flipped_discs.append([Point.at(fx, fy) for fx, fy in ray[:length]])
+                    break
 
         if not flipped_discs:
             return []
         
         # Place the disc and perform flips
         if perform_flip:
-            self.grid[point.y][point.x] = color.value
+            grid[point.y][point.x] = value
 
+            flips = 0
             for path in flipped_discs:
-                for point in path:
-                    self.grid[point.y][point.x] = color.value
+                for disc in path:
+                    grid[disc.y][disc.x] = value
+                    flips |= SQUARE_BITS[disc.y][disc.x]
+
+            self.push_undo(square_index(point.x, point.y), flips, color)
+            self.side_to_move = Color.WHITE if color == Color.BLACK else Color.BLACK
 
         return flipped_discs
 
@@ -207,7 +595,7 @@ class Board():
 
     def get_closest_corner(self, point: Point) -> Point:
         # Define the coordinates of the four corners
-        corners: List[Point] = [Point(0, 0), Point(0, 7), Point(7, 0), Point(7, 7)]
+        corners: List[Point] = [Point.at(0, 0), Point.at(0, 7), Point.at(7, 0), Point.at(7, 7)]
         closest_corner: Point = None
         closest_distance = float('inf')
         
@@ -220,6 +608,22 @@ class Board():
         
         return closest_corner
 
+    def evaluate(self, heuristics: List[Callable[['Board', Color], int]], color: Color) -> int:
+        """
+        Sum the values of several heuristics for the specified color.
+
+        Heuristics are given as `Board` functions (e.g. `Board.square_heuristic`) and are looked up
+        on this board by name, so subclasses such as `BitBoard` use their own implementations.
+
+        Args:
+            heuristics (List[Callable[[Board, Color], int]]): The heuristic functions to sum.
+            color (Color): The color for which the heuristics are calculated.
+
+        Returns:
+            int: The summed heuristic value.
+        """
+        return sum(getattr(self, heuristic.__name__)(color) for heuristic in heuristics)
+
     def winner_heuristic(self, color: Color) -> int:
         """
         Calculate the winner heuristic for the specified color.
@@ -281,8 +685,8 @@ class Board():
         opponent_color = Color.BLACK if color == Color.WHITE else Color.WHITE
 
         # Get the legal moves for the player and the opponent
-        player_legal_moves = self.get_legal_moves(color)
-        opponent_legal_moves = self.get_legal_moves(opponent_color)
+        player_legal_moves = self.cached_legal_moves(color)
+        opponent_legal_moves = self.cached_legal_moves(opponent_color)
 
         # Calculate the difference in the number of legal moves
         return len(player_legal_moves) - len(opponent_legal_moves)
@@ -303,32 +707,27 @@ class Board():
         C_SQUARE_VALUE = -7
         X_SQUARE_VALUE = -3
         
-        corners: List[Point] = [Point(0, 0), Point(0, 7), Point(7, 0), Point(7, 7)]
+        grid = self.grid
+        empty = Color.EMPTY.value
+        value = color.value
         heuristic_value: int = 0
 
-        for corner in corners:
-            corner_color = self.grid[corner.y][corner.x]
+        for (x, y), orthogonal, diagonal in CORNER_NEIGHBOURS:
+            corner_color = grid[y][x]
 
-            if corner_color != Color.EMPTY.value:
-                heuristic_value += CORNER_VALUE * (1 if corner_color == color.value else -1)
+            if corner_color != empty:
+                heuristic_value += CORNER_VALUE * (1 if corner_color == value else -1)
                 continue
 
-            directions: List[Point] = [Point(1, 0), Point(-1, 0), Point(0, 1), Point(0, -1),
-                        Point(1, 1), Point(-1, -1), Point(1, -1), Point(-1, 1)]
-            
-            for direction in directions:
-                point = corner.__copy__()
-                point.shift(direction.x, direction.y)
-                if not self.is_valid_position(point):
-                    continue
-
-                square_color = self.grid[point.y][point.x]
-                if direction.x == 0 or direction.y == 0: # X SQUARE                    
-                    if square_color != Color.EMPTY.value:
-                        heuristic_value += X_SQUARE_VALUE * (1 if square_color == color.value else -1)
-                else: # C SQUARE
-                    if square_color != Color.EMPTY.value:
-                        heuristic_value += C_SQUARE_VALUE * (1 if square_color == color.value else -1)
+            for nx, ny in orthogonal: # X SQUARE
+                square_color = grid[ny][nx]
+                if square_color != empty:
+                    heuristic_value += X_SQUARE_VALUE * (1 if square_color == value else -1)
+
+            for nx, ny in diagonal: # C SQUARE
+                square_color = grid[ny][nx]
+                if square_color != empty:
+                    heuristic_value += C_SQUARE_VALUE * (1 if square_color == value else -1)
 
         return heuristic_value
 
@@ -345,7 +744,9 @@ class Board():
             int: The stability heuristic score.
         """
         POINTS = 3
-        stability_heuristic = sum(POINTS for y in range(Board.SIZE) for x in range(Board.SIZE) if self.is_stable_piece(Point(x, y), color))
+        black, white = self.get_stable_discs()
+        stable = black if color == Color.BLACK else white if color == Color.WHITE else 0
+        stability_heuristic = POINTS * stable.bit_count()
         return stability_heuristic
 
     def get_ordered_legal_moves(self, color: Color) -> List[Point]:
@@ -359,7 +760,7 @@ class Board():
         Returns:
             List[Point]: List of legal moves ordered by priority.
         """
-        legal_moves = self.get_legal_moves(color)
+        legal_moves = self.cached_legal_moves(color)
         
         corners = []
         edges = []
@@ -375,36 +776,121 @@ class Board():
         
         return corners + edges + others
 
-    def make_move(self, point: Point, color: Color) -> List[Point]:
+    def make_move(self, point: Point, color: Color) -> int:
         """
-        Make a move and return the flipped discs for easy undo.
-        
+        Make a move and record it on the undo stack.
+
+        Unlike `place_and_flip_discs`, no flip paths are built: the flipped discs are
+        collected into a bitmask, so `undo` can take the move back without any lists of Points.
+
         Args:
             point (Point): The move to make.
             color (Color): The color making the move.
-            
+
         Returns:
-            List[Point]: The discs that were flipped.
+            int: The flipped discs as a bitmask (see `square_index`), or 0 if the move was not legal.
         """
-        return self.place_and_flip_discs(point, color, perform_flip=True)
-    
-    def undo_move(self, point: Point, color: Color, flipped_discs: List[List[Point]]):
+        grid = self.grid
+        empty = Color.EMPTY.value
+        value = color.value
+        x, y = point.x, point.y
+
+        if grid[y][x] != empty:
+            return 0
+
+        # Walk each ray over the opponent's discs; the run is flipped if it ends at one of ours
+        square = square_index(x, y)
+        flips = 0
+        for ray in RAYS[square]:
+            run = 0
+            for rx, ry in ray:
+                cell_value = grid[ry][rx]
+                if cell_value == empty:
+                    break
+                if cell_value == value:
+                    flips |= run
+                    break
+                run |= SQUARE_BITS[ry][rx]
+
+        if not flips:
+            return 0
+
+        grid[y][x] = value
+        for flipped in iter_squares(flips):
+            grid[flipped & 7][flipped >> 3] = value
+
+        self.push_undo(square, flips, color)
+        self.side_to_move = Color.WHITE if color == Color.BLACK else Color.BLACK
+        return flips
+
+    def push_undo(self, square: int, flips: int, color: Color):
+        """
+        Record an applied move on the undo stack.
+
+        Args:
+            square (int): The square index of the placed disc.
+            flips (int): The flipped discs as a bitmask.
+            color (Color): The color that made the move.
+        """
+        self.undo_stack.append(flips << 7 | (color == Color.WHITE) << 6 | square)
+
+    def undo(self):
+        """
+        Take back the most recent move made with `make_move` or `place_and_flip_discs`.
+
+        Raises:
+            IndexError: If there is no move to undo.
+        """
+        record = self.undo_stack.pop()
+        self.revert_move(record & 63, record >> 7, Color.WHITE if record & 64 else Color.BLACK)
+
+    def undo_move(self, point: Point, color: Color, flipped_discs: Union[int, List[List[Point]]]):
         """
         Undo a move by reverting the board state.
         
         Args:
             point (Point): The move to undo.
             color (Color): The color that made the move.
-            flipped_discs (List[List[Point]]): The discs that were flipped.
+            flipped_discs (Union[int, List[List[Point]]]): The flipped discs, as returned by
+                `make_move` or `place_and_flip_discs`.
         """
+        if not isinstance(flipped_discs, int):
+            flipped_discs = sum(SQUARE_BITS[disc.y][disc.x] for path in flipped_discs for disc in path)
+
+        square = square_index(point.x, point.y)
+        if self.undo_stack and self.undo_stack[-1] & 63 == square:
+            self.undo_stack.pop()
+        self.revert_move(square, flipped_discs, color)
+
+    def revert_move(self, square: int, flips: int, color: Color):
+        """
+        Remove a placed disc and turn its flipped discs back, without touching the undo stack.
+
+        Args:
+            square (int): The square index of the placed disc.
+            flips (int): The flipped discs as a bitmask.
+            color (Color): The color that made the move.
+        """
+        grid = self.grid
+        opponent_value = Color.WHITE.value if color == Color.BLACK else Color.BLACK.value
+
         # Remove the placed disc
-        self.grid[point.y][point.x] = Color.EMPTY.value
-        
+        grid[square & 7][square >> 3] = Color.EMPTY.value
+
         # Revert flipped discs
-        opponent_color = Color.WHITE if color == Color.BLACK else Color.BLACK
-        for path in flipped_discs:
-            for disc_point in path:
-                self.grid[disc_point.y][disc_point.x] = opponent_color.value
+        for flipped in iter_squares(flips):
+            grid[flipped & 7][flipped >> 3] = opponent_value
+
+        self.side_to_move = color
+
+    def __deepcopy__(self, memo: dict) -> 'Board':
+        board = type(self).__new__(type(self))
+        memo[id(self)] = board
+        board.__dict__.update(self.__dict__)
+        board.legal_moves_cache = dict(self.legal_moves_cache)
+        board.undo_stack = list(self.undo_stack)
+        board._grid = Grid(board, self._grid)
+        return board
 
     def __str__(self):
         scale = self.scale
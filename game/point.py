@@ -1,11 +1,33 @@
 import math
 
 class Point:
+    __slots__ = ('x', 'y')
 
     def __init__(self, x_init: int, y_init: int):
         self.x = x_init
         self.y = y_init
 
+    @staticmethod
+    def at(x: int, y: int) -> 'Point':
+        """
+        Get the shared, immutable Point for an on-board square without allocating.
+
+        Args:
+            x (int): The column, 0 to 7.
+            y (int): The row, 0 to 7.
+
+        Returns:
+            Point: The interned Point for (x, y).
+        """
+        return INTERNED_POINTS[x * 8 + y]
+
+    @staticmethod
+    def from_square(square: int) -> 'Point':
+        """
+        Get the shared, immutable Point for a square index (`x * 8 + y`, see `game.board.square_index`).
+        """
+        return INTERNED_POINTS[square]
+
     def shift(self, x: int, y: int) -> None:
         self.x += x
         self.y += y
@@ -16,12 +38,34 @@ class Point:
 
     def __copy__(self):
         return Point(self.x, self.y)
-    
+
     def __eq__(self, obj):
-        return isinstance(obj, Point) and obj.x == self.x and obj.y == self.y
-    
+        return obj is self or (isinstance(obj, Point) and obj.x == self.x and obj.y == self.y)
+
     def __hash__(self):
         return hash((self.x, self.y))
 
     def __str__(self):
-        return f'({chr(ord("a") + self.x)}, {self.y + 1})'
\ No newline at end of file
+        return f'({chr(ord("a") + self.x)}, {self.y + 1})'
+
+
+class InternedPoint(Point):
+    """
+    A Point shared by every caller through `Point.at`, so it cannot be changed in place.
+    """
+    __slots__ = ()
+
+    def __init__(self, x_init: int, y_init: int):
+        object.__setattr__(self, 'x', x_init)
+        object.__setattr__(self, 'y', y_init)
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError('Interned points are immutable; copy them before shifting.')
+
+    def __reduce__(self):
+        # Unpickle (e.g. in worker processes) to the receiving process's shared instance
+        return Point.at, (self.x, self.y)
+
+
+# One Point per square, indexed by `x * 8 + y`
+INTERNED_POINTS = [InternedPoint(x, y) for x in range(8) for y in range(8)]
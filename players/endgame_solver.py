@@ -0,0 +1,234 @@
+from game.board import Board, SQUARES, iter_squares, square_index
+from game.enums import Color
+from game.point import Point
+from players.transposition_table import Bound, TranspositionTable
+
+from typing import List, Tuple
+
+# The quadrant (0 to 3) of every square index, for parity ordering
+QUADRANTS: List[int] = [(square >> 3 >= 4) * 2 + (square & 7 >= 4) for square in range(SQUARES)]
+
+
+class EndgameSolver:
+    """
+    Solves positions near the end of the game by searching every line to the last move.
+
+    The score is the final disc difference for the color to move (own discs minus the
+    opponent's), or just its sign in win/loss/draw mode, which searches a (-1, 1) window and
+    so prunes far more. Exact scores are found with a sequence of null-window searches (MTD(f))
+    sharing a transposition table. Children are ordered fastest-first (fewest opponent replies)
+    and by quadrant parity; the last few empties are searched by trying every empty square directly.
+    """
+
+    # Above this many empties children are ordered fastest-first; below it by parity only
+    FASTEST_FIRST_EMPTIES: int = 6
+    # At or below this many empties the solver skips move generation and ordering
+    FAST_PATH_EMPTIES: int = 4
+
+    def __init__(self, win_loss_draw: bool = False, transposition_table_mb: float = 8):
+        """
+        Initialize an endgame solver.
+
+        Args:
+            win_loss_draw (bool): Only find whether the position is won, lost or drawn.
+            transposition_table_mb (float): Memory cap of the transposition table in megabytes (0 disables it).
+        """
+        self.win_loss_draw = win_loss_draw
+        self.transposition_table = TranspositionTable(transposition_table_mb) if transposition_table_mb > 0 else None
+        self.nodes: int = 0 # Nodes visited by the last call to solve()
+
+    def solve(self, board: Board, color: Color) -> Tuple[Point, int]:
+        """
+        Find the best move and the game-theoretic score of a position.
+
+        Args:
+            board (Board): The position, which is restored before returning.
+            color (Color): The color to move.
+
+        Returns:
+            Tuple[Point, int]: The best move (None if `color` has no legal move) and the final disc
+                difference for `color`, or -1, 0 or 1 for a loss, draw or win in win/loss/draw mode.
+        """
+        self.nodes = 0
+        black, white = board.get_bitboards()
+        empties = list(iter_squares(~(black | white) & ((1 << SQUARES) - 1)))
+
+        if self.win_loss_draw:
+            move, score = self.search(board, color, empties, -1, 1)
+            return move, (score > 0) - (score < 0)
+
+        # Narrow [lower, upper] around the score with null-window searches, starting from a draw
+        best_move, score = None, 0
+        lower, upper = -SQUARES - 1, SQUARES + 1
+        while lower < upper:
+            beta = score + 1 if score == lower else score
+            move, score = self.search(board, color, empties, beta - 1, beta)
+            if score < beta:
+                upper = score
+            else:
+                lower = score
+                best_move = move
+
+        return best_move, score
+
+    def search(self, board: Board, color: Color, empties: List[int], alpha: int, beta: int) -> Tuple[Point, int]:
+        """
+        Fail-soft negamax to the end of the game with ordered children.
+
+        Args:
+            board (Board): The current game board.
+            color (Color): The color of the current player.
+            empties (List[int]): The square indices of the empty squares.
+            alpha (int): Alpha value for alpha-beta pruning.
+            beta (int): Beta value for alpha-beta pruning.
+
+        Returns:
+            Tuple[Point, int]: The best move and its score for `color`.
+        """
+        self.nodes += 1
+        opponent = Color.WHITE if color == Color.BLACK else Color.BLACK
+
+        table = self.transposition_table
+        table_move = None
+        if table is not None:
+            key = board.position_key(color)
+            alpha_original, beta_original = alpha, beta
+            entry = table.probe(key)
+            if entry is not None:
+                # Every entry is searched to the end, so its bound always applies
+                table_move = entry.move
+                if entry.bound == Bound.EXACT:
+                    return entry.move, entry.score
+                if entry.bound == Bound.LOWER:
+                    alpha = max(alpha, entry.score)
+                else:
+                    beta = min(beta, entry.score)
+                if alpha >= beta:
+                    return entry.move, entry.score
+
+        legal_moves = board.cached_legal_moves(color)
+
+        if not legal_moves:
+            if not board.cached_legal_moves(opponent):
+                return None, self.final_score(board, color)
+            return None, -self.value(board, opponent, empties, -beta, -alpha)
+
+        legal_moves = self.order_moves(board, color, legal_moves, empties)
+        if table_move is not None and table_move in legal_moves:
+            legal_moves.remove(table_move)
+            legal_moves.insert(0, table_move)
+
+        best_move, best_score = None, -SQUARES - 1
+        for move in legal_moves:
+            square = square_index(move.x, move.y)
+            board.make_move(move, color)
+            score = -self.value(board, opponent, [empty for empty in empties if empty != square], -beta, -alpha)
+            board.undo()
+
+            if score > best_score:
+                best_move, best_score = move, score
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        if table is not None:
+            if best_score <= alpha_original:
+                bound = Bound.UPPER
+            elif best_score >= beta_original:
+                bound = Bound.LOWER
+            else:
+                bound = Bound.EXACT
+            table.store(key, len(empties), best_score, bound, best_move)
+
+        return best_move, best_score
+
+    def value(self, board: Board, color: Color, empties: List[int], alpha: int, beta: int) -> int:
+        """
+        Get the score of a position, using the fast path when few empties are left.
+        """
+        if len(empties) <= self.FAST_PATH_EMPTIES:
+            return self.search_last(board, color, empties, alpha, beta)
+        return self.search(board, color, empties, alpha, beta)[1]
+
+    def search_last(self, board: Board, color: Color, empties: List[int], alpha: int, beta: int) -> int:
+        """
+        Search the last few empties by trying to play on each of them directly.
+
+        `make_move` leaves the board untouched for an illegal square, so no move list is built.
+
+        Args:
+            board (Board): The current game board.
+            color (Color): The color of the current player.
+            empties (List[int]): The square indices of the empty squares.
+            alpha (int): Alpha value for alpha-beta pruning.
+            beta (int): Beta value for alpha-beta pruning.
+
+        Returns:
+            int: The score for `color`.
+        """
+        self.nodes += 1
+        if not empties:
+            return self.final_score(board, color)
+
+        opponent = Color.WHITE if color == Color.BLACK else Color.BLACK
+        best_score = None
+        for square in empties:
+            if not board.make_move(Point.from_square(square), color):
+                continue
+            score = -self.search_last(board, opponent, [empty for empty in empties if empty != square], -beta, -alpha)
+            board.undo()
+
+            if best_score is None or score > best_score:
+                best_score = score
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        if best_score is None:
+            # No move: pass if the opponent can play, otherwise the game is over
+            if not any(board.is_legal_move(Point.from_square(square), opponent) for square in empties):
+                return self.final_score(board, color)
+            return -self.search_last(board, opponent, empties, -beta, -alpha)
+
+        return best_score
+
+    def order_moves(self, board: Board, color: Color, legal_moves: List[Point], empties: List[int]) -> List[Point]:
+        """
+        Order moves fastest-first, then by parity.
+
+        Fastest-first tries the moves that leave the opponent the fewest replies first, which finds
+        cutoffs early in the narrow endgame tree. Parity prefers quadrants with an odd number of
+        empties, where the player to move can hope to take the last square.
+
+        Args:
+            board (Board): The current game board.
+            color (Color): The color to move.
+            legal_moves (List[Point]): The legal moves.
+            empties (List[int]): The square indices of the empty squares.
+
+        Returns:
+            List[Point]: The ordered moves.
+        """
+        odd_quadrants = 0
+        for square in empties:
+            odd_quadrants ^= 1 << QUADRANTS[square]
+
+        def even_parity(move: Point) -> bool:
+            return not odd_quadrants >> QUADRANTS[square_index(move.x, move.y)] & 1
+
+        if len(empties) <= self.FASTEST_FIRST_EMPTIES:
+            return sorted(legal_moves, key=even_parity)
+
+        opponent = Color.WHITE if color == Color.BLACK else Color.BLACK
+        keys = {}
+        for move in legal_moves:
+            board.make_move(move, color)
+            keys[move] = (len(board.cached_legal_moves(opponent)), even_parity(move))
+            board.undo()
+
+        return sorted(legal_moves, key=keys.__getitem__)
+
+    @staticmethod
+    def final_score(board: Board, color: Color) -> int:
+        opponent = Color.WHITE if color == Color.BLACK else Color.BLACK
+        return board.get_points_for_color(color) - board.get_points_for_color(opponent)
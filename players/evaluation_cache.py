@@ -0,0 +1,122 @@
+from game.board import Board
+from game.enums import Color
+
+from collections import OrderedDict
+from typing import Callable, Dict, List, Tuple
+
+
+class EvaluationCache:
+    """
+    A least-recently-used cache of heuristic evaluations.
+
+    Entries are keyed by the Zobrist key of the discs, the color evaluated for and the names of
+    the heuristics summed, so players with different heuristics can share one cache. Once the
+    cache is full, the entry used least recently is evicted. `shared` returns one cache per
+    process for all heuristic-driven players.
+    """
+
+    # Approximate CPython footprint of one entry: the ordered dict node, the key tuple and the value
+    ENTRY_BYTES: int = 240
+
+    _shared: 'EvaluationCache' = None
+    # The sorted names of every heuristic list seen, so keys are built without sorting
+    _heuristic_sets: Dict[Tuple[Callable, ...], Tuple[str, ...]] = {}
+
+    def __init__(self, max_memory_mb: float = 16):
+        """
+        Initialize an empty evaluation cache.
+
+        Args:
+            max_memory_mb (float): The memory cap for the stored entries, in megabytes.
+        """
+        self.max_memory_mb = max_memory_mb
+        self.capacity: int = max(1, int(max_memory_mb * 1024 * 1024) // EvaluationCache.ENTRY_BYTES)
+        self.clear()
+
+    @staticmethod
+    def shared() -> 'EvaluationCache':
+        """
+        Get the cache shared by every player in this process, creating it on first use.
+        """
+        if EvaluationCache._shared is None:
+            EvaluationCache._shared = EvaluationCache()
+        return EvaluationCache._shared
+
+    def clear(self):
+        """
+        Remove every entry and reset the counters.
+        """
+        self.entries: OrderedDict = OrderedDict()
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.probes: int = 0
+        self.hits: int = 0
+        self.evictions: int = 0
+
+    def evaluate(self, board: Board, heuristics: List[Callable[[Board, Color], int]], color: Color) -> int:
+        """
+        Get `board.evaluate(heuristics, color)`, computing it only if it is not cached.
+
+        Args:
+            board (Board): The position to evaluate.
+            heuristics (List[Callable[[Board, Color], int]]): The heuristic functions to sum.
+            color (Color): The color for which the heuristics are calculated.
+
+        Returns:
+            int: The summed heuristic value.
+        """
+        key = EvaluationCache.key(board, heuristics, color)
+        entries = self.entries
+
+        self.probes += 1
+        value = entries.get(key)
+        if value is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            return value
+
+        value = board.evaluate(heuristics, color)
+        entries[key] = value
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    @staticmethod
+    def key(board: Board, heuristics: List[Callable[[Board, Color], int]], color: Color) -> Tuple[int, Color, Tuple[str, ...]]:
+        """
+        Get the cache key of an evaluation.
+
+        Heuristics only look at the discs, so the side to move is left out of the position key.
+        The names are sorted because the sum does not depend on their order.
+
+        Returns:
+            Tuple[int, Color, Tuple[str, ...]]: The disc key, the color and the sorted heuristic names.
+        """
+        functions = tuple(heuristics)
+        names = EvaluationCache._heuristic_sets.get(functions)
+        if names is None:
+            names = EvaluationCache._heuristic_sets[functions] = tuple(sorted(heuristic.__name__ for heuristic in heuristics))
+        return board.position_key(Color.BLACK), color, names
+
+    def stats(self) -> dict:
+        """
+        Get the cache counters.
+
+        Returns:
+            dict: The probes, hits, hit rate and evictions since the last reset.
+        """
+        return {
+            'probes': self.probes,
+            'hits': self.hits,
+            'hit_rate': round(self.hits / self.probes, 3) if self.probes else 0.0,
+            'evictions': self.evictions,
+        }
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __str__(self):
+        stats = ', '.join(f'{name}: {value}' for name, value in self.stats().items())
+        return f'EvaluationCache ({len(self)}/{self.capacity} entries, {stats})'
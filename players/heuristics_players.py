@@ -1,6 +1,7 @@
 from game.enums import Color
 from game.board import Board
 from game.point import Point
+from players.evaluation_cache import EvaluationCache
 from players.player import Player
 
 import copy
@@ -8,15 +9,21 @@ from typing import List
 
 class HeuristicPlayer(Player):
 
-    def __init__(self, color: Color, heuristic_names: List[str] = ['square_heuristic', 'mobility_heuristic']):
+    def __init__(self, color: Color, heuristic_names: List[str] = ['square_heuristic', 'mobility_heuristic'], batch: bool = False,
+                 evaluation_cache: bool = False):
         """
         Initialize a HeuristicPlayer instance.
 
         Args:
             color (Color): The player's color.
             heuristic_names (List[str]): The heuristic function to use.
+            batch (bool): Whether to score all candidate moves in one vectorized call (requires NumPy).
+            evaluation_cache (bool): Look evaluations up in the `EvaluationCache` shared by the players in this process.
         """
+        self.heuristic_names = heuristic_names
         self.heuristics: List[function] = [ getattr(Board, name) if hasattr(Board, name) else None for name in heuristic_names ]
+        self.batch = batch
+        self.evaluation_cache = EvaluationCache.shared() if evaluation_cache else None
         super().__init__(color)
 
     def play(self, board: Board) -> Point:
@@ -31,15 +38,47 @@ class HeuristicPlayer(Player):
         """
         legal_moves = board.get_legal_moves(self.color)
 
+        if self.batch:
+            return self.play_batch(board, legal_moves)
+
         current_best = float('-inf')
         best_move: Point = None
         for move in legal_moves:
             board_copy = copy.deepcopy(board)
             board_copy.place_and_flip_discs(move, self.color)
             # heuristic_values = {str(heuristic.__name__): heuristic(board_copy, self.color) for heuristic in self.heuristics}
-            heuristic_value: int = sum(heuristic(board_copy, self.color) for heuristic in self.heuristics)
+            if self.evaluation_cache is not None:
+                heuristic_value: int = self.evaluation_cache.evaluate(board_copy, self.heuristics, self.color)
+            else:
+                heuristic_value: int = board_copy.evaluate(self.heuristics, self.color)
             if current_best < heuristic_value:
                 current_best = heuristic_value
                 best_move = move
 
-        return best_move
\ No newline at end of file
+        return best_move
+
+    def play_batch(self, board: Board, legal_moves: List[Point]) -> Point:
+        """
+        Score every legal move with a single vectorized heuristic evaluation.
+
+        Args:
+            board (Board): The current game board.
+            legal_moves (List[Point]): The legal moves to choose from.
+
+        Returns:
+            Point: The best move according to the specified heuristic.
+        """
+        # Imported here so NumPy is only needed by players that ask for batch evaluation
+        from game.batch_heuristics import batch_evaluate, pack_bitboards
+
+        if not legal_moves:
+            return None
+
+        children = []
+        for move in legal_moves:
+            board.make_move(move, self.color)
+            children.append(board.get_bitboards())
+            board.undo()
+
+        scores = batch_evaluate(pack_bitboards(children), self.color, self.heuristic_names)
+        return legal_moves[int(scores.argmax())]
@@ -1,52 +1,233 @@
 from __future__ import annotations  # Import this line
 
 from game.board import Board
+from game.bitboard import BitBoard
 from game.enums import Color
 from game.point import Point
+from players.opening_book import OpeningBook
 from players.player import Player
+from players.rollout import RolloutEngine
 
-import copy
-import random
+from concurrent.futures import ProcessPoolExecutor
+import math
+import threading
 from time import perf_counter
-from typing import List
+from typing import List, Tuple
 class MCTSPlayer(Player):
+    """
+    A Monte Carlo tree search player using UCT.
 
-    def __init__(self, color:Color, iterations: int = 1000):
+    Every iteration walks down the tree from the root, choosing children by their upper
+    confidence bound, adds one new child to the tree, plays a random game out from it and
+    backs the result up along the path. The tree holds no boards: each iteration replays its
+    path on a single working board and undoes it afterwards, so memory grows by one small
+    node per iteration.
+    """
+
+    # `winner_heuristic` scores a win as 100; the confidence bounds work on a [-1, 1] scale
+    SCORE_SCALE: int = 100
+
+    def __init__(self, color:Color, iterations: int = 1000, opening_book: OpeningBook = None, exploration: float = 1.4,
+                 seed: int = None, reuse_tree: bool = True, workers: int = 1, time_limit: float = None):
+        """
+        Initialize an MCTS player.
+
+        Args:
+            color (Color): The color of the player.
+            iterations (int): The number of tree iterations (and random games) per move, unless `time_limit` is set.
+            opening_book (OpeningBook, optional): A book of opening moves, played without searching when the position is in it.
+            exploration (float): The exploration constant of the upper confidence bound; higher values widen the tree.
+            seed (int, optional): Seed for the random playouts and expansion order, for reproducible searches.
+            reuse_tree (bool): Whether to keep the subtree of the position after the opponent's reply for the next move.
+            workers (int): Worker processes for root-parallel search. Above 1, `play` runs an independent search
+                in each worker and merges their root statistics (see `parallel_search`); the tree is then not kept
+                between moves.
+            time_limit (float, optional): Seconds per move. If set, the search runs until the time is up instead
+                of for a fixed number of iterations.
+        """
         super().__init__(color)
         self.iterations = iterations
+        self.opening_book = opening_book
+        self.exploration = exploration
+        self.rollout_engine = RolloutEngine(seed)
+        self.reuse_tree = reuse_tree
+        self.tree: MCTSNode = None # The node after our last move, with the working board at its position
+        self.workers = workers
+        self.executor: ProcessPoolExecutor = None # Started on the first parallel search
+        # Everything a worker process needs to build its own copy of this player
+        self.worker_settings = {'iterations': iterations, 'exploration': exploration, 'reuse_tree': False,
+                                'time_limit': time_limit}
+        self.time_limit = time_limit
+        self.iterations_run: int = 0 # Iterations run by the last call to play(), over all workers
+        self.ponder_thread: threading.Thread = None # Grows the kept tree on the opponent's time (see `start_pondering`)
+        self.ponder_stop = threading.Event()
+        self.ponder_iterations: int = 0 # Iterations run by the current or last pondering
+
+    def mcts(self, root_node: MCTSNode) -> int:
+        """
+        Run iterations of selection, expansion, simulation and backpropagation.
+
+        The search runs `iterations` iterations, or until `time_limit` seconds have passed if it is
+        set. A timed search stops early once the most visited root move can no longer be overtaken
+        in the iterations that the rate so far leaves time for.
+
+        Args:
+            root_node (MCTSNode): The root, whose `state` is the working board. The board is restored afterwards.
+
+        Returns:
+            int: The number of iterations run.
+        """
+        board = root_node.state
+        if root_node.untried_moves is None:
+            root_node.untried_moves = self.shuffled_moves(board, root_node.color)
+
+        start = perf_counter()
+        deadline = start + self.time_limit if self.time_limit is not None else None
+        iterations = 0
+
+        while True:
+            if deadline is None:
+                if iterations >= self.iterations:
+                    break
+            else:
+                now = perf_counter()
+                if now >= deadline:
+                    break
+                if iterations and self.decided(root_node, (deadline - now) * iterations / (now - start)):
+                    break
+
+            self.iterate(root_node, board)
+            iterations += 1
+
+        return iterations
+
+    def iterate(self, root_node: MCTSNode, board: Board):
+        """
+        Run one iteration of selection, expansion, simulation and backpropagation.
+
+        Args:
+            root_node (MCTSNode): The root of the tree.
+            board (Board): The working board at the root's position, restored afterwards.
+        """
+        node = root_node
+        moves = 0
+
+        # Selection: descend through fully expanded nodes
+        while not node.untried_moves and node.children:
+            node = self.select_child(node)
+            board.make_move(node.move, node.parent.color)
+            moves += 1
+
+        # Expansion: add one untried move to the tree
+        if node.untried_moves:
+            node = self.expand(node, board)
+            moves += 1
+
+        # Simulation
+        score = self.rollout(board, node.color)
+
+        # Backpropagation
+        self.backpropagate(node, score)
+
+        for _ in range(moves):
+            board.undo()
+
+    @staticmethod
+    def decided(root_node: MCTSNode, remaining: float) -> bool:
+        """
+        Check whether the most visited root move stays the most visited whatever the remaining iterations do.
 
-    def mcts(self, root_node: MCTSNode):
-        for _ in range(self.iterations):
-            # Selection Phase (skipped)
-            
-            # Randomly choose a precomputed child node for exploration
-            selected_child = random.choice(root_node.children)
-            
-            # Expansion Phase (skipped)
-
-            # Simulation Phase
-            score = self.simulate(selected_child)
-
-            # Backpropagation Phase
-            self.backpropagate(selected_child, score)
-
-    def simulate(self, node: MCTSNode) -> int:
-        # Simulate a full game from the selected child node (board state)
-        board_copy = copy.deepcopy(node.state)
-        current_color = node.color
-        
-        while not board_copy.is_game_over():
-            legal_moves = board_copy.get_legal_moves(current_color)
-
-            if legal_moves:
-                random_move = random.choice(legal_moves)
-                board_copy.place_and_flip_discs(random_move, current_color)
-            
-            # Switch to the other player
-            current_color = Color.BLACK if current_color == Color.WHITE else Color.WHITE
-
-        # Game is over, determine the winner relative to the original player (self.color)
-        return board_copy.winner_heuristic(self.color)
+        Args:
+            root_node (MCTSNode): The root of the search.
+            remaining (float): The number of iterations left.
+
+        Returns:
+            bool: True if no other move can catch up with the most visited one.
+        """
+        best = second = 0
+        for child in root_node.children:
+            if child.visits > best:
+                best, second = child.visits, best
+            elif child.visits > second:
+                second = child.visits
+        return best - second > remaining
+
+    def select_child(self, node: MCTSNode) -> MCTSNode:
+        """
+        Choose the child with the highest upper confidence bound (UCB1) for the player to move at `node`.
+
+        Args:
+            node (MCTSNode): A node whose moves have all been expanded.
+
+        Returns:
+            MCTSNode: The child to descend into.
+        """
+        log_visits = math.log(node.visits)
+        exploration = self.exploration
+        scale = self.SCORE_SCALE
+        best_child, best_bound = None, float('-inf')
+
+        for child in node.children:
+            # Child values are from the point of view of the color to move at the child
+            mean = child.value / (child.visits * scale)
+            if child.color != node.color:
+                mean = -mean
+            bound = mean + exploration * math.sqrt(log_visits / child.visits)
+            if bound > best_bound:
+                best_child, best_bound = child, bound
+
+        return best_child
+
+    def expand(self, node: MCTSNode, board: Board) -> MCTSNode:
+        """
+        Play one of a node's untried moves on the board and add the position it reaches as a child.
+
+        Args:
+            node (MCTSNode): The node to expand; `board` must be at its position.
+            board (Board): The working board, left at the new child's position.
+
+        Returns:
+            MCTSNode: The new child.
+        """
+        move = node.untried_moves.pop()
+        board.make_move(move, node.color)
+
+        # The opponent moves next unless it has to pass
+        opponent = Color.WHITE if node.color == Color.BLACK else Color.BLACK
+        next_color = opponent if board.cached_legal_moves(opponent) or not board.cached_legal_moves(node.color) else node.color
+
+        child = MCTSNode(None, next_color, move)
+        child.parent = node
+        child.untried_moves = self.shuffled_moves(board, next_color)
+        node.children.append(child)
+        return child
+
+    def shuffled_moves(self, board: Board, color: Color) -> List[Point]:
+        moves = list(board.get_legal_moves(color))
+        self.rollout_engine.rng.shuffle(moves)
+        return moves
+
+    def rollout(self, board: Board, color: Color) -> int:
+        """
+        Play a random game out from a position with the rollout engine, leaving the board unchanged.
+
+        Args:
+            board (Board): The position to play out from.
+            color (Color): The color to move.
+
+        Returns:
+            int: The `winner_heuristic` of the final position for this player.
+        """
+        black, white = board.get_bitboards()
+        difference = self.rollout_engine.play(black, white, color)
+        if not difference:
+            return 0
+        return self.SCORE_SCALE if (difference > 0) == (self.color == Color.BLACK) else -self.SCORE_SCALE
+
+    def simulate(self, node: MCTSNode, board: Board = None) -> int:
+        # Simulate a full game from the node's position, leaving the board unchanged. Only the root
+        # keeps its board, so other nodes need the working board replayed to their position
+        return self.rollout(board if board is not None else node.state, node.color)
 
     def backpropagate(self, node: MCTSNode, score: int):
         # Update the score for the selected child node and its ancestors
@@ -60,46 +241,230 @@ class MCTSPlayer(Player):
                 current.value -= score  # Opponent's move, so negative score for us
             current = current.parent
 
-    def select_best_move(self, root_node: MCTSNode):
+    def best_child(self, root_node: MCTSNode) -> MCTSNode:
         if not root_node.children: # No moves
-            return None  
-        
-        # Select child with highest average value (value/visits)
-        best_child = max(root_node.children, key=lambda child: child.value / max(child.visits, 1))
-        return best_child.move
+            return None
+
+        def mean(child: MCTSNode) -> float:
+            # Child values are from the point of view of the color to move at the child
+            value = child.value / max(child.visits, 1)
+            return value if child.color == root_node.color else -value
+
+        # The most visited child is the most robust choice; ties go to the higher average value for the root's color
+        return max(root_node.children, key=lambda child: (child.visits, mean(child)))
+
+    def select_best_move(self, root_node: MCTSNode):
+        best_child = self.best_child(root_node)
+        return best_child.move if best_child is not None else None
+
+    def reused_root(self, board: Board) -> MCTSNode:
+        """
+        Find the node of the current position in the tree kept from the last move.
+
+        The kept tree starts at the position after our last move. If the opponent's reply is one of
+        its children (or the opponent had to pass), that node becomes the new root, keeping its
+        statistics; everything else is dropped.
+
+        Args:
+            board (Board): The current position.
+
+        Returns:
+            MCTSNode: The new root with the working board at its position, or None if the position is not in the tree.
+        """
+        tree, self.tree = self.tree, None
+        if tree is None:
+            return None
+
+        working_board = tree.state
+        position = board.get_bitboards()
+        if tree.color == self.color: # The opponent passed
+            return tree if working_board.get_bitboards() == position else None
+
+        for child in tree.children:
+            working_board.make_move(child.move, tree.color)
+            if working_board.get_bitboards() == position:
+                if child.color != self.color: # We have to pass, which `play` never searches
+                    return None
+                child.state, child.parent = working_board, None
+                return child
+            working_board.undo()
+
+        return None
+
+    def parallel_search(self, board: Board) -> Point:
+        """
+        Run an independent search in each of `workers` processes and merge their root statistics.
+
+        Every worker builds its own tree from the position with a different seed. The visits and
+        values of each root move are summed over the workers, and the move is chosen from the
+        merged root as in a single search.
+
+        Args:
+            board (Board): The current game board state.
+
+        Returns:
+            Point: The best move, or None without legal moves.
+        """
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                initargs=(self.color, self.worker_settings))
+
+        rows = [list(row) for row in board.grid]
+        seeds = [self.rollout_engine.rng.getrandbits(32) for _ in range(self.workers)]
+        futures = [self.executor.submit(_search_root, rows, seed) for seed in seeds]
+
+        root_node = MCTSNode(None, self.color)
+        children = {}
+        for future in futures:
+            iterations, statistics = future.result()
+            self.iterations_run += iterations
+            for move, color, visits, value in statistics:
+                if move not in children:
+                    children[move] = MCTSNode(None, color, move)
+                    children[move].parent = root_node
+                    root_node.children.append(children[move])
+                child = children[move]
+                child.visits += visits
+                child.value += value
+                root_node.visits += visits
+
+        return self.select_best_move(root_node)
+
+    def start_pondering(self, board: Board):
+        """
+        Grow the kept tree in a background thread while the opponent thinks.
+
+        Every reply of the opponent gets iterations, and the reply actually played becomes the
+        root of the next search with the visits gathered here (see `reused_root`). The thread
+        shares the interpreter with this process, so an opponent searching in the same process
+        runs slower while this player ponders. Without a kept tree (tree reuse off, root-parallel
+        search, or a book or forced move) there is nothing to grow and this does nothing.
+
+        Args:
+            board (Board): The position after this player's move, with the opponent to move.
+        """
+        self.stop_pondering()
+        tree = self.tree
+        if tree is None or tree.state.get_bitboards() != board.get_bitboards() or tree.state.is_game_over():
+            return
+
+        self.ponder_stop.clear()
+        self.ponder_iterations = 0
+        self.ponder_thread = threading.Thread(target=self.ponder, args=(tree,), daemon=True)
+        self.ponder_thread.start()
+
+    def ponder(self, tree: MCTSNode):
+        # Run iterations on the kept tree until `stop_pondering` is called
+        board = tree.state
+        if tree.untried_moves is None:
+            tree.untried_moves = self.shuffled_moves(board, tree.color)
+        while not self.ponder_stop.is_set():
+            self.iterate(tree, board)
+            self.ponder_iterations += 1
+
+    def stop_pondering(self) -> int:
+        """
+        Stop pondering, leaving the grown tree for the next move.
+
+        Returns:
+            int: The number of iterations run while pondering.
+        """
+        if self.ponder_thread is None:
+            return 0
+
+        self.ponder_stop.set()
+        self.ponder_thread.join()
+        self.ponder_thread = None
+        return self.ponder_iterations
+
+    def close(self):
+        """
+        Stop pondering and shut down the worker processes of the parallel search, if they were started.
+        """
+        self.stop_pondering()
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
 
     def play(self, board: Board) -> Point:
-        # Initialize the root node with the current game state
-        root_node = MCTSNode(board, self.color)
-
-        # Create child nodes for all legal moves
-        for move in root_node.state.get_legal_moves(root_node.color):
-            board_copy = copy.deepcopy(root_node.state)
-            board_copy.place_and_flip_discs(move, root_node.color)
-            opponent_color = Color.BLACK if root_node.color == Color.WHITE else Color.WHITE
-            child_node = MCTSNode(board_copy, opponent_color, move)
-            child_node.parent = root_node
-            root_node.children.append(child_node)
-
-        # Run MCTS for a specified number of iterations
-        self.mcts(root_node)
-
-        # Select the best move based on child node statistics
-        best_move = self.select_best_move(root_node)
-
-        # Return the move associated with the best child node
-        return best_move
+        # The pondering thread must not touch the tree while it is searched
+        self.stop_pondering()
+        self.iterations_run = 0
+        if self.opening_book is not None:
+            book_move = self.opening_book.lookup(board, self.color)
+            if book_move is not None:
+                self.tree = None
+                return book_move
+
+        legal_moves = board.get_legal_moves(self.color)
+        if len(legal_moves) <= 1:
+            self.tree = None
+            return legal_moves[0] if legal_moves else None
+
+        if self.workers > 1:
+            self.tree = None
+            move = self.parallel_search(board)
+            # Without a single iteration in any worker there is nothing to choose from
+            return move if move is not None else legal_moves[0]
+
+        root_node = self.reused_root(board) if self.reuse_tree else None
+        if root_node is None:
+            # Search on a bitboard copy of the position so the caller's board is never touched
+            working_board = BitBoard()
+            working_board.grid = board.grid
+            root_node = MCTSNode(working_board, self.color)
+
+        self.iterations_run = self.mcts(root_node)
+
+        best_child = self.best_child(root_node)
+        if best_child is None:
+            # No iteration ran, so fall back to a legal move and start a new tree next time
+            self.tree = None
+            return legal_moves[0]
+
+        if self.reuse_tree:
+            # Keep only the subtree of our move; the rest of the tree is freed with the old root
+            root_node.state.make_move(best_child.move, self.color)
+            best_child.state, best_child.parent = root_node.state, None
+            self.tree = best_child
+
+        return best_child.move
 class MCTSNode:
+    __slots__ = ('state', 'color', 'move', 'children', 'visits', 'value', 'parent', 'untried_moves')
 
     def __init__(self, state: Board, color: Color, move: Point = None):
-        self.state = state
-        self.color = color
-        self.move = move
+        self.state = state # Only the root keeps a board; other nodes are reached by replaying moves
+        self.color = color # The color to move at this node
+        self.move = move # The move that led here from the parent
         self.children: List[MCTSNode] = []
         self.visits: int = 0
-        self.value: int = 0
+        self.value: int = 0 # Sum of the results, from the point of view of `color`
         self.parent: MCTSNode = None
+        self.untried_moves: List[Point] = None # Legal moves not yet expanded, set when the node joins the tree
 
     def __str__(self):
-        return self.state.__str__()
+        if self.state is not None:
+            return self.state.__str__()
+        return f'{self.move}: {self.visits} visits, value {self.value} for {self.color.name.title()}'
+
+
+# The search of a root-parallel worker process, set up once per process by `_init_worker`
+_worker_player: MCTSPlayer = None
+
+
+def _init_worker(color: Color, settings: dict):
+    global _worker_player
+    _worker_player = MCTSPlayer(color, **settings)
+
+
+def _search_root(rows: List[List[str]], seed: int) -> Tuple[int, List[Tuple[Point, Color, int, int]]]:
+    # Search a position in a worker process and return the number of iterations run, and the
+    # move, color to move, visits and value of every root child
+    player = _worker_player
+    player.rollout_engine.rng.seed(seed)
+    board = BitBoard()
+    board.grid = rows
 
+    root_node = MCTSNode(board, player.color)
+    iterations = player.mcts(root_node)
+    return iterations, [(child.move, child.color, child.visits, child.value) for child in root_node.children]
@@ -1,10 +1,19 @@
 from game.enums import Color
 from game.board import Board
 from game.point import Point
+from players.endgame_solver import EndgameSolver
+from players.evaluation_cache import EvaluationCache
+from players.opening_book import OpeningBook
 from players.player import Player
+from players.probcut import ProbCut
+from players.search import MoveOrdering, SearchTimeout
+from players.transposition_table import Bound, TranspositionTable
 
-import random
-from typing import List
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import List, Tuple, Type
 
 
 class OptimizedMiniMaxPlayer(Player):
@@ -13,7 +22,17 @@ class OptimizedMiniMaxPlayer(Player):
     for significantly better performance.
     """
 
-    def __init__(self, color: Color, heuristic_names: List[str] = ['square_heuristic', 'mobility_heuristic'], max_depth: int = 4):
+    # Half-width of the first aspiration window around the previous iteration's score
+    ASPIRATION_WINDOW: int = 8
+    # Late move reductions: the first moves at a node and nodes near the leaves are never reduced
+    LMR_FULL_DEPTH_MOVES: int = 3
+    LMR_MIN_DEPTH: int = 3
+
+    def __init__(self, color: Color, heuristic_names: List[str] = ['square_heuristic', 'mobility_heuristic'], max_depth: int = 4,
+                 transposition_table_mb: float = 0, time_limit: float = None, pvs: bool = False,
+                 dynamic_ordering: bool = False, endgame_empties: int = 0, endgame_win_loss_draw: bool = False,
+                 workers: int = 1, opening_book: OpeningBook = None, evaluation_cache: bool = False,
+                 probcut: ProbCut = None, late_move_reductions: bool = False):
         """
         Initialize an optimized MiniMax player.
 
@@ -21,10 +40,54 @@ class OptimizedMiniMaxPlayer(Player):
             color (Color): The color of the player.
             heuristic_names (List[str]): The names of the heuristic functions to use.
             max_depth (int): The maximum depth to search in the MiniMax algorithm.
+            transposition_table_mb (float): Memory cap of the transposition table in megabytes (0 disables it).
+            time_limit (float, optional): Seconds per move. If set, `play` deepens iteratively until
+                the time runs out instead of searching to `max_depth`.
+            pvs (bool): Search with negamax and principal variation search instead of minimax,
+                using aspiration windows between iterative deepening iterations.
+            dynamic_ordering (bool): Order moves with killer moves and a history table learned from
+                earlier cutoffs, kept for the whole game, on top of the static corner/edge ordering.
+            endgame_empties (int): Solve the game exactly instead of searching once this many or fewer
+                squares are empty (0 disables the endgame solver).
+            endgame_win_loss_draw (bool): Only solve for win/loss/draw, which is much faster than the exact disc difference.
+            workers (int): Worker processes for the fixed-depth search. Above 1, `play` splits the root moves
+                across a process pool (see `parallel_search`); time-limited searches stay serial.
+            opening_book (OpeningBook, optional): A book of opening moves, played without searching when the position is in it.
+            evaluation_cache (bool): Look leaf evaluations up in the `EvaluationCache` shared by the players in this process.
+            probcut (ProbCut, optional): Calibrated ProbCut parameters. With `pvs`, nodes whose shallow search predicts a
+                score outside the window are pruned without searching them to full depth.
+            late_move_reductions (bool): With `pvs`, search moves late in the move order at a reduced depth first,
+                searching them to full depth only if the reduced search beats alpha (see `late_move_reduction`).
         """
         self.heuristic_names = heuristic_names
         self.heuristics: List[function] = [getattr(Board, name) if hasattr(Board, name) else None for name in heuristic_names]
         self.max_depth = max_depth
+        self.transposition_table = TranspositionTable(transposition_table_mb) if transposition_table_mb > 0 else None
+        self.time_limit = time_limit
+        self.pvs = pvs
+        self.move_ordering = MoveOrdering() if dynamic_ordering else None
+        self.endgame_empties = endgame_empties
+        self.endgame_solver = EndgameSolver(endgame_win_loss_draw) if endgame_empties > 0 else None
+        self.workers = workers
+        self.opening_book = opening_book
+        self.evaluation_cache = EvaluationCache.shared() if evaluation_cache else None
+        self.probcut = probcut
+        self.root_depth: int = None # Depth of the current root search, which ProbCut never prunes
+        self.late_move_reductions = late_move_reductions
+        self.executor: ProcessPoolExecutor = None # Started on the first parallel search
+        self.shared_alpha = None
+        self.ponder_executor: ProcessPoolExecutor = None # Started on the first call to start_pondering
+        self.ponder_stop = None
+        self.ponder_future = None
+        self.stop_event = None # Set by another process to stop this player's search (see `start_pondering`)
+        # Everything a worker process needs to build its own copy of this player
+        self.worker_settings = {'heuristic_names': heuristic_names, 'max_depth': max_depth, 'pvs': pvs,
+                                'transposition_table_mb': transposition_table_mb, 'dynamic_ordering': dynamic_ordering,
+                                'evaluation_cache': evaluation_cache, 'probcut': probcut,
+                                'late_move_reductions': late_move_reductions}
+        self.deadline: float = None
+        self.nodes: int = 0 # Nodes visited by the last call to play()
+        self.completed_depth: int = 0 # Deepest search completed by the last call to play()
         super().__init__(color)
 
     def play(self, board: Board) -> Point:
@@ -37,12 +100,189 @@ class OptimizedMiniMaxPlayer(Player):
         Returns:
             Point: The best move to play.
         """
+        self.nodes = 0
+        if self.opening_book is not None:
+            move = self.opening_book.lookup(board, self.color)
+            if move is not None:
+                self.completed_depth = 0
+                return move
+
+        if self.endgame_solver is not None and board.get_points_for_color(Color.EMPTY) <= self.endgame_empties:
+            move, score = self.endgame_solver.solve(board, self.color)
+            self.nodes = self.endgame_solver.nodes
+            self.completed_depth = board.get_points_for_color(Color.EMPTY)
+            return move
+
+        if self.move_ordering is not None:
+            self.move_ordering.age()
+
+        if self.time_limit is not None:
+            return self.iterative_deepening(board, self.time_limit)
+
+        if self.workers > 1:
+            move, score = self.parallel_search(board, self.max_depth)
+            self.completed_depth = self.max_depth
+            return move
+
+        if self.pvs:
+            # Deepening to max_depth seeds the aspiration windows and the move ordering
+            return self.iterative_deepening(board, None, self.max_depth)
+
         move, score = self.minimax_optimized(board, self.color, self.max_depth, 
                                            float('-inf'), float('inf'), True)
+        self.completed_depth = self.max_depth
         return move
 
+    def parallel_search(self, board: Board, depth: int) -> Tuple[Point, float]:
+        """
+        Search the root moves in parallel across `workers` processes.
+
+        The first move in static order is searched alone; every other move is then handed to
+        the pool with the best score found so far, shared between the workers, as its alpha.
+        The alpha is lowered by one so that moves tying with the best are still scored exactly
+        and the tie goes to the earlier move, which makes the result independent of timing:
+        the first move in `get_ordered_legal_moves` order with the highest score, the same move
+        the serial fixed-depth search picks.
+
+        Args:
+            board (Board): The current game board state.
+            depth (int): The search depth.
+
+        Returns:
+            Tuple[Point, float]: The best move and its score, or (None, None) without legal moves.
+        """
+        legal_moves = board.get_ordered_legal_moves(self.color)
+        if not legal_moves:
+            return None, None
+
+        if self.executor is None:
+            self.shared_alpha = multiprocessing.Value('d', float('-inf'))
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                initargs=(self.color, self.worker_settings, self.shared_alpha))
+
+        self.shared_alpha.value = float('-inf')
+        rows = [list(row) for row in board.grid]
+
+        # Search the first move alone so that every other move starts with its score as alpha
+        futures = [self.executor.submit(_search_root_move, type(board), rows, legal_moves[0], depth)]
+        futures[0].result()
+        futures += [self.executor.submit(_search_root_move, type(board), rows, move, depth) for move in legal_moves[1:]]
+
+        best_move, best_score = None, float('-inf')
+        for move, future in zip(legal_moves, futures):
+            score, nodes = future.result()
+            self.nodes += nodes
+            if score > best_score:
+                best_move, best_score = move, score
+
+        return best_move, best_score
+
+    def start_pondering(self, board: Board):
+        """
+        Search the opponent's replies in a background process while the opponent thinks.
+
+        The predicted reply (the move this player's own search expects) is searched first, then
+        every other reply, one depth at a time. `stop_pondering` copies the transposition table the
+        background search filled into this player's table, so the next search starts from it.
+        Without a transposition table there is nothing to carry over and this does nothing.
+
+        Args:
+            board (Board): The position after this player's move, with the opponent to move.
+        """
+        if self.transposition_table is None:
+            return
+
+        if self.ponder_executor is None:
+            self.ponder_stop = multiprocessing.Event()
+            self.ponder_executor = ProcessPoolExecutor(max_workers=1, initializer=_init_worker,
+                                                       initargs=(self.color, self.worker_settings, None, self.ponder_stop))
+
+        opposite_color = Color.WHITE if self.color == Color.BLACK else Color.BLACK
+        entry = self.transposition_table.probe(board.position_key(opposite_color))
+        predicted_reply = entry.move if entry is not None else None
+
+        self.ponder_stop.clear()
+        self.ponder_future = self.ponder_executor.submit(_ponder, type(board), [list(row) for row in board.grid],
+                                                         predicted_reply)
+
+    def stop_pondering(self) -> int:
+        """
+        Stop pondering and merge what it found into the transposition table.
+
+        Returns:
+            int: The number of transposition table entries merged.
+        """
+        if self.ponder_future is None:
+            return 0
+
+        self.ponder_stop.set()
+        entries = self.ponder_future.result()
+        self.ponder_future = None
+
+        for entry in entries:
+            self.transposition_table.store(entry.key, entry.depth, entry.score, entry.bound, entry.move)
+        return len(entries)
+
+    def close(self):
+        """
+        Shut down the worker processes of the parallel search and pondering, if any were started.
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        if self.ponder_executor is not None:
+            self.stop_pondering()
+            self.ponder_executor.shutdown()
+            self.ponder_executor = None
+
+    def iterative_deepening(self, board: Board, time_limit: float, max_depth: int = None) -> Point:
+        """
+        Search depth 1, 2, 3... until the time limit runs out or `max_depth` is searched.
+
+        Each iteration searches the previous iteration's best move first. When the deadline
+        passes mid-iteration, that iteration is abandoned and the best move of the deepest
+        completed one is returned.
+
+        Args:
+            board (Board): The current game board state.
+            time_limit (float): The time budget in seconds, or None for no limit.
+            max_depth (int, optional): The deepest iteration. Defaults to the number of empty squares.
+
+        Returns:
+            Point: The best move found, or None if there are no legal moves.
+        """
+        self.deadline = perf_counter() + time_limit if time_limit is not None else None
+        self.completed_depth = 0
+        best_move, score = None, None
+
+        # Searching deeper than the number of empty squares cannot change the result
+        empties = max(1, board.get_points_for_color(Color.EMPTY))
+        max_depth = min(max_depth, empties) if max_depth is not None else empties
+
+        try:
+            for depth in range(1, max_depth + 1):
+                if self.pvs:
+                    move, score = self.aspiration_search(board, depth, score, first_move=best_move)
+                else:
+                    move, score = self.minimax_optimized(board, self.color, depth, float('-inf'), float('inf'), True,
+                                                         first_move=best_move)
+                best_move = move
+                self.completed_depth = depth
+        except SearchTimeout:
+            pass
+        finally:
+            self.deadline = None
+
+        if best_move is None:
+            # Not even depth 1 finished: fall back to the best statically ordered move
+            legal_moves = board.get_ordered_legal_moves(self.color)
+            best_move = legal_moves[0] if legal_moves else None
+
+        return best_move
+
     def minimax_optimized(self, board: Board, color: Color, depth: int, 
-                         alpha: float, beta: float, maximizing_player: bool = True) -> tuple[Point, float]:
+                         alpha: float, beta: float, maximizing_player: bool = True,
+                         first_move: Point = None) -> tuple[Point, float]:
         """
         Optimized MiniMax search using move/undo instead of deep copying.
 
@@ -53,17 +293,77 @@ class OptimizedMiniMaxPlayer(Player):
             alpha (float): Alpha value for alpha-beta pruning.
             beta (float): Beta value for alpha-beta pruning.
             maximizing_player (bool): Whether this is the maximizing player's turn.
+            first_move (Point, optional): A move to search first when the transposition table has none.
 
         Returns:
             Tuple[Point, float]: The best move and its score.
+
+        Raises:
+            SearchTimeout: If the deadline set by `iterative_deepening` has passed.
         """
+        self.nodes += 1
+
+        if self.deadline is not None and perf_counter() >= self.deadline:
+            raise SearchTimeout()
+        if self.stop_event is not None and not self.nodes & 1023 and self.stop_event.is_set():
+            raise SearchTimeout()
+
         if depth == 0 or board.is_game_over():
             if board.is_game_over():
                 return None, board.winner_heuristic(self.color)
             else:
-                heuristic_value = sum(heuristic(board, self.color) for heuristic in self.heuristics)
+                heuristic_value = self.evaluate(board)
                 return None, heuristic_value
 
+        table = self.transposition_table
+        table_move = first_move
+        if table is not None:
+            key = board.position_key(color)
+            alpha_original, beta_original = alpha, beta
+            entry = table.probe(key)
+            if entry is not None:
+                if entry.move is not None:
+                    table_move = entry.move
+                if entry.depth >= depth:
+                    if entry.bound == Bound.EXACT:
+                        return entry.move, entry.score
+                    if entry.bound == Bound.LOWER:
+                        alpha = max(alpha, entry.score)
+                    else:
+                        beta = min(beta, entry.score)
+                    if beta <= alpha:
+                        return entry.move, entry.score
+
+        best_move, best_score = self.search_moves(board, color, depth, alpha, beta, maximizing_player, table_move)
+
+        if table is not None:
+            if best_score <= alpha_original:
+                bound = Bound.UPPER
+            elif best_score >= beta_original:
+                bound = Bound.LOWER
+            else:
+                bound = Bound.EXACT
+            table.store(key, depth, best_score, bound, best_move)
+
+        return best_move, best_score
+
+    def search_moves(self, board: Board, color: Color, depth: int, alpha: float, beta: float,
+                     maximizing_player: bool, first_move: Point = None) -> tuple[Point, float]:
+        """
+        Search every legal move of a position that is not a leaf.
+
+        Args:
+            board (Board): The current game board.
+            color (Color): The color of the current player.
+            depth (int): The remaining search depth.
+            alpha (float): Alpha value for alpha-beta pruning.
+            beta (float): Beta value for alpha-beta pruning.
+            maximizing_player (bool): Whether this is the maximizing player's turn.
+            first_move (Point, optional): A move to search before the others, e.g. from the transposition table.
+
+        Returns:
+            Tuple[Point, float]: The best move and its score.
+        """
         legal_moves = board.get_ordered_legal_moves(color)
         
         # If no legal moves, skip to opponent
@@ -72,6 +372,14 @@ class OptimizedMiniMaxPlayer(Player):
             _, score = self.minimax_optimized(board, opposite_color, depth - 1, alpha, beta, not maximizing_player)
             return None, score
 
+        ordering = self.move_ordering
+        if ordering is not None:
+            empties = board.get_points_for_color(Color.EMPTY)
+            ordering.order(legal_moves, color, empties, first_move)
+        elif first_move is not None and first_move in legal_moves:
+            legal_moves.remove(first_move)
+            legal_moves.insert(0, first_move)
+
         best_move = None
         
         if maximizing_player:
@@ -79,23 +387,25 @@ class OptimizedMiniMaxPlayer(Player):
             
             for move in legal_moves:
                 # Make move
-                flipped_discs = board.make_move(move, color)
+                board.make_move(move, color)
                 
-                # Recursive call
+                # Recursive call, undoing the move even if the search times out
                 opposite_color = Color.WHITE if color == Color.BLACK else Color.BLACK
-                _, eval_score = self.minimax_optimized(board, opposite_color, depth - 1, alpha, beta, False)
-                
-                # Undo move
-                board.undo_move(move, color, flipped_discs)
+                try:
+                    _, eval_score = self.minimax_optimized(board, opposite_color, depth - 1, alpha, beta, False)
+                finally:
+                    board.undo()
                 
+                # Ties keep the earlier move, so the result does not depend on chance and a later
+                # move that only fails low to the same bound never replaces it
                 if eval_score > max_eval:
                     max_eval = eval_score
                     best_move = move
-                elif eval_score == max_eval and random.random() < 0.5:
-                    best_move = move
                 
                 alpha = max(alpha, eval_score)
                 if beta <= alpha:
+                    if ordering is not None:
+                        ordering.record_cutoff(move, color, empties, depth)
                     break  # Alpha-beta pruning
                     
             return best_move, max_eval
@@ -104,23 +414,305 @@ class OptimizedMiniMaxPlayer(Player):
             
             for move in legal_moves:
                 # Make move
-                flipped_discs = board.make_move(move, color)
+                board.make_move(move, color)
                 
-                # Recursive call
+                # Recursive call, undoing the move even if the search times out
                 opposite_color = Color.WHITE if color == Color.BLACK else Color.BLACK
-                _, eval_score = self.minimax_optimized(board, opposite_color, depth - 1, alpha, beta, True)
-                
-                # Undo move
-                board.undo_move(move, color, flipped_discs)
+                try:
+                    _, eval_score = self.minimax_optimized(board, opposite_color, depth - 1, alpha, beta, True)
+                finally:
+                    board.undo()
                 
                 if eval_score < min_eval:
                     min_eval = eval_score
                     best_move = move
-                elif eval_score == min_eval and random.random() < 0.5:
-                    best_move = move
                 
                 beta = min(beta, eval_score)
                 if beta <= alpha:
+                    if ordering is not None:
+                        ordering.record_cutoff(move, color, empties, depth)
                     break  # Alpha-beta pruning
                     
-            return best_move, min_eval
\ No newline at end of file
+            return best_move, min_eval
+
+    def aspiration_search(self, board: Board, depth: int, guess: float, first_move: Point = None) -> tuple[Point, float]:
+        """
+        Search the root with a narrow window around an expected score, widening it on failure.
+
+        Args:
+            board (Board): The current game board.
+            depth (int): The search depth.
+            guess (float): The expected score, e.g. from the previous iteration, or None for a full window.
+            first_move (Point, optional): A move to search first when the transposition table has none.
+
+        Returns:
+            Tuple[Point, float]: The best move and its score.
+        """
+        self.root_depth = depth
+        if guess is None or abs(guess) == float('inf'):
+            return self.negamax(board, self.color, depth, float('-inf'), float('inf'), first_move)
+
+        window = self.ASPIRATION_WINDOW
+        alpha, beta = guess - window, guess + window
+        while True:
+            move, score = self.negamax(board, self.color, depth, alpha, beta, first_move)
+            if alpha < score < beta:
+                return move, score
+
+            # The score fell outside the window: it is only a bound, so search again with a wider one
+            window *= 2
+            if score <= alpha:
+                alpha = score - window
+            else:
+                beta = score + window
+            first_move = move or first_move
+
+    def negamax(self, board: Board, color: Color, depth: int, alpha: float, beta: float,
+                first_move: Point = None) -> tuple[Point, float]:
+        """
+        Negamax search with principal variation search.
+
+        Scores are from the point of view of `color`. The first move is searched with the full
+        window; every other move is first searched with a null window to prove it is no better,
+        and only re-searched with the full window if that proof fails.
+
+        Args:
+            board (Board): The current game board.
+            color (Color): The color of the current player.
+            depth (int): The remaining search depth.
+            alpha (float): Alpha value for alpha-beta pruning.
+            beta (float): Beta value for alpha-beta pruning.
+            first_move (Point, optional): A move to search first when the transposition table has none.
+
+        Returns:
+            Tuple[Point, float]: The best move and its score.
+
+        Raises:
+            SearchTimeout: If the deadline set by `iterative_deepening` has passed.
+        """
+        self.nodes += 1
+
+        if self.deadline is not None and perf_counter() >= self.deadline:
+            raise SearchTimeout()
+        if self.stop_event is not None and not self.nodes & 1023 and self.stop_event.is_set():
+            raise SearchTimeout()
+
+        if depth == 0 or board.is_game_over():
+            sign = 1 if color == self.color else -1
+            if board.is_game_over():
+                return None, sign * board.winner_heuristic(self.color)
+            return None, sign * self.evaluate(board)
+
+        table = self.transposition_table
+        table_move = first_move
+        if table is not None:
+            key = board.position_key(color)
+            alpha_original, beta_original = alpha, beta
+            entry = table.probe(key)
+            if entry is not None:
+                if entry.move is not None:
+                    table_move = entry.move
+                if entry.depth >= depth:
+                    if entry.bound == Bound.EXACT:
+                        return entry.move, entry.score
+                    if entry.bound == Bound.LOWER:
+                        alpha = max(alpha, entry.score)
+                    else:
+                        beta = min(beta, entry.score)
+                    if beta <= alpha:
+                        return entry.move, entry.score
+
+        if self.probcut is not None and depth != self.root_depth:
+            score = self.probcut_search(board, color, depth, alpha, beta)
+            if score is not None:
+                if table is not None:
+                    table.store(key, depth, score, Bound.LOWER if score >= beta else Bound.UPPER, table_move)
+                return table_move, score
+
+        opposite_color = Color.WHITE if color == Color.BLACK else Color.BLACK
+        legal_moves = board.get_ordered_legal_moves(color)
+        best_move, best_score = None, float('-inf')
+
+        if not legal_moves:
+            # If no legal moves, skip to opponent
+            _, score = self.negamax(board, opposite_color, depth - 1, -beta, -alpha)
+            best_score = -score
+        else:
+            ordering = self.move_ordering
+            if ordering is not None:
+                empties = board.get_points_for_color(Color.EMPTY)
+                ordering.order(legal_moves, color, empties, table_move)
+            elif table_move is not None and table_move in legal_moves:
+                legal_moves.remove(table_move)
+                legal_moves.insert(0, table_move)
+
+            for index, move in enumerate(legal_moves):
+                board.make_move(move, color)
+                try:
+                    if index == 0:
+                        score = -self.negamax(board, opposite_color, depth - 1, -beta, -alpha)[1]
+                    else:
+                        # Scores are integers, so a window of width one proves `score <= alpha`
+                        reduction = self.late_move_reduction(depth, index) if self.late_move_reductions else 0
+                        score = -self.negamax(board, opposite_color, depth - 1 - reduction, -alpha - 1, -alpha)[1]
+                        if reduction and score > alpha:
+                            # The reduced search could not prove the move worse: verify at full depth
+                            score = -self.negamax(board, opposite_color, depth - 1, -alpha - 1, -alpha)[1]
+                        if alpha < score < beta:
+                            score = -self.negamax(board, opposite_color, depth - 1, -beta, -alpha)[1]
+                finally:
+                    board.undo()
+
+                if score > best_score:
+                    best_move, best_score = move, score
+                alpha = max(alpha, score)
+                if alpha >= beta:
+                    if ordering is not None:
+                        ordering.record_cutoff(move, color, empties, depth)
+                    break
+
+        if table is not None:
+            if best_score <= alpha_original:
+                bound = Bound.UPPER
+            elif best_score >= beta_original:
+                bound = Bound.LOWER
+            else:
+                bound = Bound.EXACT
+            table.store(key, depth, best_score, bound, best_move)
+
+        return best_move, best_score
+
+    def late_move_reduction(self, depth: int, index: int) -> int:
+        """
+        Get how many plies to reduce the null-window search of a move by.
+
+        The first `LMR_FULL_DEPTH_MOVES` moves in the move order are never reduced, nor are
+        nodes with less than `LMR_MIN_DEPTH` plies left. Later moves lose one ply, and two once
+        both the depth and the move index are large.
+
+        Args:
+            depth (int): The remaining depth at the node.
+            index (int): The position of the move in the move order.
+
+        Returns:
+            int: The number of plies to reduce by.
+        """
+        if depth < self.LMR_MIN_DEPTH or index < self.LMR_FULL_DEPTH_MOVES:
+            return 0
+        return 2 if depth >= 6 and index >= 2 * self.LMR_FULL_DEPTH_MOVES else 1
+
+    def probcut_search(self, board: Board, color: Color, depth: int, alpha: float, beta: float) -> float:
+        """
+        Try to prune a node with the ProbCut cuts calibrated for its depth.
+
+        For each cut, the deep score is predicted as `a * shallow + b`. A null-window search at
+        the shallow depth checks whether the prediction clears beta, or stays under alpha, by
+        `threshold` standard deviations of the prediction error. Only the side of the window
+        the static evaluation lies on is tested. Nodes with an infinite bound are never pruned.
+
+        Args:
+            board (Board): The current game board.
+            color (Color): The color of the current player.
+            depth (int): The remaining search depth.
+            alpha (float): Alpha value for alpha-beta pruning.
+            beta (float): Beta value for alpha-beta pruning.
+
+        Returns:
+            float: Beta or alpha if the node can be pruned as failing high or low, otherwise None.
+        """
+        cuts = self.probcut.cuts.get(depth)
+        if not cuts or abs(alpha) == float('inf') or abs(beta) == float('inf'):
+            return None
+
+        # A fail high is only likely above beta and a fail low below alpha, so one shallow search per cut is enough
+        static = self.evaluate(board) if color == self.color else -self.evaluate(board)
+        threshold = self.probcut.threshold
+        for cut in cuts:
+            margin = threshold * cut.sigma
+            if static >= beta:
+                bound = math.ceil((beta + margin - cut.b) / cut.a)
+                if self.negamax(board, color, cut.shallow_depth, bound - 1, bound)[1] >= bound:
+                    return beta
+            elif static <= alpha:
+                bound = math.floor((alpha - margin - cut.b) / cut.a)
+                if self.negamax(board, color, cut.shallow_depth, bound, bound + 1)[1] <= bound:
+                    return alpha
+        return None
+
+    def evaluate(self, board: Board) -> int:
+        """
+        Evaluate a leaf for this player with its heuristics, through the evaluation cache if enabled.
+        """
+        if self.evaluation_cache is not None:
+            return self.evaluation_cache.evaluate(board, self.heuristics, self.color)
+        return board.evaluate(self.heuristics, self.color)
+
+
+# State of a parallel search or pondering worker process, set up once per process by `_init_worker`
+_worker_player: OptimizedMiniMaxPlayer = None
+_worker_alpha = None
+
+
+def _init_worker(color: Color, settings: dict, shared_alpha, stop_event=None):
+    global _worker_player, _worker_alpha
+    _worker_player = OptimizedMiniMaxPlayer(color, **settings)
+    _worker_player.stop_event = stop_event
+    _worker_alpha = shared_alpha
+
+
+def _search_root_move(board_type: Type[Board], rows: List[List[str]], move: Point, depth: int) -> Tuple[float, int]:
+    # Score one root move in a worker process. Returns the score, an upper bound below the
+    # shared best if the move fails low, and the number of nodes searched.
+    player = _worker_player
+    player.nodes = 0
+    board = board_type()
+    board.grid = rows
+
+    alpha = _worker_alpha.value - 1
+    opposite_color = Color.WHITE if player.color == Color.BLACK else Color.BLACK
+    board.make_move(move, player.color)
+    if player.pvs:
+        score = -player.negamax(board, opposite_color, depth - 1, float('-inf'), -alpha)[1]
+    else:
+        _, score = player.minimax_optimized(board, opposite_color, depth - 1, alpha, float('inf'), False)
+
+    with _worker_alpha.get_lock():
+        if score > _worker_alpha.value:
+            _worker_alpha.value = score
+
+    return score, player.nodes
+
+
+def _ponder(board_type: Type[Board], rows: List[List[str]], predicted_reply: Point) -> list:
+    # Deepen over the opponent's replies until the stop event is set, then hand back the
+    # transposition table entries found
+    player = _worker_player
+    table = player.transposition_table
+    table.clear()
+    board = board_type()
+    board.grid = rows
+
+    opposite_color = Color.WHITE if player.color == Color.BLACK else Color.BLACK
+    replies = board.get_ordered_legal_moves(opposite_color)
+    if predicted_reply in replies:
+        replies.remove(predicted_reply)
+        replies.insert(0, predicted_reply)
+
+    try:
+        for depth in range(1, board.get_points_for_color(Color.EMPTY) + 1):
+            # If the opponent has to pass, this player is on the move again in the same position
+            for reply in replies or [None]:
+                if reply is not None:
+                    board.make_move(reply, opposite_color)
+                try:
+                    if player.pvs:
+                        player.negamax(board, player.color, depth, float('-inf'), float('inf'))
+                    else:
+                        player.minimax_optimized(board, player.color, depth, float('-inf'), float('inf'), True)
+                finally:
+                    if reply is not None:
+                        board.undo()
+    except SearchTimeout:
+        pass
+
+    return [entry for entry in table.depth_preferred + table.always_replace if entry is not None]
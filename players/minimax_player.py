@@ -2,14 +2,18 @@ from game.enums import Color
 from game.board import Board
 from game.point import Point
 from players.player import Player
+from players.evaluation_cache import EvaluationCache
+from players.search import SearchTimeout
 
 import random
 import copy
+from time import perf_counter
 from typing import List
 
 class MiniMaxPlayer(Player):
 
-    def __init__(self, color: Color, heuristic_names: List[str] = ['square_heuristic', 'mobility_heuristic'], max_depth:int = 2):
+    def __init__(self, color: Color, heuristic_names: List[str] = ['square_heuristic', 'mobility_heuristic'], max_depth:int = 2,
+                 time_limit: float = None, evaluation_cache: bool = False):
         """
         A player class implementing the MiniMax algorithm with heuristic evaluation.
 
@@ -18,10 +22,17 @@ class MiniMaxPlayer(Player):
             heuristic_names (List[str]): The names of the heuristic functions to use.
             max_depth (int): The maximum depth to search in the MiniMax algorithm.
             heuristics (function): The heuristic functions to evaluate board states.
+            time_limit (float): Seconds per move. If set, `play` deepens iteratively until the
+                time runs out instead of searching to `max_depth`.
+            evaluation_cache (bool): Look leaf evaluations up in the `EvaluationCache` shared by the players in this process.
         """
         self.heuristic_names = heuristic_names
         self.heuristics: List[function] = [ getattr(Board, name) if hasattr(Board, name) else None for name in heuristic_names ]
         self.max_depth = max_depth
+        self.time_limit = time_limit
+        self.deadline: float = None
+        self.completed_depth: int = 0
+        self.evaluation_cache = EvaluationCache.shared() if evaluation_cache else None
         super().__init__(color)
 
     def play(self, board: Board) -> Point:
@@ -34,12 +45,56 @@ class MiniMaxPlayer(Player):
         Returns:
             Point: The best move to play based on MiniMax and heuristics.
         """
+        if self.time_limit is not None:
+            return self.iterative_deepening(board, self.time_limit)
+
         move, score = self.minimax_with_alpha_beta(board, self.color, self.max_depth, self.heuristics, 
                                                   float('-inf'), float('inf'), True)
+        self.completed_depth = self.max_depth
         return move
 
+    def iterative_deepening(self, board: Board, time_limit: float) -> Point:
+        """
+        Search depth 1, 2, 3... until the time limit runs out.
+
+        Each iteration searches the previous iteration's best move first. When the deadline
+        passes mid-iteration, the best move of the deepest completed iteration is returned.
+
+        Args:
+            board (Board): The current game board state.
+            time_limit (float): The time budget in seconds.
+
+        Returns:
+            Point: The best move found, or None if there are no legal moves.
+        """
+        self.deadline = perf_counter() + time_limit
+        self.completed_depth = 0
+        best_move = None
+
+        # Searching deeper than the number of empty squares cannot change the result
+        max_depth = max(1, board.get_points_for_color(Color.EMPTY))
+
+        try:
+            for depth in range(1, max_depth + 1):
+                move, score = self.minimax_with_alpha_beta(board, self.color, depth, self.heuristics,
+                                                          float('-inf'), float('inf'), True, first_move=best_move)
+                best_move = move
+                self.completed_depth = depth
+        except SearchTimeout:
+            pass
+        finally:
+            self.deadline = None
+
+        if best_move is None:
+            # Not even depth 1 finished: fall back to the best statically ordered move
+            legal_moves = board.get_ordered_legal_moves(self.color)
+            best_move = legal_moves[0] if legal_moves else None
+
+        return best_move
+
     def minimax_with_alpha_beta(self, board: Board, color: Color, depth: int, heuristics, 
-                               alpha: float, beta: float, maximizing_player: bool = True) -> tuple[Point, float]:
+                               alpha: float, beta: float, maximizing_player: bool = True,
+                               first_move: Point = None) -> tuple[Point, float]:
         """
         Perform MiniMax search with alpha-beta pruning for better performance.
 
@@ -51,15 +106,24 @@ class MiniMaxPlayer(Player):
             alpha (float): The alpha value for alpha-beta pruning.
             beta (float): The beta value for alpha-beta pruning.
             maximizing_player (bool): Whether this is the maximizing player's turn.
+            first_move (Point, optional): A move to search before the others.
 
         Returns:
             Tuple[Point, float]: The best move and its associated score.
+
+        Raises:
+            SearchTimeout: If the deadline set by `iterative_deepening` has passed.
         """ 
+        if self.deadline is not None and perf_counter() >= self.deadline:
+            raise SearchTimeout()
+
         if depth == 0 or board.is_game_over():
             if board.is_game_over():
                 return None, board.winner_heuristic(self.color)
+            elif self.evaluation_cache is not None:
+                return None, self.evaluation_cache.evaluate(board, heuristics, self.color)
             else:
-                heuristic_value = sum(heuristic(board, self.color) for heuristic in heuristics)
+                heuristic_value = board.evaluate(heuristics, self.color)
                 return None, heuristic_value
 
         legal_moves = board.get_ordered_legal_moves(color)
@@ -71,6 +135,10 @@ class MiniMaxPlayer(Player):
                                                    alpha, beta, not maximizing_player)
             return None, score
 
+        if first_move is not None and first_move in legal_moves:
+            legal_moves.remove(first_move)
+            legal_moves.insert(0, first_move)
+
         best_move = None
         
         if maximizing_player:
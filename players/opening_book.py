@@ -0,0 +1,177 @@
+from game.board import Board, INVERSE_SYMMETRY, square_index, transform_point
+from game.bitboard import BitBoard
+from game.enums import Color
+from game.point import Point
+
+import copy
+import struct
+from typing import Dict, List, Optional, Type
+
+
+class OpeningBook:
+    """
+    Best moves for the positions of the first few plies, found once by a deep search.
+
+    Entries are keyed by `Board.canonical_key`, so each opening is stored once for all 8
+    rotations and reflections of the board, and the move is stored in canonical coordinates
+    and mapped back on lookup.
+
+    The file format is a header (`HEADER`: magic, plies, search depth, entry count) followed by
+    one `RECORD` per position: the 64-bit key and the square index of the move, sorted by key.
+    """
+
+    MAGIC: bytes = b'OBK1'
+    HEADER: struct.Struct = struct.Struct('<4sHHI')
+    RECORD: struct.Struct = struct.Struct('<QB')
+
+    def __init__(self, moves: Dict[int, int] = None, plies: int = 0, depth: int = 0):
+        """
+        Initialize an opening book.
+
+        Args:
+            moves (Dict[int, int], optional): The square index of the best move, by canonical position key.
+            plies (int): The number of plies from the start the book covers.
+            depth (int): The search depth the moves were found with.
+        """
+        self.moves: Dict[int, int] = moves if moves is not None else {}
+        self.plies = plies
+        self.depth = depth
+
+    def lookup(self, board: Board, color: Color) -> Optional[Point]:
+        """
+        Get the book move for a position.
+
+        Args:
+            board (Board): The current game board.
+            color (Color): The color to move.
+
+        Returns:
+            Optional[Point]: The book move, or None if the position is not in the book.
+        """
+        if not self.moves:
+            return None
+
+        key, transform = board.canonical_key(color)
+        square = self.moves.get(key)
+        if square is None:
+            return None
+
+        move = transform_point(Point.from_square(square), INVERSE_SYMMETRY[transform])
+        # A key collision must never make a player play an illegal move
+        return move if board.is_legal_move(move, color) else None
+
+    def add(self, board: Board, color: Color, move: Point):
+        """
+        Store the best move for a position.
+
+        Args:
+            board (Board): The position.
+            color (Color): The color to move.
+            move (Point): The best move.
+        """
+        key, transform = board.canonical_key(color)
+        canonical_move = transform_point(move, transform)
+        self.moves[key] = square_index(canonical_move.x, canonical_move.y)
+
+    @staticmethod
+    def build(plies: int = 6, depth: int = 6, heuristic_names: List[str] = ['square_heuristic', 'mobility_heuristic'],
+              board_type: Type[Board] = BitBoard, show: bool = False) -> 'OpeningBook':
+        """
+        Search every position of the first `plies` plies and record the best move of each.
+
+        Every reply is expanded, not just the book moves, so the book covers any opponent.
+        Positions that are symmetric to one already searched are skipped.
+
+        Args:
+            plies (int, optional): The number of plies to expand from the start (default is 6).
+            depth (int, optional): The search depth for every position (default is 6).
+            heuristic_names (List[str], optional): The heuristics for the search.
+            board_type (Type[Board], optional): The board engine to search with (default is BitBoard).
+            show (bool, optional): Whether to print progress per ply (default is False).
+
+        Returns:
+            OpeningBook: The new book.
+        """
+        # Imported here because the player checks the book before searching
+        from players.minimax_optimized_player import OptimizedMiniMaxPlayer
+
+        book = OpeningBook(plies=plies, depth=depth)
+        players = {color: OptimizedMiniMaxPlayer(color, heuristic_names, max_depth=depth, transposition_table_mb=16, pvs=True)
+                   for color in (Color.BLACK, Color.WHITE)}
+
+        frontier = [(board_type(), Color.BLACK)]
+        for ply in range(plies):
+            next_frontier, seen = [], set()
+            for board, color in frontier:
+                opponent = Color.WHITE if color == Color.BLACK else Color.BLACK
+                legal_moves = board.get_legal_moves(color)
+                if not legal_moves:
+                    if board.get_legal_moves(opponent):
+                        next_frontier.append((board, opponent))
+                    continue
+
+                book.add(board, color, players[color].play(board))
+
+                for move in legal_moves:
+                    child = copy.deepcopy(board)
+                    child.make_move(move, color)
+                    key = child.canonical_key(opponent)[0]
+                    if key not in seen:
+                        seen.add(key)
+                        next_frontier.append((child, opponent))
+
+            if show:
+                print(f'Ply {ply + 1}: {len(frontier)} positions searched, {len(book.moves)} book entries')
+            frontier = next_frontier
+
+        return book
+
+    def save(self, path: str):
+        """
+        Write the book to a binary file.
+
+        Args:
+            path (str): The file to write.
+        """
+        with open(path, 'wb') as file:
+            file.write(OpeningBook.HEADER.pack(OpeningBook.MAGIC, self.plies, self.depth, len(self.moves)))
+            for key in sorted(self.moves):
+                file.write(OpeningBook.RECORD.pack(key, self.moves[key]))
+
+    @staticmethod
+    def load(path: str) -> 'OpeningBook':
+        """
+        Read a book written by `save`.
+
+        Args:
+            path (str): The file to read.
+
+        Returns:
+            OpeningBook: The loaded book.
+
+        Raises:
+            ValueError: If the file is not an opening book.
+        """
+        with open(path, 'rb') as file:
+            data = file.read()
+
+        if len(data) < OpeningBook.HEADER.size:
+            raise ValueError(f'{path} is not an opening book')
+        magic, plies, depth, count = OpeningBook.HEADER.unpack_from(data)
+        if magic != OpeningBook.MAGIC or len(data) != OpeningBook.HEADER.size + count * OpeningBook.RECORD.size:
+            raise ValueError(f'{path} is not an opening book')
+
+        moves = dict(OpeningBook.RECORD.iter_unpack(data[OpeningBook.HEADER.size:]))
+        return OpeningBook(moves, plies, depth)
+
+    def __len__(self):
+        return len(self.moves)
+
+    def __str__(self):
+        return f'OpeningBook ({len(self)} positions, {self.plies} plies at depth {self.depth})'
+
+
+if __name__ == "__main__":
+    book = OpeningBook.build(plies=6, depth=6, show=True)
+    book.save('opening_book.bin')
+    print(book)
@@ -38,6 +38,23 @@ class Player:
             except:
                 continue
 
+    def start_pondering(self, board: Board):
+        """
+        Start thinking in the background while the opponent is on the move.
+
+        Players that cannot ponder ignore this.
+
+        Args:
+            board (Board): The position after this player's move, with the opponent to move.
+        """
+        pass
+
+    def stop_pondering(self):
+        """
+        Stop the background thinking started by `start_pondering`, keeping what it found for the next move.
+        """
+        pass
+
     def __str__(self):
         """
         Get a string representation of the player.
@@ -0,0 +1,189 @@
+from game.bitboard import BitBoard
+from game.board import Board
+from game.enums import Color
+
+import json
+import math
+import random
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+
+class Cut(NamedTuple):
+    depth: int # The depth of the search being predicted
+    shallow_depth: int # The depth of the search that predicts it
+    a: float # Slope of the fitted line `deep score ~ a * shallow score + b`
+    b: float # Intercept of the fitted line
+    sigma: float # Standard deviation of the deep scores around the line
+
+
+class ProbCut:
+    """
+    Parameters for ProbCut forward pruning, fitted from self-play positions.
+
+    For each calibrated depth, a deep search score is predicted from a shallow search by a
+    fitted line, and the error of that prediction is assumed to be normal with standard
+    deviation `sigma`. A node is pruned when a shallow null-window search shows that the deep
+    score lies outside the (alpha, beta) window with a margin of `threshold` sigmas. Several
+    cuts per depth (Multi-ProbCut) are tried in order, cheapest first.
+    """
+
+    # (deep, shallow) depth pairs fitted by `calibrate` by default
+    DEFAULT_PAIRS: Tuple[Tuple[int, int], ...] = ((3, 1), (4, 2), (5, 1), (5, 3), (6, 2), (6, 4), (7, 3), (8, 4))
+
+    def __init__(self, cuts: Sequence[Cut] = (), threshold: float = 1.0, heuristic_names: List[str] = None):
+        """
+        Initialize ProbCut parameters.
+
+        Args:
+            cuts (Sequence[Cut]): The fitted cuts.
+            threshold (float): How many standard deviations outside the window the prediction must fall to prune.
+                Lower values prune more and search deeper, at a higher risk of pruning the best move.
+            heuristic_names (List[str], optional): The heuristics the cuts were fitted for.
+        """
+        self.threshold = threshold
+        self.heuristic_names = heuristic_names
+        self.cuts: Dict[int, List[Cut]] = {}
+        for cut in sorted(cuts, key=lambda cut: (cut.depth, cut.shallow_depth)):
+            self.cuts.setdefault(cut.depth, []).append(cut)
+
+    @staticmethod
+    def fit(pairs: List[Tuple[float, float]]) -> Tuple[float, float, float]:
+        """
+        Fit `deep ~ a * shallow + b` by least squares.
+
+        Args:
+            pairs (List[Tuple[float, float]]): The (shallow, deep) scores of each position.
+
+        Returns:
+            Tuple[float, float, float]: The slope, the intercept and the standard deviation of the residuals.
+        """
+        count = len(pairs)
+        mean_x = sum(x for x, _ in pairs) / count
+        mean_y = sum(y for _, y in pairs) / count
+        variance = sum((x - mean_x) ** 2 for x, _ in pairs)
+        covariance = sum((x - mean_x) * (y - mean_y) for x, y in pairs)
+
+        a = covariance / variance if variance else 0.0
+        b = mean_y - a * mean_x
+        sigma = math.sqrt(sum((y - a * x - b) ** 2 for x, y in pairs) / count)
+        return a, b, sigma
+
+    @staticmethod
+    def self_play_positions(games: int = 8, random_moves: int = 8, depth: int = 2, sample_every: int = 8, seed: int = 0,
+                            heuristic_names: List[str] = ['square_heuristic', 'mobility_heuristic']) -> List[Tuple[Board, Color]]:
+        """
+        Collect midgame positions from a few self-play games.
+
+        Each game opens with random moves so that the games differ, then both sides play a shallow search.
+
+        Args:
+            games (int, optional): The number of games (default is 8).
+            random_moves (int, optional): The random moves at the start of each game (default is 8).
+            depth (int, optional): The search depth of the players (default is 2).
+            sample_every (int, optional): Keep one position out of every this many moves (default is 8).
+            seed (int, optional): The random seed for the opening moves (default is 0).
+            heuristic_names (List[str], optional): The heuristics of the players.
+
+        Returns:
+            List[Tuple[Board, Color]]: The positions and the color to move in each.
+        """
+        from players.minimax_optimized_player import OptimizedMiniMaxPlayer
+
+        rng = random.Random(seed)
+        players = {color: OptimizedMiniMaxPlayer(color, heuristic_names, max_depth=depth, transposition_table_mb=4, pvs=True)
+                   for color in (Color.BLACK, Color.WHITE)}
+        positions = []
+
+        for _ in range(games):
+            board, color, ply = BitBoard(), Color.BLACK, 0
+            while not board.is_game_over():
+                legal_moves = board.get_legal_moves(color)
+                if legal_moves:
+                    if ply >= random_moves and (ply - random_moves) % sample_every == 0:
+                        position = BitBoard()
+                        position.grid = board.grid
+                        positions.append((position, color))
+                    move = players[color].play(board) if ply >= random_moves else rng.choice(legal_moves)
+                    board.make_move(move, color)
+                    ply += 1
+                color = Color.WHITE if color == Color.BLACK else Color.BLACK
+
+        return positions
+
+    @staticmethod
+    def calibrate(positions: List[Tuple[Board, Color]] = None, pairs: Sequence[Tuple[int, int]] = DEFAULT_PAIRS,
+                  heuristic_names: List[str] = ['square_heuristic', 'mobility_heuristic'], threshold: float = 1.0,
+                  show: bool = False) -> 'ProbCut':
+        """
+        Fit a cut for every (deep, shallow) depth pair from full-window searches of the same positions.
+
+        Args:
+            positions (List[Tuple[Board, Color]], optional): The positions to search (default is `self_play_positions()`).
+            pairs (Sequence[Tuple[int, int]], optional): The (deep, shallow) depth pairs to fit.
+            heuristic_names (List[str], optional): The heuristics to fit the cuts for.
+            threshold (float, optional): The pruning threshold of the returned parameters (default is 1.0).
+            show (bool, optional): Whether to print each fitted cut (default is False).
+
+        Returns:
+            ProbCut: The fitted parameters. Pairs whose scores are not positively correlated are left out.
+        """
+        from players.minimax_optimized_player import OptimizedMiniMaxPlayer
+
+        positions = positions if positions is not None else ProbCut.self_play_positions(heuristic_names=heuristic_names)
+        depths = sorted({depth for pair in pairs for depth in pair})
+        scores: Dict[int, List[float]] = {depth: [] for depth in depths}
+
+        for board, color in positions:
+            player = OptimizedMiniMaxPlayer(color, heuristic_names, transposition_table_mb=4, pvs=True)
+            for depth in depths:
+                scores[depth].append(player.negamax(board, color, depth, float('-inf'), float('inf'))[1])
+
+        cuts = []
+        for depth, shallow_depth in pairs:
+            a, b, sigma = ProbCut.fit(list(zip(scores[shallow_depth], scores[depth])))
+            if show:
+                print(f'\tdepth {depth} from {shallow_depth}: deep = {a:.3f} * shallow + {b:.2f}, sigma = {sigma:.2f}')
+            if a > 0:
+                cuts.append(Cut(depth, shallow_depth, a, b, sigma))
+
+        return ProbCut(cuts, threshold, heuristic_names)
+
+    def save(self, path: str):
+        """
+        Write the parameters to a JSON file.
+
+        Args:
+            path (str): The file to write.
+        """
+        with open(path, 'w') as file:
+            json.dump({
+                'threshold': self.threshold,
+                'heuristic_names': self.heuristic_names,
+                'cuts': [cut._asdict() for cuts in self.cuts.values() for cut in cuts],
+            }, file, indent=4)
+
+    @staticmethod
+    def load(path: str) -> 'ProbCut':
+        """
+        Read parameters written by `save`.
+
+        Args:
+            path (str): The file to read.
+
+        Returns:
+            ProbCut: The loaded parameters.
+        """
+        with open(path) as file:
+            data = json.load(file)
+        return ProbCut([Cut(**cut) for cut in data['cuts']], data['threshold'], data.get('heuristic_names'))
+
+    def __str__(self):
+        cuts = ', '.join(f'{cut.depth}<-{cut.shallow_depth}' for cuts in self.cuts.values() for cut in cuts)
+        return f'ProbCut (threshold {self.threshold}, cuts {cuts})'
+
+
+if __name__ == "__main__":
+    print("Calibrating ProbCut from self-play positions:")
+    probcut = ProbCut.calibrate(show=True)
+    probcut.save('probcut.json')
+    print(probcut)
@@ -0,0 +1,99 @@
+from game.bitboard import FULL, NOT_Y0, NOT_Y7, SHIFTS
+from game.enums import Color
+
+import random
+
+# The (shift, mask) pairs of `SHIFTS` split by direction, so the playout loop needs no sign test
+_LEFT = tuple((shift, mask) for shift, mask in SHIFTS if shift > 0)
+_RIGHT = tuple((-shift, mask) for shift, mask in SHIFTS if shift < 0)
+
+
+class RolloutEngine:
+    """
+    Plays random games to the end on two 64-bit integers.
+
+    A playout never builds a board, a Point or a move list. Each ply draws random squares
+    from the empty squares next to an opponent disc until one flips something, which is a
+    uniform pick among the legal moves without generating them all, and flipping is a couple
+    of integer operations, so the only objects created are Python ints. A side with no move
+    passes, and the game ends when neither color can move.
+    """
+
+    def __init__(self, seed: int = None):
+        """
+        Initialize a rollout engine.
+
+        Args:
+            seed (int, optional): The seed of the engine's random number generator (default is unseeded).
+        """
+        self.rng = random.Random(seed)
+        self.playouts: int = 0 # Games played since creation
+
+    def play(self, black: int, white: int, color: Color) -> int:
+        """
+        Play random moves from a position until neither color can move.
+
+        Args:
+            black (int): The black discs.
+            white (int): The white discs.
+            color (Color): The color to move.
+
+        Returns:
+            int: The final disc difference, black minus white.
+        """
+        self.playouts += 1
+        randrange = self.rng.randrange
+        own, opp = (black, white) if color == Color.BLACK else (white, black)
+        black_to_move = color == Color.BLACK
+        passed = False
+
+        while True:
+            # Every legal move is an empty square next to an opponent disc
+            empty = ~(own | opp) & FULL
+            near = opp | (opp << 1) & NOT_Y0 | (opp >> 1) & NOT_Y7
+            candidates = (near | near << 8 | near >> 8) & empty
+
+            # Rejection sampling: try candidates in random order until one flips something,
+            # which picks uniformly among the legal moves without generating all of them
+            flips = 0
+            while candidates:
+                move = candidates
+                for _ in range(randrange(candidates.bit_count())):
+                    move &= move - 1
+                move &= -move
+
+                for shift, mask in _LEFT:
+                    flipped = 0
+                    x = (move << shift) & mask
+                    while x & opp:
+                        flipped |= x
+                        x = (x << shift) & mask
+                    if x & own:
+                        flips |= flipped
+                for shift, mask in _RIGHT:
+                    flipped = 0
+                    x = (move >> shift) & mask
+                    while x & opp:
+                        flipped |= x
+                        x = (x >> shift) & mask
+                    if x & own:
+                        flips |= flipped
+
+                if flips:
+                    break
+                candidates ^= move
+
+            if not flips:
+                if passed or not empty:
+                    break
+                passed = True
+                own, opp = opp, own
+                black_to_move = not black_to_move
+                continue
+            passed = False
+
+            own, opp = opp ^ flips, own | move | flips
+            black_to_move = not black_to_move
+
+        black, white = (own, opp) if black_to_move else (opp, own)
+        return black.bit_count() - white.bit_count()
@@ -0,0 +1,90 @@
+from game.board import SQUARES, square_index
+from game.enums import Color
+from game.point import Point
+
+from typing import Dict, List
+
+
+class SearchTimeout(Exception):
+    """
+    Raised inside a search when its deadline has passed, unwinding to the iterative deepening loop.
+    """
+    pass
+
+
+class MoveOrdering:
+    """
+    Killer moves and a history table learned from the cutoffs of previous searches.
+
+    Killers are kept per game stage (the number of empty squares), so the killers found at a
+    stage while searching one move are tried first when a later search reaches the same stage.
+    The history table scores every square per color by the depth of the cutoffs it caused.
+    Both survive between the moves of a game; call `age` between moves to fade old history.
+    """
+
+    KILLERS_PER_PLY: int = 2
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """
+        Forget every killer move and reset the history table.
+        """
+        self.killers: List[List[Point]] = [[] for _ in range(SQUARES + 1)]
+        self.history: Dict[Color, List[int]] = {Color.BLACK: [0] * SQUARES, Color.WHITE: [0] * SQUARES}
+
+    def age(self):
+        """
+        Halve the history scores so that cutoffs from earlier moves count less than fresh ones.
+        """
+        for scores in self.history.values():
+            for square in range(SQUARES):
+                scores[square] >>= 1
+
+    def order(self, moves: List[Point], color: Color, empties: int, first_move: Point = None) -> List[Point]:
+        """
+        Reorder moves in place: `first_move`, then the killers, then by history score.
+
+        Moves with equal history scores keep their relative order, so the static corner and
+        edge ordering of `Board.get_ordered_legal_moves` still breaks ties.
+
+        Args:
+            moves (List[Point]): The legal moves, in static order.
+            color (Color): The color to move.
+            empties (int): The number of empty squares, identifying the game stage.
+            first_move (Point, optional): A move to search before all others, e.g. from the transposition table.
+
+        Returns:
+            List[Point]: The reordered moves.
+        """
+        history = self.history[color]
+        moves.sort(key=lambda move: history[square_index(move.x, move.y)], reverse=True)
+
+        for killer in reversed(self.killers[empties]):
+            if killer in moves:
+                moves.remove(killer)
+                moves.insert(0, killer)
+
+        if first_move is not None and first_move in moves:
+            moves.remove(first_move)
+            moves.insert(0, first_move)
+
+        return moves
+
+    def record_cutoff(self, move: Point, color: Color, empties: int, depth: int):
+        """
+        Remember a move that caused a beta cutoff.
+
+        Args:
+            move (Point): The move that caused the cutoff.
+            color (Color): The color that played it.
+            empties (int): The number of empty squares at the node.
+            depth (int): The remaining depth at the node; deeper cutoffs weigh more.
+        """
+        killers = self.killers[empties]
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[MoveOrdering.KILLERS_PER_PLY:]
+
+        self.history[color][square_index(move.x, move.y)] += depth * depth
@@ -0,0 +1,125 @@
+from game.point import Point
+
+from enum import Enum
+from typing import List, NamedTuple, Optional
+
+
+class Bound(Enum):
+    EXACT: str = 'exact'
+    LOWER: str = 'lower' # The search failed high: the true score is at least `score`
+    UPPER: str = 'upper' # The search failed low: the true score is at most `score`
+
+
+class TTEntry(NamedTuple):
+    key: int
+    depth: int
+    score: float
+    bound: Bound
+    move: Optional[Point]
+
+
+class TranspositionTable:
+    """
+    A bounded transposition table keyed by Zobrist keys.
+
+    Every bucket holds two entries: a depth-preferred slot that is only overwritten by a search
+    at least as deep, and an always-replace slot that takes everything else. The number of
+    buckets is derived from a memory cap.
+    """
+
+    # Approximate CPython footprint of one stored entry: the tuple, its int/float fields and a list slot
+    ENTRY_BYTES: int = 160
+
+    def __init__(self, max_memory_mb: float = 16):
+        """
+        Initialize an empty transposition table.
+
+        Args:
+            max_memory_mb (float): The memory cap for the stored entries, in megabytes.
+        """
+        self.max_memory_mb = max_memory_mb
+        self.size: int = max(1, int(max_memory_mb * 1024 * 1024) // (2 * TranspositionTable.ENTRY_BYTES))
+        self.clear()
+
+    def clear(self):
+        """
+        Remove every entry and reset the counters.
+        """
+        self.depth_preferred: List[Optional[TTEntry]] = [None] * self.size
+        self.always_replace: List[Optional[TTEntry]] = [None] * self.size
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.probes: int = 0
+        self.hits: int = 0
+        self.stores: int = 0
+        self.overwrites: int = 0
+
+    def probe(self, key: int) -> Optional[TTEntry]:
+        """
+        Look up the entry for a position.
+
+        Args:
+            key (int): The Zobrist key of the position.
+
+        Returns:
+            Optional[TTEntry]: The stored entry, or None if the position is not in the table.
+        """
+        self.probes += 1
+        index = key % self.size
+
+        entry = self.depth_preferred[index]
+        if entry is None or entry.key != key:
+            entry = self.always_replace[index]
+            if entry is None or entry.key != key:
+                return None
+
+        self.hits += 1
+        return entry
+
+    def store(self, key: int, depth: int, score: float, bound: Bound, move: Optional[Point]):
+        """
+        Store a search result.
+
+        Args:
+            key (int): The Zobrist key of the position.
+            depth (int): The remaining depth the position was searched to.
+            score (float): The score found by the search.
+            bound (Bound): Whether `score` is exact or a lower/upper bound.
+            move (Optional[Point]): The best move found, if any.
+        """
+        self.stores += 1
+        index = key % self.size
+        entry = TTEntry(key, depth, score, bound, move)
+
+        current = self.depth_preferred[index]
+        if current is None or current.key == key or depth >= current.depth:
+            if current is not None and current.key != key:
+                self.overwrites += 1
+            self.depth_preferred[index] = entry
+        else:
+            if self.always_replace[index] is not None:
+                self.overwrites += 1
+            self.always_replace[index] = entry
+
+    def stats(self) -> dict:
+        """
+        Get the table counters.
+
+        Returns:
+            dict: The probes, hits, hit rate, stores and overwrites since the last reset.
+        """
+        return {
+            'probes': self.probes,
+            'hits': self.hits,
+            'hit_rate': round(self.hits / self.probes, 3) if self.probes else 0.0,
+            'stores': self.stores,
+            'overwrites': self.overwrites,
+        }
+
+    def __len__(self):
+        return sum(entry is not None for entry in self.depth_preferred) + sum(entry is not None for entry in self.always_replace)
+
+    def __str__(self):
+        stats = ', '.join(f'{name}: {value}' for name, value in self.stats().items())
+        return f'TranspositionTable ({len(self)}/{2 * self.size} entries, {stats})'
@@ -1,4 +1,5 @@
 from game.board import Board
+from game.bitboard import BitBoard
 from game.enums import Color
 from players.player import Player
 from players.random_player import RandomPlayer
@@ -18,18 +19,20 @@ from time import perf_counter
 class Runner:
 
     @staticmethod
-    def play_game(players: List[Player], show_game:bool = False):
+    def play_game(players: List[Player], show_game:bool = False, board_type: Type[Board] = Board, ponder: bool = False):
         """
         Play a game between two players.
 
         Args:
             players (List[Player]): A list of two Player objects.
             show_game (bool, optional): Whether to display the game board during play (default is False).
+            board_type (Type[Board], optional): The board engine to play on, e.g. `BitBoard` (default is Board).
+            ponder (bool, optional): Let each player keep thinking while the other one is on the move (default is False).
 
         Returns:
             Player: The winner of the game or None if it's a tie.
         """
-        board = Board()
+        board = board_type()
         
         if show_game:
             start = perf_counter()
@@ -42,11 +45,15 @@ class Runner:
                 if show_game:
                     print(f'{player}\'s turn.')
 
+                if ponder:
+                    player.stop_pondering()
+
                 playable_points = board.get_legal_moves(player.color)
 
                 if not playable_points:
                     if show_game:
                         print(f'No available spots for {player}.')
+                    board.pass_turn()
                     continue
 
                 placement_point = player.play(board)
@@ -58,10 +65,17 @@ class Runner:
 
                 board.place_and_flip_discs(placement_point, player.color)
 
+                if ponder:
+                    player.start_pondering(board)
+
                 if show_game:
                     print(f'{player} played at {placement_point} ({round(perf_counter() - play_start, 2)} secs).')
                     print(board)
 
+        if ponder:
+            for player in players:
+                player.stop_pondering()
+
         players[0].score = board.get_points_for_color(players[0].color)
         players[1].score = board.get_points_for_color(players[1].color)
 
@@ -73,7 +87,8 @@ class Runner:
         return winner
 
     @staticmethod
-    def compare_players(player1:Player, player2:Player, games:int = 10, show_game:bool = False, break_at_loss:bool = False):
+    def compare_players(player1:Player, player2:Player, games:int = 10, show_game:bool = False, break_at_loss:bool = False,
+                        board_type: Type[Board] = Board, ponder: bool = False):
         """
         Compare two players in a series of games and report the results.
 
@@ -82,12 +97,14 @@ class Runner:
             player2 (Player): The class representing the second player.
             games (int, optional): The number of games to play (default is 10).
             show_game (bool, optional): Whether to display the game during play (default is False).
+            board_type (Type[Board], optional): The board engine to play on (default is Board).
+            ponder (bool, optional): Let the players think on each other's time (default is False).
         """
         start_time = perf_counter()
         winners_dict = defaultdict(int)
 
         for _ in range(games):
-            winner = Runner.play_game([player1, player2], show_game)
+            winner = Runner.play_game([player1, player2], show_game, board_type, ponder)
             if break_at_loss and winner != player1: break
             winners_dict[winner] += 1
 
@@ -118,7 +135,7 @@ if __name__ == "__main__":
     print("\n3. Comparing MiniMax vs MCTS:")
     minimax_player = OptimizedMiniMaxPlayer(Color.BLACK, ['square_heuristic', 'mobility_heuristic'], max_depth=4)
     mcts_player = MCTSPlayer(Color.WHITE, 200)
-    Runner.compare_players(minimax_player, mcts_player, 3, show_game=False)
+    Runner.compare_players(minimax_player, mcts_player, 3, show_game=False, board_type=BitBoard)
     
     print("\n4. Sample game with display:")
     demo_player1 = OptimizedMiniMaxPlayer(Color.BLACK, ['square_heuristic'], max_depth=3)
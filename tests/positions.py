@@ -0,0 +1,41 @@
+from game.board import Board
+from game.bitboard import BitBoard
+from game.enums import Color
+
+import random
+from typing import List, Tuple, Type
+
+
+def random_positions(count: int = 8, moves: Tuple[int, int] = (10, 30), seed: int = 0,
+                     board_type: Type[Board] = BitBoard) -> List[Tuple[Board, Color]]:
+    """
+    Build reproducible positions for the tests and benchmarks by playing random moves from the start.
+
+    Args:
+        count (int, optional): The number of positions (default is 8).
+        moves (Tuple[int, int], optional): The range of random moves played per position (default is 10 to 30).
+        seed (int, optional): The random seed (default is 0).
+        board_type (Type[Board], optional): The board engine to build (default is BitBoard).
+
+    Returns:
+        List[Tuple[Board, Color]]: The positions and the color to move in each, which always has a legal move.
+    """
+    rng = random.Random(seed)
+    positions = []
+
+    while len(positions) < count:
+        board = board_type()
+        color = Color.BLACK
+        for _ in range(rng.randint(*moves)):
+            legal_moves = board.get_legal_moves(color)
+            if legal_moves:
+                board.make_move(rng.choice(legal_moves), color)
+            else:
+                board.pass_turn()
+            color = Color.WHITE if color == Color.BLACK else Color.BLACK
+
+        if not board.is_game_over() and board.get_legal_moves(color):
+            board.undo_stack.clear()
+            positions.append((board, color))
+
+    return positions
@@ -0,0 +1,89 @@
+import pytest
+import copy
+import random
+from game.board import Board
+from game.bitboard import BitBoard
+from game.enums import Color
+from game.point import Point
+from players.heuristics_players import HeuristicPlayer
+
+np = pytest.importorskip('numpy')
+from game.batch_heuristics import batch_evaluate, batch_heuristics, boards_to_array, pack_boards, unpack_bitboards
+
+HEURISTICS = ['square_heuristic', 'mobility_heuristic', 'points_heuristic', 'stability_heuristic', 'winner_heuristic']
+
+
+def random_positions(seed: int, games: int = 3):
+    """Collect every position of a few random games, including the final ones."""
+    rng = random.Random(seed)
+    positions = []
+
+    for _ in range(games):
+        board = Board()
+        color = Color.BLACK
+        while not board.is_game_over():
+            positions.append(copy.deepcopy(board))
+            legal_moves = board.get_legal_moves(color)
+            if legal_moves:
+                board.place_and_flip_discs(rng.choice(legal_moves), color)
+            color = Color.WHITE if color == Color.BLACK else Color.BLACK
+        positions.append(board)
+
+    return positions
+
+
+class TestBatchHeuristics:
+    """Test cases for the vectorized heuristics."""
+
+    def test_array_conversion(self):
+        """Test the int8 array layout matches the grid."""
+        board = Board()
+        board.grid[0][5] = Color.WHITE.value
+
+        positions = boards_to_array([board])
+
+        assert positions.shape == (1, Board.SIZE, Board.SIZE)
+        assert positions.dtype == np.int8
+        assert positions[0, 3, 3] == 1 and positions[0, 4, 4] == 1
+        assert positions[0, 3, 4] == -1 and positions[0, 0, 5] == -1
+        assert (np.abs(positions).sum()) == 5
+
+    def test_packed_bitboards_round_trip(self):
+        """Test that packed bitboards unpack to the same positions for both engines."""
+        bitboard = BitBoard()
+        bitboard.place_and_flip_discs(Point(3, 5), Color.BLACK)
+        board = Board()
+        board.place_and_flip_discs(Point(3, 5), Color.BLACK)
+
+        assert (pack_boards([bitboard]) == pack_boards([board])).all()
+        assert (unpack_bitboards(pack_boards([bitboard])) == boards_to_array([board])).all()
+
+    @pytest.mark.parametrize('color', [Color.BLACK, Color.WHITE])
+    def test_matches_board_heuristics(self, color):
+        """Test every vectorized heuristic against Board on random positions."""
+        boards = random_positions(seed=7)
+        values = batch_heuristics(pack_boards(boards), color, HEURISTICS)
+
+        for name in HEURISTICS:
+            assert values[name].tolist() == [getattr(board, name)(color) for board in boards], name
+
+        totals = batch_evaluate(boards_to_array(boards), color, ['square_heuristic', 'mobility_heuristic'])
+        assert totals.tolist() == [board.evaluate([Board.square_heuristic, Board.mobility_heuristic], color) for board in boards]
+
+    def test_unknown_heuristic(self):
+        """Test that heuristics without a batch implementation are rejected."""
+        with pytest.raises(ValueError):
+            batch_evaluate(pack_boards([Board()]), Color.BLACK, ['invalid_heuristic'])
+
+    @pytest.mark.parametrize('board_type', [Board, BitBoard])
+    def test_batch_heuristic_player(self, board_type):
+        """Test the batch heuristic player picks the same move as the scalar one."""
+        for board in random_positions(seed=3, games=1)[:20]:
+            for color in (Color.BLACK, Color.WHITE):
+                position = board_type()
+                position.grid = board.grid
+                scalar = HeuristicPlayer(color, ['square_heuristic', 'mobility_heuristic'])
+                batch = HeuristicPlayer(color, ['square_heuristic', 'mobility_heuristic'], batch=True)
+
+                assert batch.play(position) == scalar.play(position)
+                assert position.grid == board.grid
@@ -0,0 +1,182 @@
+import pytest
+import random
+from unittest.mock import patch
+from game.board import Board
+from game.bitboard import BitBoard
+from game.enums import Color
+from game.point import Point
+from players.random_player import RandomPlayer
+from players.minimax_optimized_player import OptimizedMiniMaxPlayer
+from runner import Runner
+
+HEURISTICS = ['square_heuristic', 'mobility_heuristic', 'points_heuristic', 'stability_heuristic', 'winner_heuristic']
+
+
+def play_random_game(seed: int):
+    """Yield matching (Board, BitBoard, color) positions along a random game."""
+    rng = random.Random(seed)
+    board, bitboard = Board(), BitBoard()
+    color = Color.BLACK
+
+    while not board.is_game_over():
+        yield board, bitboard, color
+        legal_moves = board.get_legal_moves(color)
+        if legal_moves:
+            move = rng.choice(legal_moves)
+            board.place_and_flip_discs(move, color)
+            bitboard.place_and_flip_discs(move, color)
+        else:
+            board.pass_turn()
+            bitboard.pass_turn()
+        color = Color.WHITE if color == Color.BLACK else Color.BLACK
+
+    yield board, bitboard, color
+
+
+class TestBitBoard:
+    """Test cases for the BitBoard engine."""
+
+    def test_bitboard_initialization(self):
+        """Test bitboard starts from the same position as Board."""
+        bitboard = BitBoard()
+
+        assert bitboard.grid == Board().grid
+        assert bitboard.get_points_for_color(Color.BLACK) == 2
+        assert bitboard.get_points_for_color(Color.WHITE) == 2
+        assert bitboard.get_points_for_color(Color.EMPTY) == 60
+
+    def test_grid_writes_are_routed_to_bitboards(self):
+        """Test that editing the grid updates the bitboards."""
+        bitboard = BitBoard()
+
+        bitboard.grid[0][0] = Color.BLACK.value
+        assert bitboard.grid[0][0] == Color.BLACK.value
+        assert bitboard.get_points_for_color(Color.BLACK) == 3
+
+        bitboard.grid[3] = [Color.WHITE.value] * Board.SIZE
+        assert bitboard.get_points_for_color(Color.WHITE) == 9
+
+        bitboard.grid = [[Color.BLACK.value] * Board.SIZE for _ in range(Board.SIZE)]
+        assert bitboard.is_game_over()
+        assert bitboard.winner_heuristic(Color.BLACK) == 100
+
+    @pytest.mark.parametrize('seed', range(5))
+    def test_matches_board_along_random_games(self, seed):
+        """Test legal moves, flips and heuristics agree with Board move by move."""
+        for board, bitboard, color in play_random_game(seed):
+            assert bitboard.grid == board.grid
+            assert bitboard.is_game_over() == board.is_game_over()
+            assert bitboard.get_legal_moves(color) == board.get_legal_moves(color)
+            assert bitboard.get_ordered_legal_moves(color) == board.get_ordered_legal_moves(color)
+
+            for move in board.get_legal_moves(color):
+                assert bitboard.place_and_flip_discs(move, color, perform_flip=False) == \
+                    board.place_and_flip_discs(move, color, perform_flip=False)
+
+            for heuristic_color in (Color.BLACK, Color.WHITE):
+                for name in HEURISTICS:
+                    assert getattr(bitboard, name)(heuristic_color) == getattr(board, name)(heuristic_color), name
+
+    def test_make_and_undo_move(self):
+        """Test that undo restores the position for both flip formats."""
+        bitboard = BitBoard()
+        original_grid = bitboard.grid
+
+        flipped = bitboard.make_move(Point(3, 5), Color.BLACK)
+        assert flipped
+        assert bitboard.get_points_for_color(Color.BLACK) == 4
+        bitboard.undo_move(Point(3, 5), Color.BLACK, flipped)
+        assert bitboard.grid == original_grid
+
+        paths = bitboard.place_and_flip_discs(Point(3, 5), Color.BLACK)
+        bitboard.undo_move(Point(3, 5), Color.BLACK, paths)
+        assert bitboard.grid == original_grid
+
+    def test_illegal_move(self):
+        """Test that illegal moves leave the board untouched."""
+        bitboard = BitBoard()
+
+        assert not bitboard.is_legal_move(Point(0, 0), Color.BLACK)
+        assert not bitboard.is_legal_move(Point(3, 3), Color.BLACK)
+        assert bitboard.make_move(Point(0, 0), Color.BLACK) == 0
+        assert bitboard.place_and_flip_discs(Point(3, 3), Color.BLACK) == []
+        assert bitboard.grid == Board().grid
+
+    def test_stable_pieces(self):
+        """Test stability on a filled edge."""
+        bitboard = BitBoard()
+        for i in range(Board.SIZE):
+            bitboard.grid[0][i] = Color.BLACK.value
+
+        assert bitboard.is_stable_piece(Point(0, 0), Color.BLACK)
+        assert not bitboard.is_stable_piece(Point(3, 3), Color.BLACK)
+
+        # A disc next to an empty corner can be flipped along the edge
+        bitboard.grid[0][0] = Color.EMPTY.value
+        bitboard.grid[0][2] = Color.WHITE.value
+        assert not bitboard.is_stable_piece(Point(1, 0), Color.BLACK)
+        assert Point(0, 0) in bitboard.get_legal_moves(Color.WHITE)
+        assert bitboard.is_stable_piece(Point(7, 0), Color.BLACK)
+
+    def test_optimized_minimax_on_bitboard(self):
+        """Test the optimized minimax player plays legal moves on a bitboard."""
+        bitboard = BitBoard()
+        player = OptimizedMiniMaxPlayer(Color.BLACK, ['square_heuristic', 'mobility_heuristic'], max_depth=3)
+
+        move = player.play(bitboard)
+
+        assert move in bitboard.get_legal_moves(Color.BLACK)
+        assert bitboard.grid == Board().grid
+
+    def test_runner_with_bitboard(self):
+        """Test a full game on the bitboard engine."""
+        player1 = RandomPlayer(Color.BLACK)
+        player2 = RandomPlayer(Color.WHITE)
+
+        with patch('builtins.print'):
+            winner = Runner.play_game([player1, player2], show_game=True, board_type=BitBoard)
+
+        assert winner in [player1, player2, None]
+        assert player1.score + player2.score <= Board.SIZE * Board.SIZE
+
+    @pytest.mark.parametrize('seed', range(3))
+    def test_zobrist_key_matches_board(self, seed):
+        """Test the incremental key matches Board and a full rescan along random games."""
+        for board, bitboard, color in play_random_game(seed):
+            assert bitboard.zobrist_key == bitboard.compute_zobrist_key()
+            assert bitboard.grid == board.grid
+
+            for move in bitboard.get_legal_moves(color):
+                key = bitboard.zobrist_key
+                flipped = bitboard.make_move(move, color)
+                assert bitboard.zobrist_key == bitboard.compute_zobrist_key()
+                bitboard.undo_move(move, color, flipped)
+                assert bitboard.zobrist_key == key
+
+    def test_players_use_bitboard_heuristics(self):
+        """Test that heuristics named by players dispatch to the BitBoard implementations."""
+        bitboard = BitBoard()
+        player = OptimizedMiniMaxPlayer(Color.BLACK, ['square_heuristic', 'mobility_heuristic'], max_depth=1)
+
+        with patch.object(Board, 'square_heuristic', side_effect=AssertionError('Board heuristic used')):
+            assert bitboard.evaluate(player.heuristics, Color.BLACK) == \
+                BitBoard.square_heuristic(bitboard, Color.BLACK) + bitboard.mobility_heuristic(Color.BLACK)
+
+    def test_undo_stack(self):
+        """Test that undo() takes back moves in order and restores the key."""
+        board, bitboard = Board(), BitBoard()
+        history = []
+
+        for move, color in [(Point(3, 5), Color.BLACK), (Point(2, 5), Color.WHITE),
+                            (Point(5, 3), Color.BLACK), (Point(5, 2), Color.WHITE)]:
+            history.append((bitboard.grid, bitboard.zobrist_key))
+            assert bitboard.make_move(move, color) == board.make_move(move, color)
+
+        assert bitboard.undo_stack == board.undo_stack
+
+        while history:
+            grid, key = history.pop()
+            bitboard.undo()
+            assert bitboard.grid == grid
+            assert bitboard.zobrist_key == key
+        assert bitboard.undo_stack == []
@@ -1,5 +1,6 @@
+import copy
 import pytest
-from game.board import Board
+from game.board import Board, INVERSE_SYMMETRY, SYMMETRIES, SYMMETRY_COUNT, SQUARE_BITS, square_index, transform_bits, transform_point
 from game.enums import Color
 from game.point import Point
 
@@ -208,4 +209,211 @@ class TestBoard:
         
         # Should contain the starting pieces
         assert 'X' in board_str  # Black pieces
-        assert 'O' in board_str  # White pieces
\ No newline at end of file
+        assert 'O' in board_str  # White pieces
+
+    def test_legal_moves_cache(self):
+        """Test legal moves are cached and invalidated by moves."""
+        board = Board()
+
+        moves = board.get_legal_moves(Color.BLACK)
+        assert board.legal_moves_cache[Color.BLACK] == moves
+
+        # Callers get a private copy of the cached list
+        moves.clear()
+        assert len(board.get_legal_moves(Color.BLACK)) == 4
+
+        flipped = board.make_move(Point(3, 5), Color.BLACK)
+        assert Color.BLACK not in board.legal_moves_cache
+        assert board.get_legal_moves(Color.WHITE) == board.generate_legal_moves(Color.WHITE)
+
+        board.undo_move(Point(3, 5), Color.BLACK, flipped)
+        assert board.legal_moves_cache == {}
+        assert len(board.get_legal_moves(Color.BLACK)) == 4
+
+    def test_legal_moves_cache_grid_edits(self):
+        """Test that editing the grid directly invalidates cached legal moves."""
+        board = Board()
+        assert not board.is_game_over()
+
+        board.grid[3] = [Color.BLACK.value] * Board.SIZE
+        board.grid[4][3] = Color.BLACK.value
+        board.grid[4][4] = Color.BLACK.value
+        assert board.is_game_over()
+
+        board.grid = [row[:] for row in Board().grid]
+        assert not board.is_game_over()
+        assert board.mobility_heuristic(Color.BLACK) == 0
+
+    def test_zobrist_key_incremental(self):
+        """Test the Zobrist key is updated by moves and restored by undo."""
+        board = Board()
+        initial_key = board.zobrist_key
+        assert initial_key == board.compute_zobrist_key()
+
+        flipped = board.make_move(Point(3, 5), Color.BLACK)
+        assert board.zobrist_key != initial_key
+        assert board.zobrist_key == board.compute_zobrist_key()
+        assert board.side_to_move == Color.WHITE
+
+        board.undo_move(Point(3, 5), Color.BLACK, flipped)
+        assert board.zobrist_key == initial_key
+        assert board.side_to_move == Color.BLACK
+
+        board.grid[0][0] = Color.WHITE.value
+        assert board.zobrist_key == board.compute_zobrist_key()
+
+    def test_zobrist_key_transpositions(self):
+        """Test that the same position reached by different move orders has the same key."""
+        board1 = Board()
+        board2 = Board()
+
+        for board, moves in ((board1, [Point(3, 5), Point(2, 5), Point(5, 3), Point(5, 2)]),
+                             (board2, [Point(5, 3), Point(5, 2), Point(3, 5), Point(2, 5)])):
+            color = Color.BLACK
+            for move in moves:
+                board.place_and_flip_discs(move, color)
+                color = Color.WHITE if color == Color.BLACK else Color.BLACK
+
+        assert board1.grid == board2.grid
+        assert board1.zobrist_key == board2.zobrist_key
+
+        # The side to move is part of the key
+        board1.pass_turn()
+        assert board1.zobrist_key != board2.zobrist_key
+        board1.pass_turn()
+        assert board1.zobrist_key == board2.zobrist_key
+
+    def test_stable_discs(self):
+        """Test stable discs of both colors are computed together and cached per position."""
+        board = Board()
+        assert board.get_stable_discs() == (0, 0)
+
+        for i in range(Board.SIZE):
+            board.grid[0][i] = Color.BLACK.value
+
+        black, white = board.get_stable_discs()
+        assert board.stable_discs_cache == (black, white)
+        assert black.bit_count() == Board.SIZE
+        assert white == 0
+        assert board.stability_heuristic(Color.BLACK) == 3 * Board.SIZE
+
+        # Filling the rest of the board makes every disc stable and drops the cached result
+        for y in range(1, Board.SIZE):
+            for x in range(Board.SIZE):
+                if board.grid[y][x] == Color.EMPTY.value:
+                    board.grid[y][x] = Color.WHITE.value
+        assert board.stable_discs_cache is None
+        assert board.stability_heuristic(Color.WHITE) == 3 * board.get_points_for_color(Color.WHITE)
+        assert board.is_stable_piece(Point(0, 1), Color.WHITE)
+
+    def test_flippable_edge_disc_is_not_stable(self):
+        """Test that a disc on a full ray can still be unstable when its line is open on the other side."""
+        board = Board()
+        board.grid[0] = [Color.EMPTY.value, Color.BLACK.value] + [Color.WHITE.value] * (Board.SIZE - 2)
+
+        # White can take the corner and flip the black disc
+        assert Point(0, 0) in board.get_legal_moves(Color.WHITE)
+        assert not board.is_stable_piece(Point(1, 0), Color.BLACK)
+        assert board.stability_heuristic(Color.BLACK) == 0
+
+        # The white discs are anchored on the corner, one after another
+        assert all(board.is_stable_piece(Point(x, 0), Color.WHITE) for x in range(2, Board.SIZE))
+        assert not board.is_stable_piece(Point(3, 3), Color.WHITE)
+
+    def test_undo_stack(self):
+        """Test that applied moves are recorded and taken back in order by undo()."""
+        board = Board()
+        initial_grid = [row[:] for row in board.grid]
+        initial_key = board.zobrist_key
+
+        flipped = board.make_move(Point(3, 5), Color.BLACK)
+        assert flipped == 1 << square_index(3, 4)
+        board.place_and_flip_discs(Point(2, 5), Color.WHITE)
+        assert len(board.undo_stack) == 2
+
+        # A copy keeps its own history
+        board_copy = copy.deepcopy(board)
+        board_copy.undo()
+        assert len(board.undo_stack) == 2
+
+        board.undo()
+        assert board.grid == board_copy.grid
+        assert board.side_to_move == Color.WHITE
+
+        board.undo()
+        assert board.grid == initial_grid
+        assert board.zobrist_key == initial_key
+        assert board.side_to_move == Color.BLACK
+        assert board.undo_stack == []
+
+        with pytest.raises(IndexError):
+            board.undo()
+
+    def test_illegal_make_move_is_not_recorded(self):
+        """Test that an illegal move changes nothing and is not recorded."""
+        board = Board()
+
+        assert board.make_move(Point(0, 0), Color.BLACK) == 0
+        assert board.undo_stack == []
+        assert board.grid == Board().grid
+
+    def test_transform_bits(self):
+        """Test the bitwise symmetries against mapping every square one by one."""
+        bits = 0x8142_2418_0F00_F0A5
+        for transform in range(SYMMETRY_COUNT):
+            assert sorted(SYMMETRIES[transform]) == list(range(64))
+            expected = 0
+            for x in range(8):
+                for y in range(8):
+                    if bits >> square_index(x, y) & 1:
+                        tx, ty = (y, x) if transform & 4 else (x, y)
+                        tx = 7 - tx if transform & 1 else tx
+                        ty = 7 - ty if transform & 2 else ty
+                        expected |= 1 << square_index(tx, ty)
+            assert transform_bits(bits, transform) == expected
+
+    def test_transform_point_inverse(self):
+        """Test that every symmetry is undone by its inverse."""
+        for transform in range(SYMMETRY_COUNT):
+            for x in range(8):
+                for y in range(8):
+                    point = transform_point(Point.at(x, y), transform)
+                    assert transform_point(point, INVERSE_SYMMETRY[transform]) is Point.at(x, y)
+
+    def test_canonical_form(self):
+        """Test that all 8 orientations of a position share a canonical form and key."""
+        board = Board()
+        for move, color in [(Point(2, 4), Color.BLACK), (Point(2, 5), Color.WHITE), (Point(3, 5), Color.BLACK)]:
+            board.make_move(move, color)
+        black, white = board.get_bitboards()
+        forms, keys = set(), set()
+
+        for transform in range(SYMMETRY_COUNT):
+            transformed = Board()
+            transformed.grid = [[Color.EMPTY.value] * 8 for _ in range(8)]
+            for square in range(64):
+                target = Point.from_square(SYMMETRIES[transform][square])
+                if black >> square & 1:
+                    transformed.grid[target.y][target.x] = Color.BLACK.value
+                elif white >> square & 1:
+                    transformed.grid[target.y][target.x] = Color.WHITE.value
+
+            canonical_black, canonical_white, canonical_transform = transformed.canonical_form()
+            assert transform_bits(transformed.get_bitboards()[0], canonical_transform) == canonical_black
+            forms.add((canonical_black, canonical_white))
+            keys.add(transformed.canonical_key(Color.WHITE)[0])
+
+        assert len(forms) == 1
+        assert len(keys) == 1
+
+    def test_canonical_key(self):
+        """Test that the canonical key of a canonical position is its Zobrist key and depends on the color to move."""
+        black, white, _ = Board().canonical_form()
+        board = Board()
+        board.grid = [[Color.BLACK.value if black & SQUARE_BITS[y][x] else Color.WHITE.value if white & SQUARE_BITS[y][x]
+                       else Color.EMPTY.value for x in range(8)] for y in range(8)]
+        key, transform = board.canonical_key(Color.BLACK)
+
+        assert transform == 0
+        assert key == board.position_key(Color.BLACK)
+        assert board.canonical_key(Color.WHITE)[0] == board.position_key(Color.WHITE)
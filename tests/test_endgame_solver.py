@@ -0,0 +1,75 @@
+import pytest
+from tests.positions import random_positions
+from game.board import Board
+from game.bitboard import BitBoard
+from game.enums import Color
+from game.point import Point
+from players.endgame_solver import EndgameSolver
+from players.minimax_optimized_player import OptimizedMiniMaxPlayer
+
+
+def brute_force(board: Board, color: Color) -> int:
+    """Final disc difference for `color` with perfect play, by plain exhaustive negamax."""
+    opponent = Color.WHITE if color == Color.BLACK else Color.BLACK
+    legal_moves = board.get_legal_moves(color)
+
+    if not legal_moves:
+        if not board.get_legal_moves(opponent):
+            return board.get_points_for_color(color) - board.get_points_for_color(opponent)
+        return -brute_force(board, opponent)
+
+    best_score = -Board.SIZE * Board.SIZE
+    for move in legal_moves:
+        board.make_move(move, color)
+        best_score = max(best_score, -brute_force(board, opponent))
+        board.undo()
+    return best_score
+
+
+class TestEndgameSolver:
+    """Test cases for the EndgameSolver class."""
+
+    @pytest.mark.parametrize('board_type', [Board, BitBoard])
+    def test_exact_and_win_loss_draw_scores(self, board_type):
+        """Test the solver against exhaustive search on positions with 5 to 7 empties."""
+        for board, color in random_positions(count=4, moves=(53, 55), seed=7, board_type=board_type):
+            original_grid = [row[:] for row in board.grid]
+            expected = brute_force(board, color)
+
+            move, score = EndgameSolver().solve(board, color)
+            assert score == expected
+            assert board.grid == original_grid
+
+            # The returned move achieves the score
+            opponent = Color.WHITE if color == Color.BLACK else Color.BLACK
+            board.make_move(move, color)
+            assert -brute_force(board, opponent) == expected
+            board.undo()
+
+            _, result = EndgameSolver(win_loss_draw=True).solve(board, color)
+            assert result == (expected > 0) - (expected < 0)
+
+    def test_solved_positions(self):
+        """Test finished games and positions where the side to move must pass."""
+        board = Board()
+        board.grid = [[Color.BLACK.value] * Board.SIZE for _ in range(Board.SIZE)]
+        assert EndgameSolver().solve(board, Color.WHITE) == (None, -Board.SIZE * Board.SIZE)
+
+        # White has no move; black takes the last square
+        board.grid[0][0] = Color.EMPTY.value
+        board.grid[0][1] = Color.WHITE.value
+        assert EndgameSolver().solve(board, Color.WHITE) == (None, -Board.SIZE * Board.SIZE)
+
+    def test_player_switches_to_solver(self):
+        """Test that the player solves once few enough squares are empty."""
+        board, color = random_positions(count=1, moves=(54, 54), seed=3)[0]
+        empties = board.get_points_for_color(Color.EMPTY)
+        player = OptimizedMiniMaxPlayer(color, ['square_heuristic'], max_depth=1, endgame_empties=empties)
+        expected = brute_force(board, color)
+
+        move = player.play(board)
+        assert player.completed_depth == empties
+
+        opponent = Color.WHITE if color == Color.BLACK else Color.BLACK
+        board.make_move(move, color)
+        assert -brute_force(board, opponent) == expected
@@ -0,0 +1,103 @@
+import pytest
+from tests.positions import random_positions
+from game.board import Board
+from game.bitboard import BitBoard
+from game.enums import Color
+from game.point import Point
+from players.evaluation_cache import EvaluationCache
+from players.heuristics_players import HeuristicPlayer
+from players.minimax_player import MiniMaxPlayer
+from players.minimax_optimized_player import OptimizedMiniMaxPlayer
+
+
+HEURISTICS = [Board.square_heuristic, Board.mobility_heuristic]
+
+
+class TestEvaluationCache:
+    """Test cases for the EvaluationCache class."""
+
+    def test_evaluate_matches_board(self):
+        """Test that cached values equal direct evaluations and repeat lookups hit."""
+        cache = EvaluationCache(1)
+        for board, color in random_positions(4):
+            expected = board.evaluate(HEURISTICS, color)
+            assert cache.evaluate(board, HEURISTICS, color) == expected
+            assert cache.evaluate(board, HEURISTICS, color) == expected
+
+        assert cache.stats() == {'probes': 8, 'hits': 4, 'hit_rate': 0.5, 'evictions': 0}
+
+    def test_key_separates_color_and_heuristics(self):
+        """Test that the color and the heuristic set are part of the key, but not their order."""
+        board = Board()
+        board.make_move(Point.at(2, 4), Color.BLACK)
+
+        assert EvaluationCache.key(board, HEURISTICS, Color.BLACK) != EvaluationCache.key(board, HEURISTICS, Color.WHITE)
+        assert EvaluationCache.key(board, HEURISTICS, Color.BLACK) != EvaluationCache.key(board, HEURISTICS[:1], Color.BLACK)
+        assert EvaluationCache.key(board, HEURISTICS, Color.BLACK) == EvaluationCache.key(board, HEURISTICS[::-1], Color.BLACK)
+
+    def test_key_ignores_side_to_move(self):
+        """Test that the same discs reached with either side to move share an entry."""
+        board = Board()
+        key = EvaluationCache.key(board, HEURISTICS, Color.BLACK)
+        board.pass_turn()
+
+        assert EvaluationCache.key(board, HEURISTICS, Color.BLACK) == key
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that a full cache evicts the entry used least recently."""
+        cache = EvaluationCache(1)
+        cache.capacity = 2
+        boards = [board for board, _ in random_positions(3)]
+
+        cache.evaluate(boards[0], HEURISTICS, Color.BLACK)
+        cache.evaluate(boards[1], HEURISTICS, Color.BLACK)
+        cache.evaluate(boards[0], HEURISTICS, Color.BLACK)
+        cache.evaluate(boards[2], HEURISTICS, Color.BLACK)
+
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        assert EvaluationCache.key(boards[0], HEURISTICS, Color.BLACK) in cache.entries
+        assert EvaluationCache.key(boards[1], HEURISTICS, Color.BLACK) not in cache.entries
+
+    def test_shared_cache(self):
+        """Test that players in the same process share one cache."""
+        minimax = OptimizedMiniMaxPlayer(Color.BLACK, max_depth=2, evaluation_cache=True)
+        heuristic = HeuristicPlayer(Color.WHITE, evaluation_cache=True)
+        plain_minimax = MiniMaxPlayer(Color.WHITE, evaluation_cache=True)
+
+        assert minimax.evaluation_cache is EvaluationCache.shared()
+        assert plain_minimax.evaluation_cache is EvaluationCache.shared()
+        assert heuristic.evaluation_cache is EvaluationCache.shared()
+        assert OptimizedMiniMaxPlayer(Color.BLACK).evaluation_cache is None
+        assert MiniMaxPlayer(Color.BLACK).evaluation_cache is None
+
+    @pytest.mark.parametrize('board_type', [Board, BitBoard])
+    def test_players_play_the_same_moves(self, board_type):
+        """Test that the cache changes no move and is hit on a repeated search."""
+        board = board_type()
+        board.make_move(Point.at(2, 4), Color.BLACK)
+        cache = EvaluationCache.shared()
+        cache.clear()
+
+        cached = OptimizedMiniMaxPlayer(Color.WHITE, max_depth=3, evaluation_cache=True)
+        uncached = OptimizedMiniMaxPlayer(Color.WHITE, max_depth=3)
+        assert cached.play(board) == uncached.play(board)
+        assert cached.play(board) == uncached.play(board)
+        assert cache.hits > 0
+
+        assert HeuristicPlayer(Color.WHITE, evaluation_cache=True).play(board) == HeuristicPlayer(Color.WHITE).play(board)
+
+    def test_minimax_player_scores(self):
+        """Test that the plain MiniMax player scores positions the same with the cache and hits it on a repeated search."""
+        cache = EvaluationCache.shared()
+        cache.clear()
+        cached = MiniMaxPlayer(Color.WHITE, max_depth=2, evaluation_cache=True)
+        uncached = MiniMaxPlayer(Color.WHITE, max_depth=2)
+
+        for board, color in random_positions(2):
+            for _ in range(2):
+                _, cached_score = cached.minimax_with_alpha_beta(board, color, 2, cached.heuristics, float('-inf'), float('inf'))
+                _, uncached_score = uncached.minimax_with_alpha_beta(board, color, 2, uncached.heuristics, float('-inf'), float('inf'))
+                assert cached_score == uncached_score
+
+        assert cache.hits > 0
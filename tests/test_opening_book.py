@@ -0,0 +1,97 @@
+import pytest
+from game.board import Board
+from game.bitboard import BitBoard
+from game.enums import Color
+from game.point import Point
+from players.mcts_player import MCTSPlayer
+from players.minimax_optimized_player import OptimizedMiniMaxPlayer
+from players.opening_book import OpeningBook
+
+
+@pytest.fixture(scope='module')
+def book():
+    return OpeningBook.build(plies=3, depth=2)
+
+
+class TestOpeningBook:
+    """Test cases for the OpeningBook class."""
+
+    def test_symmetric_positions_share_a_key(self):
+        """Test that all four first moves reach the same canonical position."""
+        keys = set()
+        for move in Board().get_legal_moves(Color.BLACK):
+            board = Board()
+            board.make_move(move, Color.BLACK)
+            keys.add(board.canonical_key(Color.WHITE)[0])
+
+        assert len(keys) == 1
+
+    def test_build_covers_every_reply(self, book):
+        """Test that the book has a legal move for every position within its plies."""
+        boards = [(BitBoard(), Color.BLACK)]
+        for _ in range(book.plies):
+            children = []
+            for board, color in boards:
+                move = book.lookup(board, color)
+                assert move in board.get_legal_moves(color)
+
+                opponent = Color.WHITE if color == Color.BLACK else Color.BLACK
+                for reply in board.get_legal_moves(color):
+                    child = BitBoard()
+                    child.grid = board.grid
+                    child.make_move(reply, color)
+                    children.append((child, opponent))
+            boards = children
+
+        # 1 + 1 + 3 distinct positions up to symmetry in the first three plies
+        assert len(book) == 5
+
+    def test_lookup_maps_move_back(self, book):
+        """Test that the book move in a mirrored position is the mirror of the stored move."""
+        board = Board()
+        board.make_move(Point.at(2, 4), Color.BLACK)
+        move = book.lookup(board, Color.WHITE)
+
+        mirrored = Board()
+        mirrored.make_move(Point.at(4, 2), Color.BLACK)
+        mirrored_move = book.lookup(mirrored, Color.WHITE)
+
+        assert (mirrored_move.x, mirrored_move.y) == (move.y, move.x)
+
+    def test_lookup_miss(self, book):
+        """Test that positions beyond the book are not found."""
+        board = Board()
+        board.grid[0][0] = Color.BLACK.value
+        assert book.lookup(board, Color.BLACK) is None
+        assert OpeningBook().lookup(Board(), Color.BLACK) is None
+
+    def test_save_and_load(self, book, tmp_path):
+        """Test that a saved book loads back identically and stays compact."""
+        path = tmp_path / 'book.bin'
+        book.save(path)
+
+        loaded = OpeningBook.load(path)
+
+        assert loaded.moves == book.moves
+        assert (loaded.plies, loaded.depth) == (book.plies, book.depth)
+        assert path.stat().st_size == OpeningBook.HEADER.size + len(book) * OpeningBook.RECORD.size
+
+    def test_load_rejects_other_files(self, tmp_path):
+        """Test that loading a file that is not a book raises ValueError."""
+        path = tmp_path / 'book.bin'
+        path.write_bytes(b'not a book')
+
+        with pytest.raises(ValueError):
+            OpeningBook.load(path)
+
+    def test_players_use_book(self, book):
+        """Test that both search players play the book move without searching."""
+        board = Board()
+        expected = book.lookup(board, Color.BLACK)
+
+        minimax = OptimizedMiniMaxPlayer(Color.BLACK, ['square_heuristic'], max_depth=3, opening_book=book)
+        assert minimax.play(board) == expected
+        assert minimax.nodes == 0
+
+        mcts = MCTSPlayer(Color.BLACK, iterations=1, opening_book=book)
+        assert mcts.play(board) == expected
@@ -1,13 +1,17 @@
 import pytest
+from time import perf_counter, sleep
 from unittest.mock import Mock, patch
 from game.board import Board
+from game.bitboard import BitBoard
 from game.enums import Color
 from game.point import Point
 from players.player import Player
 from players.random_player import RandomPlayer
 from players.minimax_player import MiniMaxPlayer
+from players.minimax_optimized_player import OptimizedMiniMaxPlayer
 from players.mcts_player import MCTSPlayer, MCTSNode
 from players.heuristics_players import HeuristicPlayer
+from tests.positions import random_positions
 
 
 class TestRandomPlayer:
@@ -85,6 +89,136 @@ class TestMiniMaxPlayer:
         assert score == 100  # Black wins
 
 
+class TestOptimizedMiniMaxPlayer:
+    """Test cases for OptimizedMiniMaxPlayer."""
+
+    def test_optimized_minimax_player_play(self):
+        """Test optimized minimax player move selection."""
+        board = Board()
+        player = OptimizedMiniMaxPlayer(Color.BLACK, ['square_heuristic'], max_depth=2)
+
+        move = player.play(board)
+
+        assert move in board.get_legal_moves(Color.BLACK)
+        assert player.nodes > 0
+
+    def test_transposition_table_keeps_scores(self):
+        """Test that the transposition table does not change search results."""
+        board = Board()
+        for move, color in [(Point(3, 5), Color.BLACK), (Point(2, 5), Color.WHITE), (Point(5, 3), Color.BLACK)]:
+            board.place_and_flip_discs(move, color)
+
+        plain = OptimizedMiniMaxPlayer(Color.WHITE, ['square_heuristic', 'mobility_heuristic'], max_depth=4)
+        cached = OptimizedMiniMaxPlayer(Color.WHITE, ['square_heuristic', 'mobility_heuristic'], max_depth=4,
+                                        transposition_table_mb=1)
+
+        for depth in (2, 3, 4):
+            _, plain_score = plain.minimax_optimized(board, Color.WHITE, depth, float('-inf'), float('inf'), True)
+            _, cached_score = cached.minimax_optimized(board, Color.WHITE, depth, float('-inf'), float('inf'), True)
+            assert cached_score == plain_score
+
+        assert cached.transposition_table.stores > 0
+        assert cached.transposition_table.hits > 0
+        assert cached.nodes < plain.nodes
+
+    @pytest.mark.parametrize('transposition_table_mb', [0, 1])
+    def test_pvs_matches_minimax_scores(self, transposition_table_mb):
+        """Test that negamax with principal variation search finds the minimax score."""
+        for board, color in random_positions(count=4, seed=1):
+            minimax = OptimizedMiniMaxPlayer(color, ['square_heuristic', 'mobility_heuristic'])
+            pvs = OptimizedMiniMaxPlayer(color, ['square_heuristic', 'mobility_heuristic'], pvs=True,
+                                         transposition_table_mb=transposition_table_mb)
+
+            for depth in (1, 2, 3):
+                _, minimax_score = minimax.minimax_optimized(board, color, depth, float('-inf'), float('inf'), True)
+                _, pvs_score = pvs.negamax(board, color, depth, float('-inf'), float('inf'))
+                assert pvs_score == minimax_score
+
+                # A wrong guess only costs re-searches
+                for guess in (minimax_score - 50, minimax_score, minimax_score + 50):
+                    _, aspiration_score = pvs.aspiration_search(board, depth, guess)
+                    assert aspiration_score == minimax_score
+
+    @pytest.mark.parametrize('pvs', [False, True])
+    def test_dynamic_ordering_keeps_scores(self, pvs):
+        """Test that killer/history ordering changes the node count but not the scores."""
+        board, color = random_positions(count=1, seed=2)[0]
+        plain = OptimizedMiniMaxPlayer(color, ['square_heuristic', 'mobility_heuristic'], max_depth=4, pvs=pvs)
+        ordered = OptimizedMiniMaxPlayer(color, ['square_heuristic', 'mobility_heuristic'], max_depth=4, pvs=pvs,
+                                         dynamic_ordering=True)
+
+        for depth in (2, 3, 4):
+            if pvs:
+                _, plain_score = plain.negamax(board, color, depth, float('-inf'), float('inf'))
+                _, ordered_score = ordered.negamax(board, color, depth, float('-inf'), float('inf'))
+            else:
+                _, plain_score = plain.minimax_optimized(board, color, depth, float('-inf'), float('inf'), True)
+                _, ordered_score = ordered.minimax_optimized(board, color, depth, float('-inf'), float('inf'), True)
+            assert ordered_score == plain_score
+
+        assert any(ordered.move_ordering.killers)
+        assert ordered.nodes < plain.nodes
+
+    def test_dynamic_ordering_persists_between_moves(self):
+        """Test that the learned ordering is kept, and aged, between calls to play."""
+        board = Board()
+        player = OptimizedMiniMaxPlayer(Color.BLACK, ['square_heuristic', 'mobility_heuristic'], max_depth=3,
+                                        dynamic_ordering=True)
+
+        player.play(board)
+        history = list(player.move_ordering.history[Color.BLACK])
+        assert any(history)
+
+        player.move_ordering.age()
+        assert player.move_ordering.history[Color.BLACK] == [score >> 1 for score in history]
+
+    def test_pvs_play(self):
+        """Test the PVS mode deepens to max_depth and leaves the board unchanged."""
+        board = Board()
+        original_grid = [row[:] for row in board.grid]
+        player = OptimizedMiniMaxPlayer(Color.BLACK, ['square_heuristic', 'mobility_heuristic'], max_depth=3,
+                                        transposition_table_mb=1, pvs=True)
+
+        move = player.play(board)
+
+        assert move in board.get_legal_moves(Color.BLACK)
+        assert player.completed_depth == 3
+        assert board.grid == original_grid
+        assert board.undo_stack == []
+
+    def test_late_move_reduction_schedule(self):
+        """Test that early moves and shallow nodes are searched at full depth."""
+        player = OptimizedMiniMaxPlayer(Color.BLACK, pvs=True, late_move_reductions=True)
+        full_moves = OptimizedMiniMaxPlayer.LMR_FULL_DEPTH_MOVES
+
+        assert player.late_move_reduction(OptimizedMiniMaxPlayer.LMR_MIN_DEPTH - 1, 10) == 0
+        assert player.late_move_reduction(5, full_moves - 1) == 0
+        assert player.late_move_reduction(5, full_moves) == 1
+        assert player.late_move_reduction(6, 2 * full_moves) == 2
+
+    def test_late_move_reductions(self):
+        """Test that late move reductions search fewer nodes and keep the first iterations exact."""
+        plain_nodes = reduced_nodes = 0
+        for board, color in random_positions(count=4, seed=1):
+            plain = OptimizedMiniMaxPlayer(color, ['square_heuristic', 'mobility_heuristic'], pvs=True, transposition_table_mb=1)
+            reduced = OptimizedMiniMaxPlayer(color, ['square_heuristic', 'mobility_heuristic'], pvs=True, transposition_table_mb=1,
+                                             late_move_reductions=True)
+
+            # Nothing is reduced below LMR_MIN_DEPTH
+            depth = OptimizedMiniMaxPlayer.LMR_MIN_DEPTH - 1
+            assert reduced.negamax(board, color, depth, float('-inf'), float('inf'))[1] == \
+                   plain.negamax(board, color, depth, float('-inf'), float('inf'))[1]
+
+            plain.nodes = reduced.nodes = 0
+            plain.negamax(board, color, 6, float('-inf'), float('inf'))
+            move, _ = reduced.negamax(board, color, 6, float('-inf'), float('inf'))
+            assert move in board.get_legal_moves(color)
+            plain_nodes += plain.nodes
+            reduced_nodes += reduced.nodes
+
+        assert reduced_nodes < plain_nodes
+
+
 class TestMCTSPlayer:
     """Test cases for MCTSPlayer."""
 
@@ -161,6 +295,265 @@ class TestMCTSPlayer:
         best_move = player.select_best_move(root)
         assert best_move == Point(2, 3)  # Higher average value
 
+    def test_mcts_grows_tree(self):
+        """Test that every iteration adds a node and backs its result up to the root."""
+        board = BitBoard()
+        player = MCTSPlayer(Color.BLACK, iterations=200)
+        root = MCTSNode(board, Color.BLACK)
+
+        player.mcts(root)
+
+        def count(node):
+            return 1 + sum(count(child) for child in node.children)
+
+        def depth(node):
+            return 1 + max((depth(child) for child in node.children), default=0)
+
+        assert root.visits == 200
+        assert sum(child.visits for child in root.children) == 200
+        assert len(root.children) == 4
+        assert count(root) == 201
+        assert depth(root) > 3
+        assert board.undo_stack == []
+        assert board.grid == BitBoard().grid
+
+    def test_mcts_select_child(self):
+        """Test that selection follows the best mean for the color to move when exploration is off."""
+        player = MCTSPlayer(Color.BLACK, exploration=0)
+        root = MCTSNode(None, Color.BLACK)
+        root.visits = 20
+        for move, value in [(Point(2, 4), 300), (Point(4, 2), -500), (Point(3, 5), 100)]:
+            child = MCTSNode(None, Color.WHITE, move)
+            child.parent = root
+            child.visits = 10
+            child.value = value # From white's point of view
+            root.children.append(child)
+
+        assert player.select_child(root).move == Point(4, 2)
+
+    def test_mcts_expand_with_pass(self):
+        """Test that a child whose opponent cannot move keeps the same color to move."""
+        board = BitBoard()
+        board.grid = [[Color.EMPTY.value] * 8 for _ in range(8)]
+        for x, y, color in [(0, 0, Color.BLACK), (1, 0, Color.WHITE), (0, 2, Color.BLACK), (1, 2, Color.WHITE), (1, 3, Color.WHITE)]:
+            board.grid[y][x] = color.value
+        player = MCTSPlayer(Color.BLACK)
+        root = MCTSNode(board, Color.BLACK)
+        root.untried_moves = [Point(2, 0)]
+
+        child = player.expand(root, board)
+
+        assert not board.get_legal_moves(Color.WHITE)
+        assert child.color == Color.BLACK
+        assert sorted(map(str, child.untried_moves)) == sorted(map(str, board.get_legal_moves(Color.BLACK)))
+
+    def test_mcts_without_iterations(self):
+        """Test that a search without iterations still returns a legal move."""
+        board = BitBoard()
+        for reuse_tree in (True, False):
+            player = MCTSPlayer(Color.BLACK, iterations=0, reuse_tree=reuse_tree)
+
+            assert player.play(board) in board.get_legal_moves(Color.BLACK)
+            assert player.tree is None
+
+    def test_mcts_best_move_tie(self):
+        """Test that equally visited moves are ranked by their value for the root's color."""
+        player = MCTSPlayer(Color.BLACK)
+        root = MCTSNode(None, Color.BLACK)
+        for move, color, value in [(Point(2, 4), Color.WHITE, 50), (Point(4, 2), Color.WHITE, 20), (Point(3, 5), Color.BLACK, 10)]:
+            child = MCTSNode(None, color, move)
+            child.visits = 5
+            child.value = value # From the point of view of the child's color
+            root.children.append(child)
+
+        # The means for black are -10, -4 and 2
+        assert player.select_best_move(root) == Point(3, 5)
+
+        root.children.pop()
+        assert player.select_best_move(root) == Point(4, 2)
+
+    def test_mcts_simulate_inner_node(self):
+        """Test simulating a node without a board of its own from the working board, and printing it."""
+        board = BitBoard()
+        player = MCTSPlayer(Color.BLACK, iterations=50)
+        root = MCTSNode(board, Color.BLACK)
+        player.mcts(root)
+        child = root.children[0]
+
+        board.make_move(child.move, Color.BLACK)
+        assert player.simulate(child, board) in [-100, 0, 100]
+        assert board.get_bitboards() != BitBoard().get_bitboards()
+
+        assert child.state is None
+        assert f'{child.visits} visits' in str(child)
+        assert str(root) == str(board)
+
+    def test_mcts_keeps_tree(self):
+        """Test that the subtree of the chosen move is kept and the opponent's reply becomes the next root."""
+        board = BitBoard()
+        player = MCTSPlayer(Color.BLACK, iterations=200, seed=0)
+
+        move = player.play(board)
+        board.make_move(move, Color.BLACK)
+
+        tree = player.tree
+        assert tree.move == move
+        assert tree.parent is None
+        assert tree.state.get_bitboards() == board.get_bitboards()
+
+        # The opponent replies with its most explored move
+        reply = max(tree.children, key=lambda child: child.visits)
+        board.make_move(reply.move, Color.WHITE)
+        root = player.reused_root(board)
+
+        assert root is reply
+        assert root.parent is None and root.visits > 0
+        assert root.state.get_bitboards() == board.get_bitboards()
+        assert player.tree is None
+
+        # The next search adds its iterations to the carried visits
+        carried = root.visits
+        player.mcts(root)
+        assert root.visits == carried + 200
+        assert root.state.get_bitboards() == board.get_bitboards()
+
+    def test_mcts_tree_not_reused(self):
+        """Test that an unknown position or a disabled option starts a new tree."""
+        board = BitBoard()
+        player = MCTSPlayer(Color.BLACK, iterations=50, seed=0)
+        player.play(board)
+
+        other = random_positions(1)[0][0]
+        assert player.reused_root(other) is None
+        assert player.tree is None
+
+        player = MCTSPlayer(Color.BLACK, iterations=50, reuse_tree=False)
+        player.play(board)
+        assert player.tree is None
+
+    def test_mcts_pondering_grows_tree(self):
+        """Test that pondering adds iterations to the kept tree, which the next search starts from."""
+        board = BitBoard()
+        player = MCTSPlayer(Color.BLACK, iterations=100, seed=0)
+        board.make_move(player.play(board), Color.BLACK)
+        visits = player.tree.visits
+
+        player.start_pondering(board)
+        sleep(0.2)
+        pondered = player.stop_pondering()
+
+        assert pondered > 0
+        assert player.tree.visits == visits + pondered
+        assert player.ponder_thread is None
+        assert player.stop_pondering() == 0
+        assert player.tree.state.get_bitboards() == board.get_bitboards()
+
+        # The reply's subtree keeps the pondered visits
+        reply = max(player.tree.children, key=lambda child: child.visits)
+        board.make_move(reply.move, Color.WHITE)
+        assert player.reused_root(board) is reply
+
+    def test_mcts_pondering_without_tree(self):
+        """Test that players without a kept tree do not ponder."""
+        board = BitBoard()
+        player = MCTSPlayer(Color.BLACK, iterations=20, reuse_tree=False)
+        board.make_move(player.play(board), Color.BLACK)
+
+        player.start_pondering(board)
+
+        assert player.ponder_thread is None
+        assert player.stop_pondering() == 0
+
+    def test_mcts_worker_search(self):
+        """Test that a worker search returns the statistics of every root move."""
+        from players.mcts_player import _init_worker, _search_root
+
+        board, color = random_positions(1)[0]
+        _init_worker(color, {'iterations': 100})
+
+        iterations, first = _search_root(board.grid, 5)
+        assert iterations == 100
+        assert sorted(map(str, (move for move, _, _, _ in first))) == sorted(map(str, board.get_legal_moves(color)))
+        assert sum(visits for _, _, visits, _ in first) == 100
+        assert _search_root(board.grid, 5) == (iterations, first)
+        assert _search_root(board.grid, 6) != first
+
+    def test_mcts_parallel_play(self):
+        """Test that play merges the searches of the worker processes."""
+        board, color = random_positions(1)[0]
+        players = [MCTSPlayer(color, iterations=100, seed=2, workers=2) for _ in range(2)]
+
+        try:
+            moves = [player.play(board) for player in players]
+            assert moves[0] in board.get_legal_moves(color)
+            assert moves[0] == moves[1]
+            assert players[0].iterations_run == 200
+            assert players[0].tree is None
+        finally:
+            for player in players:
+                player.close()
+
+        assert players[0].executor is None
+
+    def test_mcts_time_limit(self):
+        """Test that a timed search runs until its deadline and reports its iterations."""
+        board, color = random_positions(1)[0]
+        player = MCTSPlayer(color, iterations=10, time_limit=0.3)
+
+        start = perf_counter()
+        move = player.play(board)
+        elapsed = perf_counter() - start
+
+        assert move in board.get_legal_moves(color)
+        assert player.iterations_run > 10
+        assert player.tree.parent is None
+        assert elapsed < 0.3 + 0.2
+
+    def test_mcts_without_time(self):
+        """Test that a time budget that runs out before the first iteration still gives a legal move."""
+        board = BitBoard()
+        legal_moves = board.get_legal_moves(Color.BLACK)
+        for reuse_tree in (True, False):
+            player = MCTSPlayer(Color.BLACK, time_limit=0, reuse_tree=reuse_tree)
+
+            assert player.play(board) in legal_moves
+            assert player.iterations_run == 0
+            assert player.tree is None
+
+        player = MCTSPlayer(Color.BLACK, time_limit=0, workers=2)
+        try:
+            assert player.play(board) in legal_moves
+            assert player.iterations_run == 0
+        finally:
+            player.close()
+
+    def test_mcts_decided(self):
+        """Test that a root move is decided only when its lead is larger than the iterations left."""
+        root = MCTSNode(None, Color.BLACK)
+        for visits in (40, 25, 10):
+            child = MCTSNode(None, Color.WHITE)
+            child.visits = visits
+            root.children.append(child)
+
+        assert MCTSPlayer.decided(root, 14)
+        assert not MCTSPlayer.decided(root, 15)
+        assert not MCTSPlayer.decided(MCTSNode(None, Color.BLACK), 0)
+
+    def test_mcts_stops_early(self):
+        """Test that a timed search stops as soon as the best root move cannot be overtaken."""
+        board = BitBoard()
+        player = MCTSPlayer(Color.BLACK, iterations=50)
+        root = MCTSNode(board, Color.BLACK)
+        player.mcts(root)
+
+        # A huge carried lead, as tree reuse can leave
+        root.children[0].visits += 10 ** 9
+        player.time_limit = 5.0
+        start = perf_counter()
+
+        assert player.mcts(root) == 1
+        assert perf_counter() - start < 1.0
+
 
 class TestHeuristicPlayer:
     """Test cases for HeuristicPlayer."""
@@ -187,4 +580,128 @@ class TestHeuristicPlayer:
         player = HeuristicPlayer(Color.BLACK, ['invalid_heuristic'])
         
         # Should have None for invalid heuristic
-        assert None in player.heuristics
\ No newline at end of file
+        assert None in player.heuristics
+
+
+class TestIterativeDeepening:
+    """Test cases for the time-budgeted search mode of the minimax players."""
+
+    @pytest.mark.parametrize('player_type', [MiniMaxPlayer, OptimizedMiniMaxPlayer])
+    def test_time_limited_play(self, player_type):
+        """Test that a time-limited search returns a legal move within its budget."""
+        board = Board()
+        player = player_type(Color.BLACK, ['square_heuristic', 'mobility_heuristic'], time_limit=0.2)
+        original_grid = [row[:] for row in board.grid]
+
+        start = perf_counter()
+        move = player.play(board)
+
+        assert perf_counter() - start < 1.0
+        assert move in board.get_legal_moves(Color.BLACK)
+        assert player.completed_depth >= 1
+        assert player.deadline is None
+        # Moves made by an interrupted search are undone
+        assert board.grid == original_grid
+
+    def test_time_limited_play_without_moves(self):
+        """Test the time-limited search when the player has no legal move."""
+        board = Board()
+        board.grid = [[Color.BLACK.value] * Board.SIZE for _ in range(Board.SIZE)]
+        player = OptimizedMiniMaxPlayer(Color.WHITE, ['square_heuristic'], time_limit=0.05)
+
+        assert player.play(board) is None
+
+    def test_deadline_before_first_iteration(self):
+        """Test the fallback move when not even depth 1 completes."""
+        board = Board()
+        player = OptimizedMiniMaxPlayer(Color.BLACK, ['square_heuristic'], time_limit=0)
+
+        move = player.play(board)
+
+        assert player.completed_depth == 0
+        assert move == board.get_ordered_legal_moves(Color.BLACK)[0]
+
+
+class TestParallelSearch:
+    """Test cases for the multi-process root search of OptimizedMiniMaxPlayer."""
+
+    @pytest.mark.parametrize('pvs', [False, True])
+    def test_parallel_matches_serial(self, pvs):
+        """Test that the parallel search picks the same move as a serial fixed-depth search."""
+        for board, color in random_positions(count=3, seed=4) + random_positions(count=4, seed=11):
+            opponent = Color.WHITE if color == Color.BLACK else Color.BLACK
+            player = OptimizedMiniMaxPlayer(color, ['square_heuristic', 'mobility_heuristic'], pvs=pvs, workers=2)
+            serial = OptimizedMiniMaxPlayer(color, ['square_heuristic', 'mobility_heuristic'], max_depth=3)
+
+            try:
+                move, score = player.parallel_search(board, 3)
+            finally:
+                player.close()
+
+            assert move == serial.play(board)
+            board.make_move(move, color)
+            assert score == serial.minimax_optimized(board, opponent, 2, float('-inf'), float('inf'), False)[1]
+            board.undo()
+            assert player.nodes > 0
+
+    def test_serial_root_is_deterministic(self):
+        """Test that the serial fixed-depth search always picks the first of the equally scored moves."""
+        for board, color in random_positions(count=4, seed=11):
+            opponent = Color.WHITE if color == Color.BLACK else Color.BLACK
+            player = OptimizedMiniMaxPlayer(color, ['square_heuristic', 'mobility_heuristic'], max_depth=3)
+
+            # Exact score of every root move, ties to the earliest move
+            legal_moves = board.get_ordered_legal_moves(color)
+            scores = []
+            for move in legal_moves:
+                board.make_move(move, color)
+                scores.append(player.minimax_optimized(board, opponent, 2, float('-inf'), float('inf'), False)[1])
+                board.undo()
+
+            assert {player.play(board) for _ in range(4)} == {legal_moves[scores.index(max(scores))]}
+
+    def test_parallel_play(self):
+        """Test that play searches in parallel when workers are configured."""
+        board = Board()
+        player = OptimizedMiniMaxPlayer(Color.BLACK, ['square_heuristic'], max_depth=2, workers=2)
+
+        try:
+            move = player.play(board)
+            assert move in board.get_legal_moves(Color.BLACK)
+            assert player.completed_depth == 2
+            assert player.executor is not None
+        finally:
+            player.close()
+
+        assert player.executor is None
+
+    def test_pondering_fills_transposition_table(self):
+        """Test that pondering on the opponent's time leaves entries for the next search."""
+        board = Board()
+        player = OptimizedMiniMaxPlayer(Color.BLACK, ['square_heuristic', 'mobility_heuristic'], max_depth=2,
+                                        transposition_table_mb=1)
+        board.make_move(player.play(board), Color.BLACK)
+
+        try:
+            player.start_pondering(board)
+            sleep(0.5)
+            merged = player.stop_pondering()
+        finally:
+            player.close()
+
+        assert merged > 0
+        assert player.stop_pondering() == 0
+
+        # Our reply to any white move is now in the table
+        reply = board.get_legal_moves(Color.WHITE)[0]
+        board.make_move(reply, Color.WHITE)
+        assert player.transposition_table.probe(board.position_key(Color.BLACK)) is not None
+
+    def test_pondering_without_table(self):
+        """Test that players without a transposition table do not ponder."""
+        player = OptimizedMiniMaxPlayer(Color.BLACK, ['square_heuristic'])
+
+        player.start_pondering(Board())
+
+        assert player.ponder_executor is None
+        assert player.stop_pondering() == 0
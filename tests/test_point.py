@@ -70,4 +70,29 @@ class TestPoint:
         assert str(point) == "(d, 5)"
         
         point = Point(7, 7)
-        assert str(point) == "(h, 8)"
\ No newline at end of file
+        assert str(point) == "(h, 8)"
+
+    def test_interned_points(self):
+        """Test that Point.at returns shared, immutable points equal to regular ones."""
+        point = Point.at(3, 4)
+
+        assert point is Point.at(3, 4)
+        assert point is Point.from_square(3 * 8 + 4)
+        assert point == Point(3, 4)
+        assert hash(point) == hash(Point(3, 4))
+        assert Point(3, 4) in {point}
+
+        with pytest.raises(AttributeError):
+            point.shift(1, 1)
+        assert (point.x, point.y) == (3, 4)
+
+        # Copies are regular points that can be shifted
+        copy = point.__copy__()
+        copy.shift(1, 1)
+        assert copy == Point(4, 5)
+        assert Point.at(3, 4) == Point(3, 4)
+
+    def test_point_has_no_instance_dict(self):
+        """Test points use slots instead of a per-instance dict."""
+        assert not hasattr(Point(3, 4), '__dict__')
+        assert not hasattr(Point.at(3, 4), '__dict__')
@@ -0,0 +1,83 @@
+import pytest
+from tests.positions import random_positions
+from game.board import Board
+from game.enums import Color
+from players.minimax_optimized_player import OptimizedMiniMaxPlayer
+from players.probcut import Cut, ProbCut
+
+
+class TestProbCut:
+    """Test cases for the ProbCut parameters and their use in the search."""
+
+    def test_fit(self):
+        """Test the least squares fit of points on and around a line."""
+        assert ProbCut.fit([(0, 1), (1, 3), (2, 5)]) == pytest.approx((2, 1, 0))
+
+        a, b, sigma = ProbCut.fit([(0, 0), (0, 2), (2, 2), (2, 4)])
+        assert (a, b, sigma) == pytest.approx((1, 1, 1))
+
+    def test_cuts_are_grouped_by_depth(self):
+        """Test that cuts are kept per depth, shallowest prediction first."""
+        probcut = ProbCut([Cut(5, 3, 1, 0, 1), Cut(4, 2, 1, 0, 1), Cut(5, 1, 1, 0, 1)])
+
+        assert [cut.shallow_depth for cut in probcut.cuts[5]] == [1, 3]
+        assert [cut.shallow_depth for cut in probcut.cuts[4]] == [2]
+
+    def test_save_and_load(self, tmp_path):
+        """Test that saved parameters load back identically."""
+        probcut = ProbCut([Cut(3, 1, 1.25, -0.5, 8.0), Cut(4, 2, 1.1, 0.25, 12.5)], 1.5, ['square_heuristic'])
+        path = tmp_path / 'probcut.json'
+        probcut.save(path)
+
+        loaded = ProbCut.load(path)
+
+        assert loaded.cuts == probcut.cuts
+        assert loaded.threshold == 1.5
+        assert loaded.heuristic_names == ['square_heuristic']
+
+    def test_calibrate(self):
+        """Test calibrating from self-play positions."""
+        positions = ProbCut.self_play_positions(games=1, sample_every=16)
+        assert positions
+        for board, color in positions:
+            assert board.get_legal_moves(color)
+
+        probcut = ProbCut.calibrate(positions, pairs=((2, 1), (3, 1)))
+
+        assert set(probcut.cuts) <= {2, 3}
+        for cuts in probcut.cuts.values():
+            for cut in cuts:
+                assert cut.a > 0
+                assert cut.sigma >= 0
+
+    def test_wide_margin_never_prunes(self):
+        """Test that a search with cuts that cannot succeed returns the unpruned result."""
+        probcut = ProbCut([Cut(depth, 1, 1, 0, 1000) for depth in range(2, 5)])
+        for board, color in random_positions(4):
+            pruned = OptimizedMiniMaxPlayer(color, max_depth=4, transposition_table_mb=4, pvs=True, probcut=probcut)
+            plain = OptimizedMiniMaxPlayer(color, max_depth=4, transposition_table_mb=4, pvs=True)
+
+            assert pruned.play(board) == plain.play(board)
+
+    def test_pruning_searches_fewer_nodes(self):
+        """Test that aggressive cuts prune nodes and still return legal moves."""
+        probcut = ProbCut([Cut(depth, depth - 2, 1, 0, 0) for depth in range(3, 6)], threshold=0)
+        pruned_nodes = plain_nodes = 0
+        for board, color in random_positions(4):
+            pruned = OptimizedMiniMaxPlayer(color, max_depth=5, transposition_table_mb=4, pvs=True, probcut=probcut)
+            plain = OptimizedMiniMaxPlayer(color, max_depth=5, transposition_table_mb=4, pvs=True)
+
+            assert pruned.play(board) in board.get_legal_moves(color)
+            plain.play(board)
+            pruned_nodes += pruned.nodes
+            plain_nodes += plain.nodes
+
+        assert pruned_nodes < plain_nodes
+
+    def test_no_cut_with_open_window(self):
+        """Test that nodes with an infinite bound are never pruned."""
+        player = OptimizedMiniMaxPlayer(Color.BLACK, pvs=True, probcut=ProbCut([Cut(3, 1, 1, 0, 0)], threshold=0))
+
+        assert player.probcut_search(Board(), Color.BLACK, 3, float('-inf'), 0) is None
+        assert player.probcut_search(Board(), Color.BLACK, 3, 0, float('inf')) is None
+        assert player.nodes == 0
@@ -0,0 +1,85 @@
+import pytest
+from tests.positions import random_positions
+from game.bitboard import BitBoard
+from game.enums import Color
+from players.mcts_player import MCTSPlayer
+from players.rollout import RolloutEngine
+
+
+def final_differences(board: BitBoard, color: Color) -> set:
+    """Every disc difference a game played out from `board` can end with, found by trying all moves."""
+    opponent = Color.WHITE if color == Color.BLACK else Color.BLACK
+    if board.is_game_over():
+        black, white = board.get_bitboards()
+        return {black.bit_count() - white.bit_count()}
+
+    legal_moves = board.get_legal_moves(color)
+    if not legal_moves:
+        return final_differences(board, opponent)
+
+    differences = set()
+    for move in legal_moves:
+        board.make_move(move, color)
+        differences |= final_differences(board, opponent)
+        board.undo()
+    return differences
+
+
+class TestRolloutEngine:
+    """Test cases for the RolloutEngine class."""
+
+    def test_game_over_position(self):
+        """Test that a finished game is scored without playing and still counts as a playout."""
+        board = BitBoard()
+        board.grid = [[Color.BLACK.value] * 8 for _ in range(6)] + [[Color.WHITE.value] * 8 for _ in range(2)]
+        engine = RolloutEngine(0)
+
+        assert engine.play(*board.get_bitboards(), Color.BLACK) == 32
+        assert engine.play(*board.get_bitboards(), Color.WHITE) == 32
+        assert engine.playouts == 2
+
+    def test_pass(self):
+        """Test that a side without moves passes and the other side finishes the game."""
+        board = BitBoard()
+        board.grid = [[Color.WHITE.value] * 8 for _ in range(8)]
+        board.set_square(0, 0, Color.EMPTY.value)
+        board.set_square(1, 0, Color.BLACK.value)
+
+        # Black cannot take the corner, so it passes and White flips Black's only disc
+        assert not board.get_legal_moves(Color.BLACK)
+        assert RolloutEngine(0).play(*board.get_bitboards(), Color.BLACK) == -64
+
+    def test_endgame_results_are_reachable(self):
+        """Test that playouts of short endgames end only in results that real games can reach, and reach them all."""
+        for board, color in random_positions(4, moves=(54, 56)):
+            reachable = final_differences(board, color)
+            engine = RolloutEngine(0)
+            black, white = board.get_bitboards()
+
+            results = {engine.play(black, white, color) for _ in range(500)}
+
+            assert results == reachable
+            assert board.get_bitboards() == (black, white)
+
+    def test_seed_is_reproducible(self):
+        """Test that engines with the same seed play the same games."""
+        for board, color in random_positions(2):
+            first, second = RolloutEngine(7), RolloutEngine(7)
+            assert [first.play(*board.get_bitboards(), color) for _ in range(20)] == \
+                   [second.play(*board.get_bitboards(), color) for _ in range(20)]
+
+    def test_midgame_result(self):
+        """Test that playouts from the midgame end with a plausible disc difference."""
+        engine = RolloutEngine(0)
+        for board, color in random_positions(4):
+            for _ in range(20):
+                difference = engine.play(*board.get_bitboards(), color)
+                assert -64 <= difference <= 64
+
+    def test_mcts_uses_engine(self):
+        """Test that MCTS searches run their playouts on the engine and are reproducible with a seed."""
+        board, color = random_positions(1)[0]
+        first, second = MCTSPlayer(color, iterations=100, seed=3), MCTSPlayer(color, iterations=100, seed=3)
+
+        assert first.play(board) == second.play(board)
+        assert first.rollout_engine.playouts == 100
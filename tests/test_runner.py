@@ -2,9 +2,12 @@ import pytest
 from unittest.mock import Mock, patch
 from runner import Runner
 from game.board import Board
+from game.bitboard import BitBoard
 from game.enums import Color
 from players.random_player import RandomPlayer
 from players.minimax_player import MiniMaxPlayer
+from players.minimax_optimized_player import OptimizedMiniMaxPlayer
+from players.mcts_player import MCTSPlayer
 
 
 class TestRunner:
@@ -102,4 +105,31 @@ class TestRunner:
             
             # Reset player scores for next game
             player1.score = 2
-            player2.score = 2
\ No newline at end of file
+            player2.score = 2
+
+    def test_play_game_with_pondering(self):
+        """Test that players ponder on each other's time and stop at the end of the game."""
+        player1 = OptimizedMiniMaxPlayer(Color.BLACK, ['square_heuristic'], max_depth=1, transposition_table_mb=1)
+        player2 = RandomPlayer(Color.WHITE)
+
+        with patch.object(player1, 'stop_pondering', wraps=player1.stop_pondering) as stop_pondering:
+            try:
+                winner = Runner.play_game([player1, player2], ponder=True, board_type=BitBoard)
+            finally:
+                player1.close()
+
+        assert winner in [player1, player2, None]
+        assert stop_pondering.call_count > 1
+        assert player1.ponder_future is None
+
+    def test_play_game_with_mcts_pondering(self):
+        """Test that an MCTS player grows its tree on the opponent's time and stops at the end of the game."""
+        player1 = MCTSPlayer(Color.BLACK, iterations=20, seed=0)
+        player2 = RandomPlayer(Color.WHITE)
+
+        with patch.object(player1, 'stop_pondering', wraps=player1.stop_pondering) as stop_pondering:
+            winner = Runner.play_game([player1, player2], ponder=True, board_type=BitBoard)
+
+        assert winner in [player1, player2, None]
+        assert stop_pondering.call_count > 1
+        assert player1.ponder_thread is None
@@ -0,0 +1,51 @@
+import pytest
+from game.enums import Color
+from game.point import Point
+from players.search import MoveOrdering
+
+
+class TestMoveOrdering:
+    """Test cases for the MoveOrdering class."""
+
+    def test_static_order_without_history(self):
+        """Test that moves keep their static order when nothing has been learned."""
+        ordering = MoveOrdering()
+        moves = [Point(0, 0), Point(0, 3), Point(2, 3)]
+
+        assert ordering.order(list(moves), Color.BLACK, 40) == moves
+
+    def test_history_and_killers(self):
+        """Test that cutoff moves are tried first, killers ahead of history."""
+        ordering = MoveOrdering()
+        moves = [Point(0, 0), Point(0, 3), Point(2, 3), Point(5, 4)]
+
+        ordering.record_cutoff(Point(2, 3), Color.BLACK, 30, depth=3)
+        assert ordering.order(list(moves), Color.BLACK, 40) == [Point(2, 3), Point(0, 0), Point(0, 3), Point(5, 4)]
+        # History is kept per color
+        assert ordering.order(list(moves), Color.WHITE, 40) == moves
+
+        ordering.record_cutoff(Point(5, 4), Color.BLACK, 40, depth=1)
+        assert ordering.order(list(moves), Color.BLACK, 40) == [Point(5, 4), Point(2, 3), Point(0, 0), Point(0, 3)]
+        assert ordering.order(list(moves), Color.BLACK, 40, first_move=Point(0, 3))[:2] == [Point(0, 3), Point(5, 4)]
+
+    def test_killers_per_ply(self):
+        """Test that only the most recent killers of a stage are kept."""
+        ordering = MoveOrdering()
+        for move in (Point(1, 1), Point(2, 2), Point(3, 3)):
+            ordering.record_cutoff(move, Color.BLACK, 20, depth=1)
+
+        assert ordering.killers[20] == [Point(3, 3), Point(2, 2)]
+        assert ordering.killers[21] == []
+
+    def test_age_and_clear(self):
+        """Test that aging halves the history and clearing forgets everything."""
+        ordering = MoveOrdering()
+        ordering.record_cutoff(Point(2, 3), Color.WHITE, 30, depth=4)
+        square = 2 * 8 + 3
+
+        ordering.age()
+        assert ordering.history[Color.WHITE][square] == 8
+
+        ordering.clear()
+        assert ordering.history[Color.WHITE][square] == 0
+        assert ordering.killers[30] == []
@@ -0,0 +1,64 @@
+import pytest
+from game.point import Point
+from players.transposition_table import Bound, TranspositionTable
+
+
+class TestTranspositionTable:
+    """Test cases for the TranspositionTable class."""
+
+    def test_size_follows_memory_cap(self):
+        """Test that the number of buckets scales with the memory cap."""
+        small = TranspositionTable(max_memory_mb=1)
+        large = TranspositionTable(max_memory_mb=4)
+
+        assert small.size > 0
+        assert large.size == pytest.approx(4 * small.size, rel=0.01)
+        assert len(small) == 0
+
+    def test_store_and_probe(self):
+        """Test storing and probing an entry."""
+        table = TranspositionTable(max_memory_mb=1)
+
+        assert table.probe(1234) is None
+        table.store(1234, 3, 12, Bound.EXACT, Point(2, 3))
+
+        entry = table.probe(1234)
+        assert entry.depth == 3
+        assert entry.score == 12
+        assert entry.bound == Bound.EXACT
+        assert entry.move == Point(2, 3)
+        assert table.stats()['probes'] == 2
+        assert table.stats()['hits'] == 1
+        assert table.stats()['stores'] == 1
+
+    def test_depth_preferred_replacement(self):
+        """Test that shallow results go to the always-replace slot of a bucket."""
+        table = TranspositionTable(max_memory_mb=1)
+        deep_key, shallow_key, newer_key = 5, 5 + table.size, 5 + 2 * table.size
+
+        table.store(deep_key, 6, 1, Bound.EXACT, None)
+        table.store(shallow_key, 2, 2, Bound.LOWER, None)
+        assert table.probe(deep_key).score == 1
+        assert table.probe(shallow_key).score == 2
+
+        # The always-replace slot takes the newest shallow entry
+        table.store(newer_key, 1, 3, Bound.UPPER, None)
+        assert table.probe(shallow_key) is None
+        assert table.probe(newer_key).score == 3
+        assert table.probe(deep_key).score == 1
+
+        # A deeper search of another position claims the depth-preferred slot
+        table.store(shallow_key, 7, 4, Bound.EXACT, None)
+        assert table.probe(deep_key) is None
+        assert table.probe(shallow_key).score == 4
+        assert table.stats()['overwrites'] == 2
+
+    def test_clear(self):
+        """Test clearing the table."""
+        table = TranspositionTable(max_memory_mb=1)
+        table.store(42, 1, 0, Bound.EXACT, None)
+        table.clear()
+
+        assert table.probe(42) is None
+        assert len(table) == 0
+        assert table.stats()['stores'] == 0